@@ -0,0 +1,215 @@
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import logging
+import os
+import resource
+import sys
+import time
+
+from launcher import Launcher
+from prpl.apis.hl.factory.string_pool import SHARED_STRING_POOL
+from prpl.apis.hl.spec.builder import templates
+from prpl.apis.hl.spec.registry import WRITER as HLAPI_WRITER
+from prpl.apis.hl.spec.registry import registry as hlapi_registry
+
+
+def detect_input_format(spec):
+    """Guesses the input format of a specification.
+
+    Args:
+        spec (str): Specification file or folder.
+
+    Returns:
+        str: Input format ("xls", "json" or "snapshot").
+
+    """
+
+    if os.path.isdir(spec):
+        return "json"
+    if spec.endswith('.hlapi'):
+        return "snapshot"
+
+    return "xls"
+
+
+def _reset_peak_rss():
+    """Resets the peak resident set size of the current process, where supported (Linux).
+
+    Returns:
+        bool: Whether the peak has been reset.
+
+    """
+
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _get_peak_rss():
+    """Returns the peak resident set size of the current process, in kB."""
+
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+
+    # Lifetime peak of the process (bytes on macOS, kB elsewhere).
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def get_job_name(spec):
+    """Returns the name of the job converting a specification.
+
+    Args:
+        spec (str): Specification file or folder.
+
+    Returns:
+        str: Job name (e.g.: '3.8.2.7RC.xlsx').
+
+    """
+
+    return os.path.basename(os.path.normpath(spec))
+
+
+def run_job(spec, output_formats, log_level=logging.INFO, log_folder='specs/generated/logs',
+            output_folder='specs/generated/batch'):
+    """Converts a single specification (runs inside a worker process).
+
+    Jobs run by the same worker process share a string pool, so that the strings common to the versions it converts
+    (e.g.: names, types and descriptions) are only allocated once.
+
+    Every job writes its outputs to its own folder, named after the job, since writers replace their output (e.g.:
+    the JSON Schema writer removes its version folder) and several specifications may have the same version.
+
+    Args:
+        spec (str): Specification file or folder.
+        output_formats (list<str>): Output formats to be built.
+        log_level (int): Logging level.
+        log_folder (str): Folder for the log file of the job.
+        output_folder (str): Folder of the job output folders.
+
+    Returns:
+        dict: Job name, status, wall time, CPU time and peak RSS (kB) of the job, plus the launcher stage timings.
+
+    """
+
+    name = get_job_name(spec)
+    os.makedirs(log_folder, exist_ok=True)
+
+    exact_rss = _reset_peak_rss()
+    wall, cpu = time.perf_counter(), time.process_time()
+    error = None
+
+    launcher = None
+    try:
+        launcher = Launcher(spec, input_format=detect_input_format(spec), output_format=output_formats,
+                            log_level=log_level, log_file=os.path.join(log_folder, '{}.log'.format(name)),
+                            string_pool=SHARED_STRING_POOL, output_folder=os.path.join(output_folder, name))
+        launcher.run()
+    except Exception as e:
+        error = '{}: {}'.format(type(e).__name__, e)
+    finally:
+        if launcher is not None:
+            launcher.log.stop()
+
+    return {
+        'name': name,
+        'error': error,
+        'wall': time.perf_counter() - wall,
+        'cpu': time.process_time() - cpu,
+        'peak_rss': _get_peak_rss(),
+        'exact_rss': exact_rss,
+        'timings': dict(launcher.timings) if launcher is not None else {},
+    }
+
+
+def run_batch(specs, output_formats, jobs=None, log_level=logging.INFO, log_folder='specs/generated/logs',
+              output_folder='specs/generated/batch'):
+    """Converts many specifications, one job per specification, on a pool of worker processes.
+
+    Templates are loaded once by the parent process. Forked workers inherit them, and every other worker loads
+    them once and reuses them for all of its jobs.
+
+    Args:
+        specs (list<str>): Specification files or folders.
+        output_formats (list<str>): Output formats to be built for every specification.
+        jobs (int): Number of worker processes. Defaults to the number of CPUs.
+        log_level (int): Logging level.
+        log_folder (str): Folder for the log files (one per job).
+        output_folder (str): Folder of the job output folders (one per job, see 'run_job').
+
+    Returns:
+        list<dict>: Job results (see 'run_job'), in the order of 'specs'.
+
+    """
+
+    names = [get_job_name(spec) for spec in specs]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if len(duplicates) > 0:
+        raise Exception('Several specifications share the job names {}.'.format(', '.join(duplicates)))
+
+    templates.preload()
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=templates.preload) as executor:
+        futures = [executor.submit(run_job, spec, output_formats, log_level, log_folder, output_folder)
+                   for spec in specs]
+        return [future.result() for future in futures]
+
+
+def get_summary(results):
+    """Formats the job results as a table.
+
+    Args:
+        results (list<dict>): Job results.
+
+    Returns:
+        str: Summary table.
+
+    """
+
+    width = max([len('Job')] + [len(r['name']) for r in results])
+    row = '{:<' + str(width) + '} {:>9} {:>9} {:>13}  {}'
+
+    lines = [row.format('Job', 'Wall (s)', 'CPU (s)', 'Peak RSS (MB)', 'Status')]
+    for r in results:
+        rss = '{:.1f}{}'.format(r['peak_rss'] / 1024, '' if r['exact_rss'] else '*')
+        lines.append(row.format(r['name'], '{:.3f}'.format(r['wall']), '{:.3f}'.format(r['cpu']), rss,
+                                r['error'] or 'OK'))
+
+    if not all(r['exact_rss'] for r in results):
+        lines.append('* Lifetime peak of the worker process, which may include previous jobs.')
+
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='prpl HL-API batch conversion.')
+    parser.add_argument('specs', nargs='+',
+                        help='Specification files or folders (e.g.: specs/input/*.xlsx specs/generated/json/v*/).')
+    parser.add_argument('--output', default=['json', 'word', 'xls'], nargs='+',
+                        choices=hlapi_registry.get_formats(HLAPI_WRITER),
+                        help='Output formats built for every specification.')
+    parser.add_argument('--jobs', type=int, default=None, help='Number of worker processes (defaults to CPUs).')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Logging level.')
+    parser.add_argument('--log-folder', default='specs/generated/logs', help='Folder for the job log files.')
+    parser.add_argument('--output-folder', default='specs/generated/batch',
+                        help='Folder of the job output folders (one per job, named after the specification).')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = run_batch(args.specs, args.output, args.jobs, getattr(logging, args.log_level), args.log_folder,
+                        args.output_folder)
+
+    print(get_summary(results))
+    print('Total wall time: {:.3f}s'.format(time.perf_counter() - started))
+
+    sys.exit(1 if any(r['error'] for r in results) else 0)
@@ -0,0 +1,304 @@
+"""End-to-end benchmark suite of the readers and writers, on synthetic specifications.
+
+Times the Excel -> model, JSON -> model, model -> JSON, model -> Excel and model -> Word paths, plus the
+Excel -> JSON -> Excel round trip, at several scales (see 'benchmarks.spec_generator'). Every run is appended to a
+JSON history file, and compared with the stored baseline: the suite fails when the median time of a path grows past
+the threshold, or when a path which used to succeed fails.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_e2e [--scale 1 10] [--path excel-to-model ...] [--repeat 3] [--threshold 0.25]
+        [--history benchmarks/results/history.json] [--update-baseline]
+
+"""
+
+from collections import OrderedDict
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.spec_generator import SpecGenerator
+from prpl.apis.hl.spec.builder import ExcelWriter as HLAPIExcelWriter
+from prpl.apis.hl.spec.builder import JSONSchemaWriter as HLAPIJSONSchemaWriter
+from prpl.apis.hl.spec.builder import WordWriter as HLAPIWordWriter
+from prpl.apis.hl.spec.parser import ExcelReader as HLAPIExcelParser
+from prpl.apis.hl.spec.parser import JSONReader as HLAPIJSONParser
+
+DEFAULT_HISTORY = 'benchmarks/results/history.json'
+# Synthetic specifications are generated once and kept outside of the source tree.
+DEFAULT_FIXTURES = os.path.join(tempfile.gettempdir(), 'hlapi-bench-fixtures')
+
+
+class Fixture:
+    """Synthetic specification of a given scale, in both formats, plus a scratch folder for the outputs."""
+
+    def __init__(self, folder, scale, regenerate=False):
+        """Generates the specification files, unless they already exist.
+
+        Args:
+            folder (str): Fixtures folder.
+            scale (int): Object count multiplier.
+            regenerate (bool): Whether to generate the files even if they exist.
+
+        """
+
+        self.scale = scale
+        self.generator = SpecGenerator.scaled(scale)
+
+        # Readers expect paths relative to the working directory.
+        name = 'synthetic-x{}'.format(scale)
+        self.excel = os.path.relpath(os.path.join(folder, '{}.xlsx'.format(name)))
+        self.json = os.path.relpath(os.path.join(folder, name))
+
+        if regenerate or not os.path.isfile(self.excel):
+            self.generator.write_excel(self.excel)
+        if regenerate or not os.path.isfile(os.path.join(self.json, 'api.json')):
+            self.generator.write_json(self.json)
+
+        self.output = tempfile.mkdtemp(prefix='hlapi-bench-')
+        self._api = None
+
+    @property
+    def api(self):
+        """prpl.apis.hl.com.API: Parsed API, for the paths starting from the model (parsed once, not timed)."""
+
+        if self._api is None:
+            self._api = HLAPIJSONParser(self.json).parse()
+
+        return self._api
+
+    def get_output(self, name):
+        """Returns a path in the scratch folder, relative to the working directory."""
+
+        return os.path.relpath(os.path.join(self.output, name))
+
+    def close(self):
+        shutil.rmtree(self.output, ignore_errors=True)
+
+
+def excel_to_model(fixture):
+    HLAPIExcelParser(fixture.excel).parse()
+
+
+def json_to_model(fixture):
+    HLAPIJSONParser(fixture.json).parse()
+
+
+def model_to_json(fixture):
+    HLAPIJSONSchemaWriter(fixture.api, fixture.get_output('json') + '/').build()
+
+
+def model_to_excel(fixture):
+    HLAPIExcelWriter(fixture.api, fixture.get_output('.')).build()
+
+
+def model_to_word(fixture):
+    HLAPIWordWriter(fixture.api, fixture.get_output('spec.docx')).build()
+
+
+def excel_json_excel(fixture):
+    api = HLAPIExcelParser(fixture.excel).parse()
+    folder = fixture.get_output('round-trip')
+    HLAPIJSONSchemaWriter(api, folder + '/').build()
+    HLAPIExcelWriter(HLAPIJSONParser(folder).parse(), folder).build()
+
+
+# Benchmarked paths (the model is parsed beforehand for the paths starting from it).
+PATHS = OrderedDict([
+    ('excel-to-model', excel_to_model),
+    ('json-to-model', json_to_model),
+    ('model-to-json', model_to_json),
+    ('model-to-excel', model_to_excel),
+    ('model-to-word', model_to_word),
+    ('excel-json-excel', excel_json_excel),
+])
+
+
+def measure(path, fixture, repeat):
+    """Times a path.
+
+    Args:
+        path (str): Path name.
+        fixture (Fixture): Specification to be converted.
+        repeat (int): Number of runs.
+
+    Returns:
+        dict: Median and minimum wall time, median CPU time (in seconds) and error, if the path failed.
+
+    """
+
+    walls, cpus = [], []
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            PATHS[path](fixture)
+        except Exception as e:
+            return {'median': None, 'min': None, 'cpu': None, 'error': '{}: {}'.format(type(e).__name__, e)}
+
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    return {'median': statistics.median(walls), 'min': min(walls), 'cpu': statistics.median(cpus), 'error': None}
+
+
+def get_key(path, scale):
+    return '{}@x{}'.format(path, scale)
+
+
+def compare(baseline, results, threshold, min_delta=0.0):
+    """Compares results with the baseline.
+
+    Args:
+        baseline (dict): Baseline results, indexed by path and scale key.
+        results (dict): Results of this run, indexed by path and scale key.
+        threshold (float): Allowed relative increase of the median time (e.g.: 0.25 for 25%).
+        min_delta (float): Increases smaller than this (in seconds) are considered noise.
+
+    Returns:
+        list<str>: Description of each regression.
+
+    """
+
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+
+        if result['error'] is not None:
+            if base['error'] is None:
+                regressions.append('{} now fails ({}).'.format(key, result['error']))
+        elif base['error'] is None:
+            delta = result['median'] - base['median']
+            if delta > base['median'] * threshold and delta > min_delta:
+                regressions.append('{} is {:.1%} slower ({:.3f}s, baseline {:.3f}s).'.format(
+                    key, delta / base['median'], result['median'], base['median']))
+
+    return regressions
+
+
+def load_history(file):
+    """Loads the history file, or an empty history if it does not exist."""
+
+    if not os.path.isfile(file):
+        return {'baseline': {}, 'runs': []}
+
+    with open(file) as f:
+        return json.load(f)
+
+
+def save_history(file, history):
+    folder = os.path.dirname(file)
+    if folder != '':
+        os.makedirs(folder, exist_ok=True)
+
+    with open(file, 'w') as f:
+        json.dump(history, f, indent=2)
+
+
+def get_commit():
+    """Returns the current git commit, if any."""
+
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales, paths, repeat, fixtures_folder=DEFAULT_FIXTURES, regenerate=False):
+    """Runs the benchmark suite.
+
+    Args:
+        scales (list<int>): Object count multipliers.
+        paths (list<str>): Path names.
+        repeat (int): Number of runs of each path.
+        fixtures_folder (str): Folder of the synthetic specifications.
+        regenerate (bool): Whether to generate the specifications even if they exist.
+
+    Returns:
+        OrderedDict: Results, indexed by path and scale key.
+
+    """
+
+    results = OrderedDict()
+    for scale in scales:
+        fixture = Fixture(fixtures_folder, scale, regenerate)
+        try:
+            for path in paths:
+                results[get_key(path, scale)] = measure(path, fixture, repeat)
+        finally:
+            fixture.close()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end benchmark suite.')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10], help='Object count multipliers.')
+    parser.add_argument('--path', nargs='+', default=list(PATHS), choices=list(PATHS), help='Paths to be timed.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs of each path (the median is kept).')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative slowdown against the baseline (default: 0.25).')
+    parser.add_argument('--min-delta', type=float, default=0.01,
+                        help='Slowdowns below this many seconds are ignored as noise.')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON history file.')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='Folder of the synthetic specifications.')
+    parser.add_argument('--regenerate', action='store_true', help='Generate the specifications again.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store the results of this run as the new baseline.')
+    args = parser.parse_args()
+
+    # Keep the readers and writers from logging to the console.
+    logging.disable(logging.INFO)
+
+    results = run(args.scale, args.path, args.repeat, args.fixtures, args.regenerate)
+
+    history = load_history(args.history)
+    baseline = history['baseline']
+    regressions = compare(baseline, results, args.threshold, args.min_delta)
+
+    print('{:<26} {:>10} {:>10} {:>10} {:>10} {:>8}  {}'.format(
+        'Path', 'median (s)', 'min (s)', 'CPU (s)', 'base (s)', 'change', 'Status'))
+    for key, result in results.items():
+        base = baseline.get(key, {}).get('median')
+        if result['error'] is not None:
+            print('{:<26} {:>10} {:>10} {:>10} {:>10} {:>8}  {}'.format(
+                key, '-', '-', '-', '-' if base is None else '{:.3f}'.format(base), '-', result['error']))
+            continue
+
+        change = '-' if base is None else '{:+.1%}'.format(result['median'] / base - 1)
+        print('{:<26} {:>10.3f} {:>10.3f} {:>10.3f} {:>10} {:>8}  OK'.format(
+            key, result['median'], result['min'], result['cpu'], '-' if base is None else '{:.3f}'.format(base),
+            change))
+
+    history['runs'].append(OrderedDict([
+        ('timestamp', time.strftime('%Y-%m-%dT%H:%M:%S')),
+        ('commit', get_commit()),
+        ('python', platform.python_version()),
+        ('platform', platform.platform()),
+        ('repeat', args.repeat),
+        ('results', results),
+    ]))
+
+    # Paths measured for the first time become part of the baseline.
+    for key, result in results.items():
+        if args.update_baseline or key not in baseline:
+            baseline[key] = result
+
+    save_history(args.history, history)
+
+    if len(regressions) > 0 and not args.update_baseline:
+        print('\nRegressions (threshold {:.0%}):\n{}'.format(args.threshold, '\n'.join(regressions)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
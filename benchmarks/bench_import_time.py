@@ -0,0 +1,87 @@
+"""Import-time benchmark of the launcher, readers and writers.
+
+Every scenario is timed in a fresh interpreter, since imports are cached by the process, and reports which heavy
+third-party backends (e.g.: openpyxl for Excel, python-docx for Word) ended up loaded.
+
+Usage:
+    python -m benchmarks.bench_import_time [--repeat 10] [--scenario launcher json-reader ...]
+
+"""
+
+from collections import OrderedDict
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Statement imported by each scenario.
+SCENARIOS = OrderedDict([
+    ('launcher', 'import launcher'),
+    ('snapshot-reader', 'from prpl.apis.hl.spec.parser import SnapshotReader'),
+    ('json-reader', 'from prpl.apis.hl.spec.parser import JSONReader'),
+    ('excel-reader', 'from prpl.apis.hl.spec.parser import ExcelReader'),
+    ('json-writer', 'from prpl.apis.hl.spec.builder import JSONSchemaWriter'),
+    ('excel-writer', 'from prpl.apis.hl.spec.builder import ExcelWriter'),
+    ('word-writer', 'from prpl.apis.hl.spec.builder import WordWriter'),
+])
+
+# Third-party backends reported as loaded (or not) by each scenario.
+BACKENDS = ['openpyxl', 'docx', 'pandas']
+
+_PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, [m for m in {backends!r} if m in sys.modules]]))
+'''
+
+
+def measure(statement, cwd='.'):
+    """Imports a statement in a fresh interpreter.
+
+    Args:
+        statement (str): Import statement.
+        cwd (str): Working directory of the interpreter (the repository root).
+
+    Returns:
+        tuple: Import time (s) and loaded backends.
+
+    """
+
+    output = subprocess.check_output([sys.executable, '-c', _PROBE.format(statement=statement, backends=BACKENDS)],
+                                     cwd=cwd)
+    elapsed, loaded = json.loads(output.decode().strip().splitlines()[-1])
+
+    return elapsed, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time benchmark.')
+    parser.add_argument('--repeat', type=int, default=10, help='Interpreters started per scenario (median is kept).')
+    parser.add_argument('--scenario', nargs='*', default=list(SCENARIOS), choices=list(SCENARIOS),
+                        help='Scenarios to be measured.')
+    args = parser.parse_args()
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+    # Warm up the file system cache, so that the first scenario is not penalized.
+    measure(SCENARIOS['launcher'], root)
+
+    print('{:<18} {:>12} {:>12}  {}'.format('Scenario', 'median (ms)', 'min (ms)', 'Backends loaded'))
+
+    for name in args.scenario:
+        samples = []
+        loaded = []
+        for _ in range(args.repeat):
+            elapsed, loaded = measure(SCENARIOS[name], root)
+            samples.append(elapsed * 1e3)
+
+        print('{:<18} {:>12.1f} {:>12.1f}  {}'.format(name, statistics.median(samples), min(samples),
+                                                      ', '.join(loaded) or '-'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,378 @@
+"""Memory footprint benchmarks of the parsed API graph and of the writers, on synthetic specifications.
+
+For each scale (see 'benchmarks.spec_generator'), measures:
+    * the resident size of a linked 'API' (traced by 'tracemalloc' and sampled from the RSS), broken down into bytes
+      per 'Field', 'Procedure', 'Object', 'Event' and 'Instance' by walking the model graph;
+    * the peak memory of 'JSONSchemaWriter.build', 'ExcelWriter.build' and 'WordWriter.build', again both traced and
+      sampled from the RSS.
+
+Every measurement runs in a fresh process, so that memory freed (but not returned to the system) by a previous
+measurement does not hide the RSS growth of the next one. Runs are appended to a JSON history file, which tracks how
+the footprint scales with the specification size over time.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_memory [--scale 1 10 100] [--target model json ...] [--reader json]
+        [--history benchmarks/results/memory.json]
+
+"""
+
+from collections import OrderedDict
+import argparse
+import gc
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from benchmarks.bench_e2e import DEFAULT_FIXTURES, Fixture, get_commit, get_key, load_history, save_history
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import FieldStore as HLAPIFieldStore
+from prpl.apis.hl.com import Instance as HLAPIInstance
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com.field_store import FieldRange as HLAPIFieldRange
+from prpl.apis.hl.com.field_store import FieldView as HLAPIFieldView
+from prpl.apis.hl.factory import StringPool as HLAPIStringPool
+
+DEFAULT_HISTORY = 'benchmarks/results/memory.json'
+
+# Model types the footprint is broken down into (anything else, e.g.: versions, is reported as 'Other').
+MODEL_TYPES = OrderedDict([
+    (HLAPIObject, 'Object'),
+    (HLAPIProcedure, 'Procedure'),
+    (HLAPIField, 'Field'),
+    (HLAPIFieldView, 'Field'),
+    (HLAPIFieldRange, 'Field'),
+    (HLAPIFieldStore, 'Field'),
+    (HLAPIEvent, 'Event'),
+    (HLAPIInstance, 'Instance'),
+])
+
+CATEGORIES = ['Object', 'Procedure', 'Field', 'Event', 'Instance', 'Other']
+
+
+class RSSSampler:
+    """Samples the resident set size of the current process on a background thread, and keeps its peak.
+
+    Example:
+        with RSSSampler() as sampler:
+            build()
+
+        growth = sampler.peak - sampler.baseline
+
+    """
+
+    def __init__(self, interval=0.005):
+        """Creates a new sampler.
+
+        Args:
+            interval (float): Sampling interval, in seconds.
+
+        """
+
+        self.interval = interval
+        self.baseline = None
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.baseline = self.peak = get_rss()
+        if self.baseline is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._sample()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        rss = get_rss()
+        if rss is not None and rss > self.peak:
+            self.peak = rss
+
+    def get_growth(self):
+        """Returns the peak RSS growth since the sampler was entered, in bytes (None if the RSS is unavailable)."""
+
+        return None if self.baseline is None else self.peak - self.baseline
+
+
+def get_rss():
+    """Returns the current resident set size of the process, in bytes (None where '/proc' is unavailable)."""
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+def get_footprint(api):
+    """Walks the object graph of an API, and attributes the size of every reachable object to a model type.
+
+    Containers, strings and other values are attributed to the nearest model object holding them (e.g.: the name of a
+    field to 'Field', the field list of a procedure to 'Procedure'). Values shared by several owners (e.g.: strings
+    interned by the factories' string pool) are only counted once, for the first owner reached.
+
+    Args:
+        api (prpl.apis.hl.com.API): API to be measured.
+
+    Returns:
+        dict: Bytes ('bytes') and instance counts ('count') per model type.
+
+    """
+
+    totals = OrderedDict((c, {'bytes': 0, 'count': 0}) for c in CATEGORIES)
+    seen = set()
+    stack = [(api, 'Other')]
+
+    while len(stack) > 0:
+        value, category = stack.pop()
+        if id(value) in seen or isinstance(value, type):
+            continue
+        seen.add(id(value))
+
+        model_type = MODEL_TYPES.get(type(value))
+        if model_type is not None:
+            category = model_type
+            if isinstance(value, HLAPIFieldStore):
+                totals[category]['count'] += len(value)
+            elif not isinstance(value, (HLAPIFieldView, HLAPIFieldRange)):
+                totals[category]['count'] += 1
+
+        totals[category]['bytes'] += sys.getsizeof(value)
+
+        if isinstance(value, dict):
+            children = [v for item in value.items() for v in item]
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            children = value
+        else:
+            children = list(getattr(value, '__dict__', {}).values())
+            children.append(getattr(value, '__dict__', None))
+            children.extend(getattr(value, s) for s in getattr(type(value), '__slots__', ()) if hasattr(value, s))
+
+        stack.extend((c, category) for c in children if c is not None)
+
+    return totals
+
+
+def parse(fixture, reader):
+    """Parses a fixture, with the specified reader ('excel' or 'json').
+
+    Every parse uses a fresh string pool, so that the strings of the API are counted by each measurement, instead of
+    being shared with a previous parse.
+
+    """
+
+    if reader == 'excel':
+        from prpl.apis.hl.spec.parser import ExcelReader as HLAPIExcelParser
+        return HLAPIExcelParser(fixture['excel'], string_pool=HLAPIStringPool()).parse()
+
+    from prpl.apis.hl.spec.parser import JSONReader as HLAPIJSONParser
+    return HLAPIJSONParser(fixture['json'], string_pool=HLAPIStringPool()).parse()
+
+
+def _build_json(api, folder):
+    from prpl.apis.hl.spec.builder import JSONSchemaWriter as HLAPIJSONSchemaWriter
+    HLAPIJSONSchemaWriter(api, os.path.relpath(os.path.join(folder, 'json')) + '/').build()
+
+
+def _build_excel(api, folder):
+    from prpl.apis.hl.spec.builder import ExcelWriter as HLAPIExcelWriter
+    HLAPIExcelWriter(api, os.path.relpath(folder)).build()
+
+
+def _build_word(api, folder):
+    from prpl.apis.hl.spec.builder import WordWriter as HLAPIWordWriter
+    HLAPIWordWriter(api, os.path.relpath(os.path.join(folder, 'spec.docx'))).build()
+
+
+# Measured writers.
+WRITERS = OrderedDict([
+    ('json', _build_json),
+    ('excel', _build_excel),
+    ('word', _build_word),
+])
+
+# Measurement targets: the parsed model (optionally with its fields packed into a 'FieldStore') and each writer.
+TARGETS = ['model', 'model-packed'] + list(WRITERS)
+
+
+def _measure_model(fixture, reader, packed):
+    # Sampled pass first, before the traced pass churns the allocator.
+    gc.collect()
+    with RSSSampler() as sampler:
+        api = parse(fixture, reader)
+        store = HLAPIFieldStore.pack(api) if packed else None
+        gc.collect()
+        rss = get_rss()
+
+    del api, store
+
+    # Traced pass: memory retained by the API once the reader is gone.
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    api = parse(fixture, reader)
+    store = HLAPIFieldStore.pack(api) if packed else None
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    footprint = get_footprint(api)
+
+    return {
+        'traced': retained - before,
+        'traced_peak': peak - before,
+        'rss': None if rss is None else rss - sampler.baseline,
+        'rss_peak': sampler.get_growth(),
+        'footprint': footprint,
+    }
+
+
+def _measure_writer(fixture, reader, writer):
+    api = parse(fixture, reader)
+    folder = tempfile.mkdtemp(prefix='hlapi-bench-')
+    try:
+        # Sampled pass first, before the traced pass churns the allocator.
+        gc.collect()
+        with RSSSampler() as sampler:
+            WRITERS[writer](api, folder)
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        WRITERS[writer](api, folder)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    return {'traced_peak': peak - before, 'rss_peak': sampler.get_growth()}
+
+
+def measure(target, fixture, reader='json'):
+    """Measures a target in the current process.
+
+    Args:
+        target (str): Target name (see 'TARGETS').
+        fixture (dict): Paths of the Excel ('excel') and JSON ('json') specifications.
+        reader (str): Reader used to build the model, 'excel' or 'json'.
+
+    Returns:
+        dict: Measurements, in bytes, and error, if the target failed.
+
+    """
+
+    logging.disable(logging.INFO)
+
+    try:
+        if target in WRITERS:
+            result = _measure_writer(fixture, reader, target)
+        else:
+            result = _measure_model(fixture, reader, target == 'model-packed')
+    except Exception as e:
+        return {'error': '{}: {}'.format(type(e).__name__, e)}
+
+    result['error'] = None
+    return result
+
+
+def run(scales, targets, reader='json', fixtures_folder=DEFAULT_FIXTURES, regenerate=False):
+    """Runs the memory benchmarks, each measurement in a fresh process.
+
+    Args:
+        scales (list<int>): Object count multipliers.
+        targets (list<str>): Target names (see 'TARGETS').
+        reader (str): Reader used to build the model, 'excel' or 'json'.
+        fixtures_folder (str): Folder of the synthetic specifications.
+        regenerate (bool): Whether to generate the specifications even if they exist.
+
+    Returns:
+        OrderedDict: Results, indexed by target and scale key.
+
+    """
+
+    context = multiprocessing.get_context('spawn')
+
+    results = OrderedDict()
+    for scale in scales:
+        fixture = Fixture(fixtures_folder, scale, regenerate)
+        fixture.close()
+        paths = {'excel': fixture.excel, 'json': fixture.json}
+
+        for target in targets:
+            with context.Pool(1) as pool:
+                results[get_key(target, scale)] = pool.apply(measure, (target, paths, reader))
+
+    return results
+
+
+def _format_size(size):
+    if size is None:
+        return '-'
+
+    return '{:.2f}'.format(size / (1024 * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Memory footprint benchmarks.')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10], help='Object count multipliers.')
+    parser.add_argument('--target', nargs='+', default=TARGETS, choices=TARGETS, help='Targets to be measured.')
+    parser.add_argument('--reader', default='json', choices=['excel', 'json'], help='Reader used to build the model.')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON history file.')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='Folder of the synthetic specifications.')
+    parser.add_argument('--regenerate', action='store_true', help='Generate the specifications again.')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = run(args.scale, args.target, args.reader, args.fixtures, args.regenerate)
+
+    print('{:<22} {:>11} {:>11} {:>11} {:>11}  {}'.format(
+        'Target', 'traced (MB)', 'peak (MB)', 'RSS (MB)', 'RSS pk (MB)', 'Status'))
+    for key, result in results.items():
+        if result['error'] is not None:
+            print('{:<22} {:>11} {:>11} {:>11} {:>11}  {}'.format(key, '-', '-', '-', '-', result['error']))
+            continue
+
+        print('{:<22} {:>11} {:>11} {:>11} {:>11}  OK'.format(
+            key, _format_size(result.get('traced')), _format_size(result['traced_peak']),
+            _format_size(result.get('rss')), _format_size(result['rss_peak'])))
+
+    print('\n{:<22} {}'.format('Bytes per', ' '.join('{:>10}'.format(c) for c in CATEGORIES[:-1])))
+    for key, result in results.items():
+        if result['error'] is None and 'footprint' in result:
+            print('{:<22} {}'.format(key, ' '.join(
+                '{:>10}'.format(round(f['bytes'] / f['count']) if f['count'] > 0 else '-')
+                for f in list(result['footprint'].values())[:-1])))
+
+    history = load_history(args.history)
+    history['runs'].append(OrderedDict([
+        ('timestamp', time.strftime('%Y-%m-%dT%H:%M:%S')),
+        ('commit', get_commit()),
+        ('python', platform.python_version()),
+        ('platform', platform.platform()),
+        ('reader', args.reader),
+        ('results', results),
+    ]))
+    save_history(args.history, history)
+
+
+if __name__ == '__main__':
+    main()
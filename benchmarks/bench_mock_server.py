@@ -0,0 +1,154 @@
+"""Load benchmark of the ubus mock server ('prpl.apis.hl.spec.mock_server').
+
+Serves a specification from a separate process, then opens many concurrent connections which call every procedure
+of the specification in turn (instances of templated objects are called as '<object>.1', with arguments made up from
+the declared input fields). Reports the throughput, the round-trip latencies seen by the clients and the latencies measured by the
+server itself.
+
+Usage:
+    python -m benchmarks.bench_mock_server [--spec tests/test-json] [--input json] [--connections 1000]
+                                            [--requests 20]
+
+"""
+
+from collections import Counter
+import argparse
+import asyncio
+import json
+import logging
+import math
+import multiprocessing
+import os
+import re
+import resource
+import tempfile
+import time
+
+from prpl.apis.hl.spec.builder.validator_writer import REQUEST, get_field_tree
+from prpl.apis.hl.spec.mock_server import MockServer, get_example
+from prpl.apis.hl.spec.registry import READER, registry
+
+
+def parse(spec, input_format):
+    return registry.select(READER, input_format).load()(spec).parse()
+
+
+def serve(spec, input_format, path, connection):
+    """Serves a specification until the parent process asks to stop, then sends back the server latencies."""
+
+    logging.disable(logging.INFO)
+    server = MockServer(parse(spec, input_format), path)
+
+    async def run():
+        await server.start()
+
+        stopped = asyncio.Event()
+        asyncio.get_running_loop().add_reader(connection.fileno(), stopped.set)
+        connection.send('ready')
+
+        await stopped.wait()
+        await server.stop()
+
+    asyncio.run(run())
+    connection.recv()
+    connection.send((server.requests, list(server.get_latency_percentiles().values())))
+
+
+def get_calls(api):
+    """Lists a 'call' request for every procedure of an API.
+
+    Args:
+        api (prpl.apis.hl.com.API): API.
+
+    Returns:
+        list<list>: 'call' request parameters.
+
+    """
+
+    calls = []
+    for api_object in api.objects:
+        name = re.sub(r'\{[^}]*\}', '1', api_object.name)
+        for procedure in api_object.procedures:
+            tree = get_field_tree(procedure, REQUEST)
+            args = get_example(tree) if len(tree.children) > 0 else {}
+            calls.append(['00000000000000000000000000000000', name, procedure.name, args])
+
+    return calls
+
+
+def get_percentiles(latencies, percentiles=(50, 90, 99, 99.9)):
+    """Returns nearest-rank percentiles, as the server does."""
+
+    latencies = sorted(latencies)
+    return [(p, latencies[max(0, math.ceil(len(latencies) * p / 100.0) - 1)]) for p in percentiles]
+
+
+async def load(path, calls, connections, requests):
+    """Runs concurrent clients, each sending its requests one after the other.
+
+    Returns:
+        tuple: Wall time, round-trip latencies (in seconds) and ubus status counts.
+
+    """
+
+    latencies = []
+    statuses = Counter()
+
+    async def client(index):
+        reader, writer = await asyncio.open_unix_connection(path)
+        for i in range(requests):
+            params = calls[(index * requests + i) % len(calls)]
+            started = time.perf_counter()
+            writer.write(json.dumps({'jsonrpc': '2.0', 'id': i, 'method': 'call', 'params': params}).encode() + b'\n')
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - started)
+            statuses[response['result'][0] if 'result' in response else response['error']['code']] += 1
+        writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client(i) for i in range(connections)])
+
+    return time.perf_counter() - started, latencies, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock server load benchmark.')
+    parser.add_argument('--spec', default='tests/test-json', help='Specification file (or folder).')
+    parser.add_argument('--input', default='json', choices=registry.get_formats(READER), help='Input format.')
+    parser.add_argument('--connections', type=int, default=1000, help='Concurrent connections.')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per connection.')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    # Every connection uses a file descriptor on both ends.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = 2 * args.connections + 64
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted if hard == resource.RLIM_INFINITY else min(wanted, hard),
+                                                    hard))
+
+    calls = get_calls(parse(args.spec, args.input))
+    path = os.path.join(tempfile.mkdtemp(), 'hlapi.sock')
+
+    connection, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=serve, args=(args.spec, args.input, path, child))
+    server.start()
+
+    try:
+        connection.recv()
+        wall, latencies, statuses = asyncio.run(load(path, calls, args.connections, args.requests))
+    finally:
+        connection.send('stop')
+        _, server_latencies = connection.recv()
+        server.join()
+
+    print('{} requests on {} connections in {:.3f}s ({:.0f} requests/s), statuses: {}'.format(
+        len(latencies), args.connections, wall, len(latencies) / wall, dict(statuses)))
+    print('{:<12} {:>12} {:>12}'.format('Percentile', 'Client (ms)', 'Server (us)'))
+    for (p, client), server_latency in zip(get_percentiles(latencies), server_latencies):
+        print('{:<12} {:>12.3f} {:>12.1f}'.format('p{:g}'.format(p), client * 1000, server_latency))
+
+
+if __name__ == '__main__':
+    main()
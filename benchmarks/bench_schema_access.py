@@ -0,0 +1,146 @@
+"""Micro-benchmark of the schema path resolution done by 'JSONObjectFactory._get_fields'.
+
+Compares, for every procedure of a JSON specification, the cost of walking the full path schema chains for every
+property (as '_get_fields' used to do) against resolving them once through a 'ProcedureSchema'.
+
+Usage:
+    python -m benchmarks.bench_schema_access [--spec tests/test-json] [--number 20000] [--repeat 5] [--width 0 10 50]
+
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+from prpl.apis.hl.factory.json_schema_accessor import ProcedureSchema
+
+
+def load_paths(spec):
+    """Loads every procedure path schema of a JSON specification folder.
+
+    Args:
+        spec (str): Path to the JSON specification folder.
+
+    Returns:
+        list<tuple>: Procedure names and path schemas.
+
+    """
+
+    with open(os.path.join(spec, 'api.json')) as f:
+        api_json = json.load(f)
+
+    paths = []
+    for name in api_json["paths"]:
+        file_name = os.path.join(spec, api_json["paths"][name]['$ref'].replace("#/paths", ""))
+        with open(file_name) as f:
+            paths += list(json.load(f)["paths"].items())
+
+    return paths
+
+
+def widen(path_schema, width):
+    """Returns a copy of a path schema with 'width' extra request properties.
+
+    Args:
+        path_schema (dict): JSON schema of the procedure.
+        width (int): Number of request properties to add.
+
+    Returns:
+        dict: Widened path schema.
+
+    """
+
+    path_schema = json.loads(json.dumps(path_schema))
+    schema = path_schema.setdefault("requestBody", {"content": {"application/json": {"example": "{}"}}})
+    schema = schema["content"]["application/json"].setdefault("schema", {"properties": {}, "required": []})
+
+    for i in range(width):
+        name = 'Parameter{}'.format(i)
+        schema["properties"][name] = {"type": "String", "description": "Synthetic parameter."}
+        schema["required"].append(name)
+
+    return path_schema
+
+
+def resolve_chained(path_schema):
+    """Resolves examples, request and response properties the way the factory used to, once per property."""
+
+    resolved = []
+
+    if "requestBody" not in path_schema:
+        resolved.append(("-", None, None))
+    else:
+        resolved.append((path_schema["requestBody"]["content"]["application/json"]["example"], None, None))
+
+    resolved.append((path_schema["responses"]["OK"]["content"]["application/json"]["example"], None, None))
+
+    if "requestBody" in path_schema.keys():
+        for property_name, property_values in \
+                path_schema["requestBody"]["content"]["application/json"]["schema"]["properties"].items():
+            resolved.append((property_name, property_values,
+                             path_schema["requestBody"]["content"]["application/json"]["schema"]["required"]))
+
+    for property_name, property_values in \
+            path_schema["responses"]["OK"]["content"]["application/json"]["schema"]["allOf"][1]["properties"].items():
+        resolved.append((property_name, property_values,
+                         path_schema["responses"]["OK"]["content"]["application/json"]["schema"]["allOf"][1][
+                             "properties"]["Body"]["required"]))
+
+    return resolved
+
+
+def resolve_hoisted(path_schema):
+    """Resolves examples, request and response properties once per procedure through a 'ProcedureSchema'."""
+
+    resolved = []
+    schema = ProcedureSchema(path_schema)
+
+    resolved.append((schema.request_example, None, None))
+    resolved.append((schema.response_example, None, None))
+
+    if schema.request_properties is not None:
+        required_list = schema.request_required
+        for property_name, property_values in schema.request_properties.items():
+            resolved.append((property_name, property_values, required_list))
+
+    required_list = schema.response_body_required
+    for property_name, property_values in schema.response_properties.items():
+        resolved.append((property_name, property_values, required_list))
+
+    return resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Schema path resolution micro-benchmark.')
+    parser.add_argument('--spec', default='tests/test-json', help='JSON specification folder.')
+    parser.add_argument('--number', type=int, default=20000, help='Calls per measurement.')
+    parser.add_argument('--repeat', type=int, default=5, help='Measurements per procedure (best is kept).')
+    parser.add_argument('--width', type=int, nargs='*', default=[0, 10, 50],
+                        help='Extra request properties added to each procedure.')
+    args = parser.parse_args()
+
+    paths = [('{} (+{})'.format(name, width), widen(path_schema, width))
+             for name, path_schema in load_paths(args.spec) for width in args.width]
+
+    print('{:<50} {:>12} {:>12} {:>8}'.format('Procedure (extra properties)', 'chained (us)', 'hoisted (us)', 'speedup'))
+
+    total_chained = total_hoisted = 0.0
+    for name, path_schema in paths:
+        assert resolve_chained(path_schema) == resolve_hoisted(path_schema)
+
+        chained = min(timeit.repeat(lambda: resolve_chained(path_schema),
+                                    number=args.number, repeat=args.repeat)) / args.number * 1e6
+        hoisted = min(timeit.repeat(lambda: resolve_hoisted(path_schema),
+                                    number=args.number, repeat=args.repeat)) / args.number * 1e6
+        total_chained += chained
+        total_hoisted += hoisted
+
+        print('{:<50} {:>12.3f} {:>12.3f} {:>7.2f}x'.format(name, chained, hoisted, chained / hoisted))
+
+    print('{:<50} {:>12.3f} {:>12.3f} {:>7.2f}x'.format('Total', total_chained, total_hoisted,
+                                                       total_chained / total_hoisted))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,471 @@
+"""Deterministic synthetic specification generator, for load testing the readers, factories and writers.
+
+Generates an Excel specification in the sheet layout read by 'ExcelReader', and a JSON specification in the file
+layout read by 'JSONReader' (as written by 'JSONSchemaWriter'), describing the same API. The same arguments always
+produce the same files.
+
+Every synthetic object is a collection (e.g.: 'Synthetic.Object0001', which owns the events) paired with an
+instance sub-object (e.g.: 'Synthetic.Object0001.{Object0001Id}', which owns the instances), like 'User.Accounts'
+and 'User.Accounts.{AccountId}'. Both share a single JSON object file.
+
+Usage:
+    python -m benchmarks.spec_generator specs/generated/synthetic [--scale 10] [--format xls json]
+        [--objects 60] [--procedures 4] [--parameters 8] [--depth 2] [--events 2] [--instances 2] [--versions 10]
+
+"""
+
+from collections import OrderedDict
+import argparse
+import json
+import os
+import shutil
+
+from prpl.apis.hl.spec.builder import templates
+
+# Counts of a scale 1 specification.
+DEFAULTS = OrderedDict([
+    ('objects', 60),
+    ('procedures', 4),
+    ('parameters', 8),
+    ('depth', 2),
+    ('events', 2),
+    ('instances', 2),
+    ('versions', 10),
+])
+
+# HL-API types of the parameters (cycled), with their uBus counterparts.
+DATA_TYPES = OrderedDict([
+    ('String', 'string'),
+    ('Integer', 'int32'),
+    ('Boolean', 'bool'),
+    ('DateTime', 'string'),
+])
+
+# Rights of the parameters (cycled).
+RIGHTS = ['RW', 'R', 'W']
+
+# Response codes of every procedure.
+RESPONSE_CODES = [
+    ('OK', 'A well-formed call was performed and successfully processed.'),
+    ('INVALID_ARGUMENT', 'One of the arguments is invalid.'),
+    ('NOT_FOUND', 'The object does not exist.'),
+    ('UNKNOWN_ERROR', 'An unexpected error occurred.'),
+]
+
+# Number of changes listed by each version.
+CHANGES_PER_VERSION = 3
+
+
+class SpecGenerator:
+    """Synthetic HL-API specification.
+
+    Example:
+        # Import module.
+        from benchmarks.spec_generator import SpecGenerator
+
+        # Generate a specification 10 times larger than the default one.
+        generator = SpecGenerator.scaled(10)
+        generator.write_excel('specs/generated/synthetic/x10.xlsx')
+        generator.write_json('specs/generated/synthetic/x10')
+
+    """
+
+    def __init__(self, objects=60, procedures=4, parameters=8, depth=2, events=2, instances=2, versions=10):
+        """Initializes the generator.
+
+        Args:
+            objects (int): Number of objects (each one a collection plus its instance sub-object).
+            procedures (int): Procedures per collection and per instance sub-object.
+            parameters (int): Parameters per procedure.
+            depth (int): Maximum nesting depth of the parameters (1 for flat parameters).
+            events (int): Events per collection.
+            instances (int): Instances per instance sub-object.
+            versions (int): Number of versions in the change-log.
+
+        """
+
+        if objects < 1 or procedures < 1 or depth < 1 or versions < 1:
+            raise Exception('The specification needs at least one object, procedure, nesting level and version.')
+
+        self.objects = objects
+        self.procedures = procedures
+        self.parameters = parameters
+        self.depth = depth
+        self.events = events
+        self.instances = instances
+        self.versions = versions
+
+        self._width = max(4, len(str(objects - 1)))
+
+    @classmethod
+    def scaled(cls, scale, **counts):
+        """Creates a generator with 'scale' times the default number of objects.
+
+        Args:
+            scale (int): Object count multiplier.
+            counts (dict): Counts overriding the defaults (see '__init__').
+
+        Returns:
+            SpecGenerator: Generator.
+
+        """
+
+        arguments = OrderedDict(DEFAULTS)
+        arguments.update(counts)
+        arguments['objects'] = arguments['objects'] * scale
+
+        return cls(**arguments)
+
+    def get_counts(self):
+        """Returns the number of HL-API objects, procedures and fields described by the specification.
+
+        Returns:
+            dict: Counts.
+
+        """
+
+        procedures = self.objects * 2 * self.procedures
+
+        return OrderedDict([
+            ('objects', self.objects * 2),
+            ('procedures', procedures),
+            ('fields', procedures * self.parameters),
+            ('events', self.objects * self.events),
+            ('instances', self.objects * self.instances),
+            ('versions', self.versions),
+        ])
+
+    def _get_object_names(self, index):
+        """Returns the collection, instance sub-object and path parameter names of an object."""
+
+        name = 'Object{:0{}d}'.format(index, self._width)
+        collection = 'Synthetic.{}'.format(name)
+
+        return collection, '{}.{{{}Id}}'.format(collection, name), '{}Id'.format(name)
+
+    def _get_objects(self):
+        """Yields the names of every HL-API object, along with their collection, in specification order."""
+
+        for index in range(self.objects):
+            collection, instance, _ = self._get_object_names(index)
+            yield collection, collection
+            yield instance, collection
+
+    def _get_procedure_names(self):
+        return ['Action{:02d}'.format(p) for p in range(self.procedures)]
+
+    def _get_parameters(self):
+        """Returns the parameters of every procedure.
+
+        Returns:
+            list<dict>: Dotted name, type, rights, whether it is required and format of each parameter.
+
+        """
+
+        parameters = []
+        for p in range(self.parameters):
+            levels = p % self.depth
+            name = '.'.join(['Level{}'.format(level) for level in range(levels)] + ['Param{:03d}'.format(p)])
+            data_type = list(DATA_TYPES)[p % len(DATA_TYPES)]
+
+            parameters.append({
+                'name': name,
+                'type': data_type,
+                'rights': RIGHTS[p % len(RIGHTS)],
+                'required': p % 2 == 0,
+                'format': 'YYYY-MM-DDThh:mm:ssZ' if data_type == 'DateTime' else '-',
+            })
+
+        return sorted(parameters, key=lambda p: p['name'])
+
+    def _get_sample(self, parameters):
+        """Returns a JSON sample with the top-level parameters."""
+
+        return json.dumps({p['name']: 'Value' for p in parameters if '.' not in p['name']}, sort_keys=True)
+
+    def _get_event_sample(self, event):
+        """Returns the JSON sample of an event."""
+
+        return json.dumps({'Header': {'Code': event + 1, 'Name': 'EVENT{}'.format(event)}, 'Body': {}})
+
+    def _get_versions(self):
+        """Returns the versions, newest first.
+
+        Returns:
+            list<tuple>: Version number, date and list of (number, description) changes.
+
+        """
+
+        versions = []
+        for v in reversed(range(self.versions)):
+            changes = [(c + 1, 'Synthetic change {} of version 1.{}.'.format(c + 1, v))
+                       for c in range(CHANGES_PER_VERSION)]
+            versions.append(('1.{}'.format(v), '2018-{:02d}-{:02d}'.format(v // 28 % 12 + 1, v % 28 + 1), changes))
+
+        return versions
+
+    def get_sheets(self):
+        """Returns the rows of every sheet but the change-log, as 'ExcelReader' expects them.
+
+        Rows are generated lazily, so that large specifications are never fully held in memory.
+
+        Returns:
+            OrderedDict: Headers and row generator, indexed by sheet name.
+
+        """
+
+        parameters = self._get_parameters()
+        sample = self._get_sample(parameters)
+        procedure_names = self._get_procedure_names()
+
+        def procedures():
+            for name, _ in self._get_objects():
+                for procedure in procedure_names:
+                    yield [1, name, procedure, 'Synthetic procedure {} of {}.'.format(procedure, name), sample,
+                           sample, 'Synthetic Resource']
+
+        def fields():
+            for name, _ in self._get_objects():
+                for procedure in procedure_names:
+                    for p in parameters:
+                        yield [1, name, procedure, p['name'], 'Synthetic parameter {}.'.format(p['name']),
+                               p['type'], p['rights'], 'Required' if p['required'] else 'Optional', '-', '-',
+                               p['format'], '-']
+
+        def events():
+            for index in range(self.objects):
+                collection = self._get_object_names(index)[0]
+                for e in range(self.events):
+                    yield [1, collection, e + 1, 'EVENT{}'.format(e),
+                           'Raised on synthetic event {} of {}.'.format(e, collection), self._get_event_sample(e)]
+
+        def instances():
+            for index in range(self.objects):
+                instance = self._get_object_names(index)[1]
+                for i in range(self.instances):
+                    yield [1, instance, 'Instance{}'.format(i), 'Synthetic instance {}.'.format(i)]
+
+        return OrderedDict([
+            ('Objects & Methods', (['Layer', 'Object', 'Method', 'Description', 'Request Body (Sample)',
+                                    'Response Body (Sample)', 'Resource'], procedures())),
+            ('Parameters', (['Layer', 'Object', 'Method', 'Parameter', 'Description', 'Type', 'Rights', 'Required',
+                             'Default Value', 'Possible Values', 'Format', 'Notes'], fields())),
+            ('Data Types', (['HL-API', 'uBus'], ([k, v] for k, v in DATA_TYPES.items()))),
+            ('Response Codes', (['Name', 'Description', 'Sample', 'Raised By'],
+                                ([name, description, json.dumps({'Header': {'Name': name}}), '-']
+                                 for name, description in RESPONSE_CODES))),
+            ('Events', (['Layer', 'Object', 'Code', 'Name', 'Description', 'Parameters'], events())),
+            ('ToC', (['Layer', 'Object', 'Instance', 'Description'], instances())),
+        ])
+
+    def write_excel(self, file):
+        """Writes the specification as an Excel file (streamed, in write-only mode).
+
+        Args:
+            file (str): Excel file name.
+
+        """
+
+        from openpyxl import Workbook
+
+        folder = os.path.dirname(file)
+        if folder != '':
+            os.makedirs(folder, exist_ok=True)
+
+        wb = Workbook(write_only=True)
+
+        # Versions start at B2, changes are listed in columns B and C, with a blank row between versions.
+        change_log = wb.create_sheet('Change-Log')
+        change_log.append([])
+        for number, date, changes in self._get_versions():
+            change_log.append([None, 'Version {} ({})'.format(number, date)])
+            for change_number, description in changes:
+                change_log.append([None, change_number, description])
+            change_log.append([])
+
+        for title, (headers, rows) in self.get_sheets().items():
+            sheet = wb.create_sheet(title)
+            sheet.append(headers)
+            for row in rows:
+                sheet.append(row)
+
+        wb.save(file)
+
+    def _get_properties(self, parameters):
+        """Builds the (nested) properties schema of a procedure body."""
+
+        schema = {"properties": {}, "required": []}
+
+        for p in parameters:
+            tokens = p['name'].split('.')
+            node = schema
+            for token in tokens[:-1]:
+                node = node["properties"].setdefault(token, {"type": "object", "properties": {}, "required": []})
+
+            node["properties"][tokens[-1]] = {
+                "type": p['type'],
+                "description": 'Synthetic parameter {}.'.format(p['name']),
+                "format": p['format'],
+                "default_value": '-',
+                "possible_values": '-',
+            }
+            if p['required']:
+                node["required"].append(tokens[-1])
+
+        return schema
+
+    def _get_path(self, object_name, collection, procedure, request, response, sample, responses, path_parameter):
+        """Builds the path schema of a procedure, as written by 'JSONSchemaWriter'."""
+
+        path = {
+            "operationId": '{}.{}'.format(object_name, procedure),
+            "summary": 'Synthetic procedure {} of {}.'.format(procedure, object_name),
+            "tags": [collection],
+            "responses": json.loads(responses),
+            "requestBody": {
+                "content": {
+                    "application/json": {
+                        "schema": request,
+                        "example": sample,
+                    }
+                }
+            },
+        }
+
+        ok = path["responses"]["OK"]["content"]["application/json"]
+        ok["example"] = sample
+        ok["schema"] = {"allOf": [{"$ref": "#/components/schemas/Response"}, {"properties": {"Body": response}}]}
+
+        if path_parameter is not None:
+            path["parameters"] = [{
+                "in": "path",
+                "name": path_parameter,
+                "type": "integer",
+                "required": True,
+                "description": "ID of a(n) {}".format(path_parameter.replace("Id", "")),
+                "schema": {"type": "integer", "format": "int32", "default": 20, "example": {"Limit": 10}},
+            }]
+
+        return path
+
+    def write_json(self, folder):
+        """Writes the specification as a folder of JSON schema files.
+
+        Args:
+            folder (str): Specification folder (replaced if it exists).
+
+        """
+
+        shutil.rmtree(folder, ignore_errors=True)
+        os.makedirs(folder)
+
+        api_json = json.loads(templates.read_text(os.path.join(templates.TEMPLATE_FOLDER, 'prpl.json')))
+        object_template = templates.read_text(os.path.join(templates.TEMPLATE_FOLDER, 'object.json'))
+
+        parameters = self._get_parameters()
+        sample = self._get_sample(parameters)
+        request = self._get_properties([p for p in parameters if 'W' in p['rights']])
+        response = self._get_properties([p for p in parameters if 'R' in p['rights']])
+
+        responses = json.dumps(OrderedDict(
+            (name, {
+                "description": description,
+                "raised_by": '-',
+                "content": {"application/json": {"example": json.dumps({'Header': {'Name': name}}),
+                                                 "schema": {"$ref": "#/components/schemas/Response"}}},
+            }) for name, description in RESPONSE_CODES))
+
+        for index in range(self.objects):
+            collection, instance, path_parameter = self._get_object_names(index)
+
+            out = json.loads(object_template)
+            out["paths"] = OrderedDict()
+            for object_name, parameter in [(collection, None), (instance, path_parameter)]:
+                for procedure in self._get_procedure_names():
+                    out["paths"]['{}.{}'.format(object_name, procedure)] = self._get_path(
+                        object_name, collection, procedure, request, response, sample, responses, parameter)
+
+            prefix = collection.upper().replace('.', '_')
+            out["components"]["schemas"][collection] = {
+                "description": '{} Object'.format(collection),
+                "id": collection,
+                "type": "object",
+                "required": [],
+                "properties": {},
+                "events": OrderedDict(
+                    ('{}_EVENT{}'.format(prefix, e), {
+                        "content": {"application/json": {"example": self._get_event_sample(e)}},
+                        "description": 'Raised on synthetic event {} of {}.'.format(e, collection),
+                        "code": str(e + 1),
+                    }) for e in range(self.events)),
+                "example": {},
+                "layer": 1,
+            }
+            out["instances"] = OrderedDict(
+                ('Instance{}'.format(i), {'description': 'Synthetic instance {}.'.format(i)})
+                for i in range(self.instances))
+
+            with open(os.path.join(folder, '{}.json'.format(collection)), 'w') as f:
+                json.dump(out, f, indent=2)
+
+            api_json["paths"][collection] = {"$ref": "{}.json#/paths".format(collection)}
+            api_json["components"]["schemas"][collection] = {
+                "$ref": "{}.json#/components/schemas/{}".format(collection, collection)}
+
+        versions = self._get_versions()
+        api_json["versions"] = OrderedDict(
+            (number, {'date': date, 'changes': changes}) for number, date, changes in versions)
+        api_json["info"]["version"] = versions[0][0]
+
+        with open(os.path.join(folder, 'api.json'), 'w') as f:
+            json.dump(api_json, f, indent=2)
+
+
+def generate(folder, scale=1, formats=('xls', 'json'), **counts):
+    """Generates a synthetic specification.
+
+    Args:
+        folder (str): Output folder.
+        scale (int): Object count multiplier.
+        formats (list<str>): Formats to be generated ("xls" and/or "json").
+        counts (dict): Counts overriding the defaults (see 'SpecGenerator').
+
+    Returns:
+        dict: Generated file (or folder), indexed by format.
+
+    """
+
+    generator = SpecGenerator.scaled(scale, **counts)
+    name = 'synthetic-x{}'.format(scale)
+
+    files = OrderedDict()
+    if 'xls' in formats:
+        files['xls'] = os.path.join(folder, '{}.xlsx'.format(name))
+        generator.write_excel(files['xls'])
+    if 'json' in formats:
+        files['json'] = os.path.join(folder, name)
+        generator.write_json(files['json'])
+
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic HL-API specification generator.')
+    parser.add_argument('folder', help='Output folder.')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1], help='Object count multipliers.')
+    parser.add_argument('--format', nargs='+', default=['xls', 'json'], choices=['xls', 'json'],
+                        help='Formats to be generated.')
+    for name, default in DEFAULTS.items():
+        parser.add_argument('--{}'.format(name), type=int, default=default,
+                            help='Number of {} (default: {}).'.format(name, default))
+    args = parser.parse_args()
+
+    counts = OrderedDict((name, getattr(args, name)) for name in DEFAULTS)
+    for scale in args.scale:
+        files = generate(args.folder, scale, args.format, **counts)
+        print('Scale {}: {} ({}).'.format(scale, ', '.join(files.values()), ', '.join(
+            '{} {}'.format(count, name) for name, count in SpecGenerator.scaled(scale, **counts).get_counts().items())))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,24 @@
 
+from collections import OrderedDict
+import argparse
 import logging
+import os
+import time
 
 
-# TODO: make dynamic
-# readers
-from prpl.apis.hl.spec.parser import ExcelReader as HLAPIExcelParser
-from prpl.apis.hl.spec.parser import JSONReader as HLAPIJSONParser
-
-# TODO: make dynamic
-# writers
-from prpl.apis.hl.spec.builder import WordWriter as HLAPIWordWriter
-from prpl.apis.hl.spec.builder import ExcelWriter as HLAPIExcelWriter
-from prpl.apis.hl.spec.builder import \
-    JSONSchemaWriter as HLAPIJSONSSchemaWriter
+# Readers and writers are declared by the format registry, which only imports the backends (e.g.: openpyxl,
+# python-docx) of the selected formats.
+from prpl.apis.hl.factory.string_pool import StringPool as HLAPIStringPool
+from prpl.apis.hl.spec.log_handler import AsyncFileLogging
+from prpl.apis.hl.spec.profiler import Profiler as HLAPIProfiler
+from prpl.apis.hl.spec.registry import INCREMENTAL as HLAPI_INCREMENTAL
+from prpl.apis.hl.spec.registry import INTERNING as HLAPI_INTERNING
+from prpl.apis.hl.spec.registry import OUTPUT_FOLDER as HLAPI_OUTPUT_FOLDER
+from prpl.apis.hl.spec.registry import READER as HLAPI_READER
+from prpl.apis.hl.spec.registry import STREAMING as HLAPI_STREAMING
+from prpl.apis.hl.spec.registry import WRITER as HLAPI_WRITER
+from prpl.apis.hl.spec.registry import get_spec_size
+from prpl.apis.hl.spec.registry import registry as hlapi_registry
 
 
 class Launcher:
@@ -21,32 +27,68 @@ class Launcher:
     Implements the logic of the parsings the HL-API and
     converting into a different format.
 
+    The specification is parsed once. When several output formats are requested, the writers run one after the other
+    over the shared (read-only) API. The wall and CPU time of each stage is kept in 'timings'.
+
+    Readers and writers are looked up in a format registry ('prpl.apis.hl.spec.registry'), which also discovers
+    third-party backends. When a format has several capable backends, the cheapest one for the size of the
+    specification is used.
+
     """
 
-    def __init__(self, spec, input_format="xls", output_format="json"):
+    def __init__(self, spec, input_format="xls", output_format="json", log_level=logging.INFO,
+                 log_file='parser.log', registry=None, profiler=None, streaming=False, check_samples=False,
+                 string_pool=None, output_folder=HLAPI_OUTPUT_FOLDER):
         """Initializes the parser.
 
-        By default it enables logging to both console and file.
+        Logging to file is enabled while running (see 'run', 'watch' and 'serve'). Records are written by a
+        background thread, so that DEBUG runs do not block on disk.
 
         Args:
             spec (str): File name of the specification file to be parsed.
+            input_format (str): Input format ("xls", "json" or "snapshot").
+            output_format (str|list<str>): Output format ("json", "word", "xls", "snapshot", "sqlite" or
+                "validator"), or a list of output formats to be built from a single parse.
+            log_level (int): Logging level (e.g.: 'logging.DEBUG'). Defaults to 'logging.INFO'.
+            log_file (str): Log file name.
+            registry (prpl.apis.hl.spec.registry.FormatRegistry): Reader and writer registry. Defaults to the
+                default registry.
+            profiler (prpl.apis.hl.spec.profiler.Profiler): Profiler enabled while running.
+            streaming (bool): Whether to use a streaming reader, which does not hold the whole specification in
+                memory while parsing it.
+            check_samples (bool): Whether to check the sample payloads against their declarations after parsing
+                (see 'prpl.apis.hl.spec.samples'). Issues are logged as warnings, and kept in 'sample_issues'.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values, by the readers
+                which support it. Defaults to a new pool, shared by all the parses of this launcher (e.g.: in watch
+                mode).
+            output_folder (str): Folder of the outputs. Defaults to 'specs/generated'.
 
         """
 
         self.specification_file = spec
+        self.registry = registry or hlapi_registry
+        self.profiler = profiler
+        self.streaming = streaming
+        self.sample_checker = None
+        self.sample_issues = None
+        self.check_samples = check_samples
+        self.string_pool = string_pool if string_pool is not None else HLAPIStringPool()
+        self.output_folder = output_folder
         self.api = None
         self.input_format = input_format
         self.output_format = output_format
+        self.output_formats = [output_format] if isinstance(output_format, str) else list(output_format)
+        self.timings = OrderedDict()
 
-        # Set logging format and level.
-        log_level = logging.DEBUG
+        for output in self.output_formats:
+            if len(self.registry.get_backends(HLAPI_WRITER, output)) == 0:
+                raise Exception('Unknown output format "{}".'.format(output))
+
+        # Set logging format.
         log_format = '[%(asctime)s] (%(name)s) <%(levelname)s>: %(message)s'
 
-        # Setup file logger.
-        logging.basicConfig(level=log_level,
-                            format=log_format,
-                            filename='parser.log',
-                            filemode='w')
+        # Setup asynchronous file logger, started by each run.
+        self.log = AsyncFileLogging(log_file, log_level, log_format)
 
         # Add console handler with same configuration.
         console = logging.StreamHandler()
@@ -57,108 +99,359 @@ class Launcher:
 
         # logging.getLogger().addHandler(console)
 
-    def _parse_from_excel(self):
-        """Fills the api object with input from an Excel HL-API specification file.
+    def _select_reader(self, capabilities=()):
+        """Picks the reader of the input format.
+
+        Args:
+            capabilities (list<str>): Required capabilities.
 
-        It reads all Excel sheets and converts into list of dictionaries.
+        Returns:
+            prpl.apis.hl.spec.registry.Backend: Selected reader.
 
         """
 
-        logger = logging.getLogger('ExcelReader')
+        backend = self.registry.select(HLAPI_READER, self.input_format, capabilities,
+                                       get_spec_size(self.specification_file))
+        logging.getLogger('Launcher').info('Selected %s.', backend)
 
-        # Load specification.
-        logger.info('Excel - Parsing started.\n')
-        parser = HLAPIExcelParser(self.specification_file)
-        self.api = parser.parse()
+        return backend
 
-    def _parse_from_json(self):
-        """Fills the api object with input from an Excel HL-API specification file.
+    def _parse(self, backend):
+        """Fills the api object with input from the specification.
 
-        It reads all Excel sheets and converts into list of dictionaries.
+        Args:
+            backend (prpl.apis.hl.spec.registry.Backend): Reader of the input format.
+
+        Returns:
+            object: Reader instance (e.g.: to be updated by incremental readers).
 
         """
 
-        logger = logging.getLogger('JSONReader')
+        logger = logging.getLogger(backend.name)
 
         # Load specification.
-        logger.info('JSON - Parsing started.\n')
-        parser = HLAPIJSONParser(self.specification_file)
+        logger.info('%s - Parsing started.\n', backend.label)
+        if backend.supports([HLAPI_INTERNING]):
+            parser = backend.load()(self.specification_file, string_pool=self.string_pool)
+        else:
+            parser = backend.load()(self.specification_file)
         self.api = parser.parse()
 
-    def _build_word_report(self):
-        """Generates a HL-API Specification document in MS Word format."""
+        return parser
 
-        logger = logging.getLogger('WordWriter')
+    def _build(self, backend):
+        """Generates an output from the parsed API.
 
-        # Build objects.
-        logger.info('Word - Started building file.\n')
-        writer = HLAPIWordWriter(
-                                self.api,
-                                'specs/generated/prpl HL-API ({}).docx'
-                                .format(self.api.get_version())
-                                )
-        writer.build()
-        logger.info('Word - Finished building file.')
+        Args:
+            backend (prpl.apis.hl.spec.registry.Backend): Writer of the output format.
 
-    def _build_json_schema(self):
-        """Generates a HL-API Specification as a list of JSON Schema files."""
+        """
 
-        logger = logging.getLogger('JSONSchemaWriter')
+        logger = logging.getLogger(backend.name)
 
         # Build objects.
-        logger.info(
-            'JSON Schema - Started building files. {}\n'
-            .format(self.api.get_version())
-        )
-        folder = 'specs/generated/json/v{}/'.format(self.api.get_version())
-        writer = HLAPIJSONSSchemaWriter(self.api, folder)
+        logger.info('%s - Started building file. %s\n', backend.label, self.api.get_version())
+        output = backend.get_output(self.api, self.output_folder)
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+
+        writer = backend.load()(self.api, output)
         writer.build()
-        logger.info('Word - Finished building file.')
+        logger.info('%s - Finished building file.', backend.label)
 
-    def _build_excel_file(self):
-        """Generates a HL-API Specification document in MS Word format."""
+    def _check_samples(self):
+        """Checks the sample payloads of the parsed API, and logs the issues found."""
 
-        logger = logging.getLogger('ExcelWriter')
+        # Only imported when checking samples, since it loads the process pool of its workers.
+        from prpl.apis.hl.spec.samples import SampleChecker as HLAPISampleChecker
 
-        # Build objects.
-        logger.info('Excel - Started building file.\n')
-        writer = HLAPIExcelWriter(self.api,
-                                  'specs/generated/')
-        writer.build()
-        logger.info('Excel - Finished building file.')
+        logger = logging.getLogger('Launcher')
+
+        # The checker is kept, so that unchanged samples are not checked again in watch mode.
+        if self.sample_checker is None:
+            self.sample_checker = HLAPISampleChecker(self.api)
+        self.sample_checker.api = self.api
+
+        self.sample_issues = self.sample_checker.check()
+        for issue in self.sample_issues:
+            logger.warning('Samples - %s', issue)
+
+        if len(self.sample_issues) > 0:
+            print('Found {} sample issues.'.format(len(self.sample_issues)))
+
+    def _run_stage(self, stage, method):
+        """Runs a stage, recording its wall and (thread) CPU time.
+
+        Args:
+            stage (str): Stage name.
+            method (callable): Stage implementation.
+
+        """
+
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            if self.profiler is not None:
+                with self.profiler.stage(stage):
+                    method()
+            else:
+                method()
+        finally:
+            self.timings[stage] = (time.perf_counter() - wall, time.thread_time() - cpu)
+
+    def get_timings_report(self):
+        """Formats the stage timings of the last run.
+
+        Returns:
+            str: One line per stage, with wall and CPU time in seconds.
+
+        """
+
+        lines = ['{:<10} {:>9} {:>9}'.format('Stage', 'Wall (s)', 'CPU (s)')]
+        for stage, (wall, cpu) in self.timings.items():
+            lines.append('{:<10} {:>9.3f} {:>9.3f}'.format(stage, wall, cpu))
+
+        return '\n'.join(lines)
 
     def run(self):
-        """HL-API main function."""
+        """HL-API main function.
+
+        The log file is closed once done, running again appends to it.
+
+        """
+
+        self.log.start()
+        try:
+            if self.profiler is not None:
+                with self.profiler:
+                    self._run()
+            else:
+                self._run()
+        finally:
+            self.log.stop()
+
+    def _run(self):
+        """Parses the specification and builds the outputs."""
 
         logger = logging.getLogger('Launcher')
+        self.timings.clear()
+        started = time.perf_counter()
 
         # perform input type specific parsing
-        if self.input_format == "xls":
-            self._parse_from_excel()
-        elif self.input_format == "json":
-            self._parse_from_json()
+        backend = self._select_reader([HLAPI_STREAMING] if self.streaming else [])
+        self._run_stage('parse', lambda: self._parse(backend))
 
         if self.api is None:
             raise Exception("Error, no API parsed")
 
-        logger.info('Finished building API {}.\n'.format(self.api))
+        logger.info('Finished building API %s.\n', self.api)
         print("done parsing")
 
-        if self.output_format == "json":
-            self._build_json_schema()
-        elif self.output_format == "word":
-            self._build_word_report()
-        elif self.output_format == "xls":
-            self._build_excel_file()
+        if self.check_samples:
+            self._run_stage('samples', self._check_samples)
+
+        self._build_outputs(self.output_formats)
+
+        self.timings['total'] = (time.perf_counter() - started, sum(cpu for _, cpu in self.timings.values()))
+        logger.info('Timings:\n%s\n', self.get_timings_report())
+
+    def _build_outputs(self, outputs):
+        """Builds the specified outputs from the parsed API.
+
+        Args:
+            outputs (list<str>): Output formats.
+
+        """
+
+        logger = logging.getLogger('Launcher')
+
+        backends = []
+        for output in outputs:
+            backend = self.registry.select(HLAPI_WRITER, output, size=len(self.api.objects))
+            logger.info('Selected %s.', backend)
+            backends.append((output, backend))
+
+            # Keep the report in the order the outputs were requested.
+            self.timings[output] = (0.0, 0.0)
+
+        # Writers are CPU bound (and hold the GIL), so they run one after the other over the same API.
+        for output, backend in backends:
+            self._run_stage(output, lambda: self._build(backend))
+
+    def serve(self, path):
+        """Parses the specification, then answers ubus calls with its responses until interrupted.
+
+        See 'prpl.apis.hl.spec.mock_server'. No output is built. The log file is closed once the server stops.
+
+        Args:
+            path (str): Path of the Unix socket.
+
+        Returns:
+            prpl.apis.hl.spec.mock_server.MockServer: Server, with the latencies of the requests it served.
+
+        """
+
+        self.log.start()
+        try:
+            return self._serve(path)
+        finally:
+            self.log.stop()
+
+    def _serve(self, path):
+        """Parses the specification and runs the mock server."""
+
+        # Only imported when serving, since it loads asyncio.
+        from prpl.apis.hl.spec.mock_server import MockServer as HLAPIMockServer
+
+        logger = logging.getLogger('Launcher')
+
+        self.timings.clear()
+        backend = self._select_reader()
+        self._run_stage('parse', lambda: self._parse(backend))
+
+        servers = []
+        self._run_stage('mock', lambda: servers.append(HLAPIMockServer(self.api, path)))
+        logger.info('Mock Server - Serving API %s.\n%s\n', self.api, self.get_timings_report())
+        print('Serving "{}" on "{}".'.format(self.specification_file, path))
+
+        server = servers[0]
+        server.run()
+
+        return server
+
+    def watch(self, interval=0.5, cycles=None):
+        """Builds all outputs, then keeps rebuilding them whenever the input specification changes.
+
+        The parsed API is kept in memory. Only the changed Excel sheets or JSON object files are parsed again, and
+        outputs are only rebuilt when the API actually changed (e.g.: not when a file is saved unchanged). The log file
+        is closed once done (or interrupted).
+
+        Args:
+            interval (float): Polling interval, in seconds.
+            cycles (int): Number of polls before returning. Polls forever if not specified.
+
+        """
+
+        self.log.start()
+        try:
+            self._watch(interval, cycles)
+        finally:
+            self.log.stop()
+
+    def _watch(self, interval, cycles):
+        """Builds all outputs, then polls the specification and rebuilds the changed outputs."""
+
+        logger = logging.getLogger('Launcher')
+
+        backend = self._select_reader([HLAPI_INCREMENTAL])
+        sources = []
+
+        self.timings.clear()
+        self._run_stage('parse', lambda: sources.append(self._parse(backend)))
+        source = sources[0]
+        if self.check_samples:
+            self._run_stage('samples', self._check_samples)
+        self._build_outputs(self.output_formats)
+        logger.info('Watch - Built API %s, watching "%s".\n%s\n', self.api, self.specification_file,
+                    self.get_timings_report())
+
+        cycle = 0
+        while cycles is None or cycle < cycles:
+            cycle += 1
+            time.sleep(interval)
+
+            self.timings.clear()
+            started = time.perf_counter()
+            parts = set()
+
+            def update():
+                parts.update(source.update(self.api))
+
+            try:
+                self._run_stage('parse', update)
+                if len(parts) == 0:
+                    continue
+
+                if self.check_samples:
+                    self._run_stage('samples', self._check_samples)
+                self._build_outputs(self.output_formats)
+            except Exception:
+                # Keep watching, the author is likely to fix the specification.
+                logger.exception('Watch - Rebuild failed.')
+                continue
+
+            self.timings['total'] = (time.perf_counter() - started, sum(cpu for _, cpu in self.timings.values()))
+            logger.info('Watch - Rebuilt %s.\n%s\n', ', '.join(sorted(parts)), self.get_timings_report())
+            print('Rebuilt {} ({:.3f}s).'.format(', '.join(sorted(parts)), self.timings['total'][0]))
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='prpl HL-API Specification Parser.')
+    parser.add_argument('spec', nargs='?', default='specs/generated/json/v3.8.2.7',
+                        help='Specification file (or folder) to be parsed.')
+    parser.add_argument('--input', default='json', choices=hlapi_registry.get_formats(HLAPI_READER),
+                        help='Input format.')
+    parser.add_argument('--output', default=['xls'], nargs='+', choices=hlapi_registry.get_formats(HLAPI_WRITER),
+                        help='Output formats, built from a single parse.')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Logging level.')
+    parser.add_argument('--log-file', default='parser.log', help='Log file name.')
+    parser.add_argument('--output-folder', default=HLAPI_OUTPUT_FOLDER, help='Folder of the outputs.')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep rebuilding the outputs whenever the specification changes.')
+    parser.add_argument('--interval', type=float, default=0.5, help='Watch mode polling interval, in seconds.')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Link the specification as it is read, without holding it in memory (slower).')
+    parser.add_argument('--mock-server', default=None, metavar='SOCKET',
+                        help='Answer ubus calls with the responses of the specification on a Unix socket, instead '
+                             'of building outputs.')
+    parser.add_argument('--check-samples', action='store_true',
+                        help='Check the sample payloads against the declared fields, and report mismatches.')
+    parser.add_argument('--profile', nargs='?', const='profile.json', default=None, metavar='REPORT',
+                        help='Profile each stage and write a JSON report (defaults to "profile.json").')
+    parser.add_argument('--profile-dump', default=None, metavar='FILE',
+                        help='Also write the cProfile statistics of the slowest stage (requires --profile).')
+    args = parser.parse_args()
+
+    if args.profile is not None and args.watch:
+        parser.error('--profile cannot be combined with --watch.')
+    if args.streaming and args.watch:
+        parser.error('--streaming cannot be combined with --watch.')
+    if args.mock_server is not None and (args.watch or args.profile is not None):
+        parser.error('--mock-server cannot be combined with --watch or --profile.')
+    if args.profile_dump is not None and args.profile is None:
+        parser.error('--profile-dump requires --profile.')
+
+    profiler = None
+    if args.profile is not None:
+        profiler = HLAPIProfiler(dump_stages=args.profile_dump is not None)
+
     # l = Launcher(
     #     'specs/input/3.8.2.7RC.xlsx'
     # )
     l = Launcher(
-            'specs/generated/json/v3.8.2.7',
-            input_format="json",
-            output_format="xls"
+            args.spec,
+            input_format=args.input,
+            output_format=args.output,
+            log_level=getattr(logging, args.log_level),
+            log_file=args.log_file,
+            profiler=profiler,
+            streaming=args.streaming,
+            check_samples=args.check_samples,
+            output_folder=args.output_folder
             )
-    l.run()
+    if args.mock_server is not None:
+        server = l.serve(args.mock_server)
+        print('Served {} requests. Latency (us): {}'.format(server.requests, ', '.join(
+            'p{:g}={:.1f}'.format(p, latency) for p, latency in server.get_latency_percentiles().items())))
+    elif args.watch:
+        l.watch(args.interval)
+    else:
+        l.run()
+        print(l.get_timings_report())
+
+    if profiler is not None:
+        profiler.write_report(args.profile)
+        print('Profile written to "{}".'.format(args.profile))
+
+        if args.profile_dump is not None:
+            stage = profiler.dump_slowest_stage(args.profile_dump)
+            print('Profile of the slowest stage ({}) written to "{}".'.format(stage, args.profile_dump))
@@ -2,10 +2,11 @@
 from prpl.apis.hl.com.version import Version
 from prpl.apis.hl.com.event import Event
 from prpl.apis.hl.com.field import Field
+from prpl.apis.hl.com.field_store import FieldStore
 from prpl.apis.hl.com.procedure import Procedure
 from prpl.apis.hl.com.instance import Instance
 from prpl.apis.hl.com.object import Object
 from prpl.apis.hl.com.response_code import ResponseCode
 from prpl.apis.hl.com.api import API
 
-__all__ = ['Version', 'Event', 'Field', 'Procedure', 'Instance', 'Object', 'ResponseCode', 'API']
+__all__ = ['Version', 'Event', 'Field', 'FieldStore', 'Procedure', 'Instance', 'Object', 'ResponseCode', 'API']
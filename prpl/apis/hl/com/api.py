@@ -5,6 +5,11 @@ from operator import attrgetter
 class API:
     """HL-API wrapper.
 
+    Name lookups ('object', 'procedure', 'event_by_code', 'response_code') use indexes built on first use. Assigning
+    the 'objects' or 'response_codes' lists, and appending or removing their entries, is detected automatically. Any
+    other change after construction (renaming an object, replacing an entry in place, or changing the procedures or
+    events of an object) must be followed by a call to 'invalidate', otherwise lookups return stale results.
+
     Example:
         # Import module.
         from prpl.apis.hl.com import API as HLAPI
@@ -21,6 +26,12 @@ class API:
         # Create API.
         api = HLAPI(api_objects, api_response_codes, api_versions)
 
+        # Look up objects, procedures, events and response codes by name.
+        api_object = api.object('User.Accounts.{AccountId}')
+        api_procedure = api.procedure(api_object, 'Set')
+        api_event = api.event_by_code(1, 'User.Accounts')
+        api_response_code = api.response_code('OK')
+
     """
 
     def __init__(self, objects, response_codes, versions):
@@ -33,10 +44,36 @@ class API:
 
         """
 
-        self.objects = objects
-        self.response_codes = response_codes
+        self._objects = objects
+        self._response_codes = response_codes
         self.versions = sorted(versions, key=attrgetter('number'), reverse=True)
 
+        # Lookup indexes, built on first use.
+        self._indexes = None
+        self._indexes_signature = None
+
+    @property
+    def objects(self):
+        """list<prpl.apis.hl.com.Object>: List of objects part of the API."""
+
+        return self._objects
+
+    @objects.setter
+    def objects(self, objects):
+        self._objects = objects
+        self.invalidate()
+
+    @property
+    def response_codes(self):
+        """list<prpl.apis.hl.com.ResponseCode>: List of response codes part of the API."""
+
+        return self._response_codes
+
+    @response_codes.setter
+    def response_codes(self, response_codes):
+        self._response_codes = response_codes
+        self.invalidate()
+
     def __str__(self):
         """Converts API to human-readable string.
 
@@ -56,3 +93,117 @@ class API:
         """
 
         return self.versions[0].number
+
+    def invalidate(self):
+        """Drops the lookup indexes, which are rebuilt on the next lookup.
+
+        Appending or removing objects and response codes is detected automatically. This method must be called
+        after renaming entries or after changing the procedures or events of an object.
+
+        """
+
+        self._indexes = None
+        self._indexes_signature = None
+
+    def _get_indexes(self):
+        """Returns the lookup indexes, (re)building them if needed.
+
+        Returns:
+            dict: Name-indexed objects ('objects'), procedures ('procedures'), events ('events' and
+                'object_events') and response codes ('response_codes').
+
+        """
+
+        signature = (len(self._objects), len(self._response_codes))
+
+        if self._indexes is None or self._indexes_signature != signature:
+            objects = {}
+            procedures = {}
+            events = {}
+            object_events = {}
+
+            for o in self._objects:
+                objects.setdefault(o.name, o)
+                procedures.setdefault(o.name, {p.name: p for p in reversed(o.procedures)})
+
+                codes = object_events.setdefault(o.name, {})
+                for e in o.events:
+                    codes.setdefault(str(e.code), e)
+                    events.setdefault(str(e.code), e)
+
+            self._indexes = {
+                'objects': objects,
+                'procedures': procedures,
+                'events': events,
+                'object_events': object_events,
+                'response_codes': {r.name: r for r in reversed(self._response_codes)}
+            }
+            self._indexes_signature = signature
+
+        return self._indexes
+
+    def object(self, name):
+        """Looks up an object by name.
+
+        Args:
+            name (str): Name of the object (e.g.: 'User.Accounts.{AccountId}').
+
+        Returns:
+            prpl.apis.hl.com.Object: Matching object, or 'None' if not found.
+
+        """
+
+        return self._get_indexes()['objects'].get(name)
+
+    def procedure(self, obj, name):
+        """Looks up a procedure of an object by name.
+
+        Args:
+            obj (prpl.apis.hl.com.Object|str): Object (or object name) owning the procedure.
+            name (str): Name of the procedure (e.g.: 'Set').
+
+        Returns:
+            prpl.apis.hl.com.Procedure: Matching procedure, or 'None' if not found.
+
+        """
+
+        object_name = obj if isinstance(obj, str) else obj.name
+
+        return self._get_indexes()['procedures'].get(object_name, {}).get(name)
+
+    def event_by_code(self, code, obj=None):
+        """Looks up an event by code.
+
+        Event codes are only unique within an object. If no object is specified, the event of the first object
+        (in API order) raising the code is returned.
+
+        Args:
+            code (int|str): Code of the event.
+            obj (prpl.apis.hl.com.Object|str): Object (or object name) raising the event.
+
+        Returns:
+            prpl.apis.hl.com.Event: Matching event, or 'None' if not found.
+
+        """
+
+        indexes = self._get_indexes()
+
+        if obj is None:
+            return indexes['events'].get(str(code))
+
+        object_name = obj if isinstance(obj, str) else obj.name
+
+        return indexes['object_events'].get(object_name, {}).get(str(code))
+
+    def response_code(self, name):
+        """Looks up a response code by name.
+
+        Args:
+            name (str): Name of the response code (e.g.: 'OK').
+
+        Returns:
+            prpl.apis.hl.com.ResponseCode: Matching response code, or 'None' if not found.
+
+        """
+
+        return self._get_indexes()['response_codes'].get(name)
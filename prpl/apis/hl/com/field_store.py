@@ -0,0 +1,380 @@
+
+from array import array
+from collections import OrderedDict
+from itertools import compress
+
+from prpl.apis.hl.com.field import Field
+
+# Field flags, packed into a single byte per field.
+IS_INPUT = 1
+IS_OUTPUT = 2
+IS_REQUIRED = 4
+IS_OPTIONAL = 8
+
+
+class FieldStore:
+    """Columnar HL-API field storage.
+
+    Holds the attributes of every procedure field in parallel arrays (one entry per field) and packs the 'is_input',
+    'is_output' and 'is_required' flags into a bitset, which avoids the per-instance overhead of
+    'prpl.apis.hl.com.Field' for large APIs. Each procedure owns a contiguous range of the store, exposed as a
+    'FieldRange' of lightweight 'FieldView' entries which behave like regular fields.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.com import FieldStore as HLAPIFieldStore
+
+        # Move the fields of every procedure into a store.
+        store = HLAPIFieldStore.pack(api)
+
+        # Bulk filter procedure fields.
+        procedure = api.objects[0].procedures[0]
+        args = procedure.parameters.inputs()
+
+    """
+
+    def __init__(self):
+        """Creates a new, empty, field store."""
+
+        self.names = []
+        self.descriptions = []
+        self.types = []
+        self.default_values = []
+        self.possible_values = []
+        self.formats = []
+        self.notes = []
+        self.flags = array('B')
+
+    def __len__(self):
+        """Returns the number of fields held by the store.
+
+        Returns:
+            int: Number of fields.
+
+        """
+
+        return len(self.flags)
+
+    def append(self, field):
+        """Appends a field to the store.
+
+        Args:
+            field (prpl.apis.hl.com.Field): Field to be stored.
+
+        Returns:
+            int: Index of the field within the store.
+
+        """
+
+        flags = 0
+        if field.is_input:
+            flags |= IS_INPUT
+        if field.is_output:
+            flags |= IS_OUTPUT
+        if field.is_required is True:
+            flags |= IS_REQUIRED
+        elif field.is_required is False:
+            flags |= IS_OPTIONAL
+
+        self.names.append(field.name)
+        self.descriptions.append(field.description)
+        self.types.append(field.type)
+        self.default_values.append(field.default_value)
+        self.possible_values.append(field.possible_values)
+        self.formats.append(field.format)
+        self.notes.append(field.notes)
+        self.flags.append(flags)
+
+        return len(self.flags) - 1
+
+    def extend(self, fields):
+        """Appends a list of fields (e.g.: the fields of a procedure) to the store.
+
+        Args:
+            fields (list<prpl.apis.hl.com.Field>): Fields to be stored.
+
+        Returns:
+            prpl.apis.hl.com.field_store.FieldRange: Range of the store holding the specified fields.
+
+        """
+
+        start = len(self.flags)
+        for f in fields:
+            self.append(f)
+
+        return FieldRange(self, start, len(self.flags))
+
+    def select(self, start, end, mask):
+        """Looks up the fields within a range which have any of the specified flags set.
+
+        Args:
+            start (int): First index of the range.
+            end (int): Index past the end of the range.
+            mask (int): Bitmask of flags to look for (e.g.: 'IS_INPUT').
+
+        Returns:
+            list<int>: Indexes of the matching fields.
+
+        """
+
+        return list(compress(range(start, end), map(mask.__and__, self.flags[start:end])))
+
+    @classmethod
+    def pack(cls, api):
+        """Moves the fields of every procedure of an API into a new store.
+
+        Procedure field lists ('parameters') are replaced by a 'FieldRange', and field dictionaries ('fields') by
+        dictionaries of 'FieldView' entries, so existing consumers keep working unchanged.
+
+        Args:
+            api (prpl.apis.hl.com.API): API to be packed.
+
+        Returns:
+            prpl.apis.hl.com.FieldStore: Store holding the fields of all procedures.
+
+        """
+
+        store = cls()
+
+        for api_object in api.objects:
+            for procedure in api_object.procedures:
+                procedure.parameters = store.extend(procedure.parameters)
+
+                fields = getattr(procedure, 'fields', None)
+                if isinstance(fields, dict):
+                    procedure.fields = OrderedDict(zip(fields.keys(), store.extend(fields.values())))
+
+        return store
+
+
+def get_fields(procedure):
+    """Returns the fields of a procedure, whether they are held as a list ('parameters') or a dictionary ('fields').
+
+    Args:
+        procedure (prpl.apis.hl.com.Procedure): Procedure.
+
+    Returns:
+        list<prpl.apis.hl.com.Field>: Fields of the procedure.
+
+    """
+
+    fields = list(procedure.parameters)
+
+    extra = getattr(procedure, 'fields', None)
+    if isinstance(extra, dict):
+        fields.extend(extra.values())
+
+    return fields
+
+
+def _select(procedure, flag, attribute):
+    """Returns the fields of a procedure which have a flag set, selecting packed fields in bulk."""
+
+    parameters = procedure.parameters
+    if isinstance(parameters, FieldRange):
+        fields = [FieldView(parameters.store, i) for i in parameters.store.select(parameters.start, parameters.end,
+                                                                                  flag)]
+    else:
+        fields = [f for f in parameters if getattr(f, attribute)]
+
+    extra = getattr(procedure, 'fields', None)
+    if isinstance(extra, dict):
+        fields.extend(f for f in extra.values() if getattr(f, attribute))
+
+    return fields
+
+
+def get_inputs(procedure):
+    """Returns the fields of a procedure which are part of the request body (see 'get_fields').
+
+    Packed fields (see 'FieldStore.pack') are selected from the flags of their store, without creating a view of
+    every field.
+
+    Args:
+        procedure (prpl.apis.hl.com.Procedure): Procedure.
+
+    Returns:
+        list<prpl.apis.hl.com.Field>: Input fields of the procedure.
+
+    """
+
+    return _select(procedure, IS_INPUT, 'is_input')
+
+
+def get_outputs(procedure):
+    """Returns the fields of a procedure which are part of the response body (see 'get_inputs').
+
+    Args:
+        procedure (prpl.apis.hl.com.Procedure): Procedure.
+
+    Returns:
+        list<prpl.apis.hl.com.Field>: Output fields of the procedure.
+
+    """
+
+    return _select(procedure, IS_OUTPUT, 'is_output')
+
+
+class FieldRange:
+    """Contiguous range of a 'FieldStore', usually holding the fields of a single procedure.
+
+    Behaves as a read-only list of 'FieldView' entries.
+
+    """
+
+    __slots__ = ('store', 'start', 'end')
+
+    def __init__(self, store, start, end):
+        """Creates a new field range.
+
+        Args:
+            store (prpl.apis.hl.com.FieldStore): Store holding the fields.
+            start (int): First index of the range.
+            end (int): Index past the end of the range.
+
+        """
+
+        self.store = store
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [FieldView(self.store, i) for i in range(self.start, self.end)[index]]
+
+        return FieldView(self.store, range(self.start, self.end)[index])
+
+    def __iter__(self):
+        store = self.store
+        return (FieldView(store, i) for i in range(self.start, self.end))
+
+    def inputs(self):
+        """Returns the fields which are part of the request body.
+
+        Returns:
+            list<prpl.apis.hl.com.field_store.FieldView>: Input fields.
+
+        """
+
+        return [FieldView(self.store, i) for i in self.store.select(self.start, self.end, IS_INPUT)]
+
+    def outputs(self):
+        """Returns the fields which are part of the response body.
+
+        Returns:
+            list<prpl.apis.hl.com.field_store.FieldView>: Output fields.
+
+        """
+
+        return [FieldView(self.store, i) for i in self.store.select(self.start, self.end, IS_OUTPUT)]
+
+
+def _column_property(column):
+    """Creates a property which reads and writes a 'FieldStore' column."""
+
+    def getter(self):
+        return getattr(self.store, column)[self.index]
+
+    def setter(self, value):
+        getattr(self.store, column)[self.index] = value
+
+    return property(getter, setter)
+
+
+def _flag_property(flag):
+    """Creates a property which reads and writes a 'FieldStore' flag."""
+
+    def getter(self):
+        return bool(self.store.flags[self.index] & flag)
+
+    def setter(self, value):
+        if value:
+            self.store.flags[self.index] |= flag
+        else:
+            self.store.flags[self.index] &= ~flag & 0xFF
+
+    return property(getter, setter)
+
+
+class FieldView:
+    """Lightweight view of a single field held by a 'FieldStore'.
+
+    Exposes the same attributes as 'prpl.apis.hl.com.Field'. Copying a view returns a regular, detached, field.
+
+    """
+
+    __slots__ = ('store', 'index')
+
+    name = _column_property('names')
+    description = _column_property('descriptions')
+    type = _column_property('types')
+    default_value = _column_property('default_values')
+    possible_values = _column_property('possible_values')
+    format = _column_property('formats')
+    notes = _column_property('notes')
+    is_input = _flag_property(IS_INPUT)
+    is_output = _flag_property(IS_OUTPUT)
+
+    def __init__(self, store, index):
+        """Creates a new field view.
+
+        Args:
+            store (prpl.apis.hl.com.FieldStore): Store holding the field.
+            index (int): Index of the field within the store.
+
+        """
+
+        self.store = store
+        self.index = index
+
+    @property
+    def is_required(self):
+        flags = self.store.flags[self.index]
+
+        if flags & IS_REQUIRED:
+            return True
+        if flags & IS_OPTIONAL:
+            return False
+
+        return None
+
+    @is_required.setter
+    def is_required(self, value):
+        flags = self.store.flags[self.index] & ~(IS_REQUIRED | IS_OPTIONAL) & 0xFF
+
+        if value is True:
+            flags |= IS_REQUIRED
+        elif value is False:
+            flags |= IS_OPTIONAL
+
+        self.store.flags[self.index] = flags
+
+    def __str__(self):
+        """Converts object to human-readable string.
+
+        Returns:
+            str: Human-readable representation of HL-API field.
+
+        """
+
+        return self.name
+
+    def __copy__(self):
+        return self.to_field()
+
+    def __deepcopy__(self, memo):
+        return self.to_field()
+
+    def to_field(self):
+        """Converts the view into a regular, detached, field.
+
+        Returns:
+            prpl.apis.hl.com.Field: Copy of the field.
+
+        """
+
+        return Field(self.name, self.description, self.type, self.is_input, self.is_required, self.default_value,
+                     self.is_output, self.possible_values, self.format, self.notes)
@@ -1,5 +1,6 @@
 
+from prpl.apis.hl.factory.string_pool import StringPool
 from prpl.apis.hl.factory.excel_object_factory import ExcelObjectFactory
 from prpl.apis.hl.factory.json_object_factory import JSONObjectFactory
 
-__all__ = ['ExcelObjectFactory', 'JSONObjectFactory']
+__all__ = ['StringPool', 'ExcelObjectFactory', 'JSONObjectFactory']
@@ -1,5 +1,4 @@
 
-from operator import itemgetter
 import logging
 
 from prpl.apis.hl.com import Object as HLAPIObject
@@ -10,6 +9,17 @@ from prpl.apis.hl.com import Instance as HLAPIInstance
 from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
 from prpl.apis.hl.com import Version as HLAPIVersion
 from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.factory.row_sort import SORT_BUDGET, RowCursor, external_sort, get_sort_key
+from prpl.apis.hl.factory.string_pool import StringPool
+from prpl.apis.hl.spec import profiler
+
+# Sort keys of the rows of each sheet. Rows are linked in this order.
+PROCEDURE_KEY = ('Layer', 'Object', 'Method')
+PARAMETER_KEY = ('Layer', 'Object', 'Method', 'Parameter')
+DATA_TYPE_KEY = ('HL-API', 'uBus')
+EVENT_KEY = ('Layer', 'Object', 'Code')
+INSTANCE_KEY = ('Layer', 'Object', 'Instance')
+RESPONSE_CODE_KEY = ('Name',)
 
 
 class ExcelObjectFactory:
@@ -37,9 +47,15 @@ class ExcelObjectFactory:
         factory = HLAPIExcelObjectFactory(procedures, fields, events, instances)
         objects = factory.get_objects()
 
+        # Link rows as they are read, without holding whole sheets in memory (rows must be sorted).
+        factory = HLAPIExcelObjectFactory(parser.iter_sheet('Objects & Methods'), parser.iter_sheet('Parameters'),
+                                          data_types, parser.iter_sheet('Events'), parser.iter_sheet('ToC'),
+                                          response_codes, change_log, presorted=True)
+
     """
 
-    def __init__(self, procedures, parameters, data_types, events, instances, response_codes, change_log):
+    def __init__(self, procedures, parameters, data_types, events, instances, response_codes, change_log,
+                 string_pool=None, presorted=False, sort_budget=SORT_BUDGET):
         """Initializes the HL-API Object factory.
 
         Args:
@@ -49,26 +65,57 @@ class ExcelObjectFactory:
             instances (list<dict>): Array of object instances to be parsed and linked.
             response_codes (list<dict>): Array of response codes to be parsed.
             change_log (list<dict>): Array of changes.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values.
+                Defaults to a new pool, used by this factory only.
+            presorted (bool): Whether the rows are already sorted (see the '*_KEY' sort keys). Rows are then
+                consumed lazily from any iterable, and their order is verified as they arrive, instead of being
+                sorted.
+            sort_budget (int): Maximum number of rows of a sheet sorted in memory. Larger sheets are sorted on disk
+                (see 'prpl.apis.hl.factory.row_sort.external_sort').
 
         """
 
-        self.procedures = sorted(procedures, key=itemgetter('Layer', 'Object', 'Method'))
-        self.parameters = sorted(parameters, key=itemgetter('Layer', 'Object', 'Method', 'Parameter'))
-        self.data_types = sorted(data_types, key=itemgetter('HL-API', 'uBus'))
-        self.events = sorted(events, key=itemgetter('Layer', 'Object', 'Code'))
-        self.instances = sorted(instances, key=itemgetter('Layer', 'Object', 'Instance'))
-        self.response_codes = sorted(response_codes, key=itemgetter('Name'))
+        self.sort_budget = sort_budget
+        self.procedures = self._get_rows(procedures, PROCEDURE_KEY, presorted, 'Procedures')
+        self.parameters = self._get_rows(parameters, PARAMETER_KEY, presorted, 'Fields')
+        self.data_types = self._get_rows(data_types, DATA_TYPE_KEY, presorted, 'Data types')
+        self.events = self._get_rows(events, EVENT_KEY, presorted, 'Events')
+        self.instances = self._get_rows(instances, INSTANCE_KEY, presorted, 'Instances')
+        self.response_codes = self._get_rows(response_codes, RESPONSE_CODE_KEY, presorted, 'Response codes')
         self.change_log = change_log
         self.objects = []
+        self.string_pool = string_pool if string_pool is not None else StringPool()
 
         self.logger = logging.getLogger('ExcelObjectFactory')
 
+    def _get_rows(self, rows, key, presorted, name):
+        """Returns a cursor over sorted rows.
+
+        Rows are compared by a tuple key which tolerates empty cells (see
+        'prpl.apis.hl.factory.row_sort.get_sort_key'), computed once per row.
+
+        Args:
+            rows (iterable<dict>): Raw rows.
+            key (tuple<str>): Names of the columns the rows are sorted by.
+            presorted (bool): Whether the rows are already sorted, in which case their order is only verified.
+            name (str): Name of the rows, used in error messages.
+
+        Returns:
+            prpl.apis.hl.factory.row_sort.RowCursor: Cursor over the sorted rows.
+
+        """
+
+        if presorted:
+            return RowCursor(rows, get_sort_key(key), name)
+
+        return RowCursor(external_sort(rows, get_sort_key(key), self.sort_budget), name=name)
+
     def _get_parameters(self, object_name, procedure_name):
         """Generates a list of HL-API Parameter based on the specified object and procedure names.
 
-        For optimal performance, this method assumes that 'self.parameter' is sorted by object name (ascending).
-        Once a paramete which does not match the object and procedure name is found it returns without processing
-        all entries.
+        For optimal performance, this method assumes that 'self.parameters' is sorted by object name (ascending).
+        Once a parameter which does not match the object and procedure name is found it returns without consuming
+        the remaining rows.
 
         Args:
             object_name (str): Lookup object name.
@@ -81,10 +128,13 @@ class ExcelObjectFactory:
 
         # Init fields array.
         parameters = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate though each field.
-        while len(self.parameters) > 0:
-            f = self.parameters[0]
+        while self.parameters.head is not None:
+            f = self.parameters.head
             # If current object matches the field object link it.
             if object_name == f['Object'] and procedure_name == f['Method']:
                 # Split "Rights" field into "input" and "output" booleans.
@@ -113,23 +163,24 @@ class ExcelObjectFactory:
 
                 # Create new API Field.
                 api_parameters = HLAPIField(
-                    f['Parameter'],
-                    f['Description'],
-                    f['Type'],
+                    intern(f['Parameter']),
+                    intern(f['Description']),
+                    intern(f['Type']),
                     is_input,
                     is_required,
-                    f['Default Value'],
+                    intern(f['Default Value']),
                     is_output,
-                    f['Possible Values'],
-                    f['Format'],
-                    f['Notes'])
+                    intern(f['Possible Values']),
+                    intern(f['Format']),
+                    intern(f['Notes']))
 
                 # Link field to procedure.
                 parameters.append(api_parameters)
-                self.logger.debug('Fields - Added field "{}" ({}).'.format(api_parameters.name, api_parameters.type))
+                if debug:
+                    self.logger.debug('Fields - Added field "%s" (%s).', api_parameters.name, api_parameters.type)
 
-                # Delete the already parsed field from list to speed up the following lookup process.
-                del self.parameters[0]
+                # Consume the already parsed field.
+                self.parameters.pop()
             else:
                 # Exit loop to continue on to the next object.
                 break
@@ -152,19 +203,24 @@ class ExcelObjectFactory:
 
         # Init events array.
         events = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate through each event.
-        while len(self.events) > 0:
-            e = self.events[0]
+        while self.events.head is not None:
+            e = self.events.head
 
             # If the current object matches the event object, link it.
             if object_name == e['Object']:
-                api_event = HLAPIEvent(e['Code'], e['Name'], e['Description'], e['Parameters'])
+                api_event = HLAPIEvent(intern(e['Code']), intern(e['Name']), intern(e['Description']),
+                                       intern(e['Parameters']))
                 events.append(api_event)
-                self.logger.debug('Events - Added event "{}".'.format(api_event.name))
+                if debug:
+                    self.logger.debug('Events - Added event "%s".', api_event.name)
 
-                # Delete the already parsed event from list to speed up the following lookup process.
-                del self.events[0]
+                # Consume the already parsed event.
+                self.events.pop()
             else:
                 # Exit loop to continue on to the next object.
                 break
@@ -188,19 +244,23 @@ class ExcelObjectFactory:
 
         # Init events array.
         instances = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate through each instance.
-        while len(self.instances) > 0:
-            toc = self.instances[0]
+        while self.instances.head is not None:
+            toc = self.instances.head
 
             # If the current object matches the instance object, link it.
             if object_name == toc['Object']:
-                api_instance = HLAPIInstance(toc['Instance'], toc['Description'])
+                api_instance = HLAPIInstance(intern(toc['Instance']), intern(toc['Description']))
                 instances.append(api_instance)
-                self.logger.debug('Instances - Added instance "{}".'.format(api_instance.name))
+                if debug:
+                    self.logger.debug('Instances - Added instance "%s".', api_instance.name)
 
-                # Delete the already parsed instances from list to speed up the following lookup process.
-                del self.instances[0]
+                # Consume the already parsed instance.
+                self.instances.pop()
             else:
                 # Exit loop to continue on to the next object.
                 break
@@ -217,22 +277,27 @@ class ExcelObjectFactory:
         """
 
         self.objects = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate through each procedure.
-        while len(self.procedures) > 0:
-            p = self.procedures[0]
+        while self.procedures.head is not None:
+            p = self.procedures.head
 
-            object_name = p['Object']
+            object_name = intern(p['Object'])
 
             # If the object differs from the last parsed, crease a new instance.
             if len(self.objects) == 0 or object_name != self.objects[-1].name:
                     # Create new API Object.
-                    self.logger.debug(p['Resource'])
-                    api_object = HLAPIObject(p['Layer'], p['Object'], p['Resource'])
+                    if debug:
+                        self.logger.debug(p['Resource'])
+                    api_object = HLAPIObject(p['Layer'], object_name, intern(p['Resource']))
 
                     # Append to list.
                     self.objects.append(api_object)
-                    self.logger.debug('Objects - Created object "{}"'.format(object_name))
+                    if debug:
+                        self.logger.debug('Objects - Created object "%s"', object_name)
 
                     # Parse events and append.
                     api_object.events += self._get_events(object_name)
@@ -241,42 +306,44 @@ class ExcelObjectFactory:
                     api_object.instances += self._get_instances(object_name)
 
             # Create new procedure.
-            api_procedure = HLAPIProcedure(p['Method'], p['Description'], p['Request Body (Sample)'], p['Response Body (Sample)'])
+            api_procedure = HLAPIProcedure(intern(p['Method']), intern(p['Description']),
+                                           intern(p['Request Body (Sample)']), intern(p['Response Body (Sample)']))
 
             # Link it to object.
             api_object.procedures.append(api_procedure)
-            self.logger.debug('Procedures - Added procedure "{}" to "{}".'.format(api_procedure.name, object_name))
+            if debug:
+                self.logger.debug('Procedures - Added procedure "%s" to "%s".', api_procedure.name, object_name)
 
             # Parse fields and append.
             api_procedure.parameters += self._get_parameters(object_name, api_procedure.name)
 
-            # Delete the already parsed procedure from list to speed up the following lookup process.
-            del self.procedures[0]
+            # Consume the already parsed procedure.
+            self.procedures.pop()
 
         self.logger.debug('Objects - All objects and procedures have been successfully linked.')
 
         # Validate if all fields have been parsed.
-        if len(self.parameters) > 0:
+        if self.parameters.head is not None:
             raise Exception('Field "{}" on object "{}" procedure "{}" could not be linked. '
-                            'Please review the spec for errors.'.format(self.parameters[0]['Parameter'],
-                                                                        self.parameters[0]['Object'],
-                                                                        self.parameters[0]['Method']))
+                            'Please review the spec for errors.'.format(self.parameters.head['Parameter'],
+                                                                        self.parameters.head['Object'],
+                                                                        self.parameters.head['Method']))
 
         self.logger.debug('Fields - All fields have been successfully linked.')
 
         # Validate if all events have been parsed.
-        if len(self.events) > 0:
+        if self.events.head is not None:
             raise Exception('Event "{}" on object "{}" could not be linked. '
-                            'Please review the spec for errors.'.format(self.events[0]['Name'],
-                                                                        self.events[0]['Object']))
+                            'Please review the spec for errors.'.format(self.events.head['Name'],
+                                                                        self.events.head['Object']))
 
         self.logger.debug('Events - All events have been successfully linked.')
 
         # Validate if all instances have been parsed.
-        if len(self.instances) > 0:
+        if self.instances.head is not None:
             raise Exception('Instance "{}" on object "{}" could not be linked. '
-                            'Please review the spec for errors.'.format(self.instances[0]['Instance'],
-                                                                        self.instances[0]['Object']))
+                            'Please review the spec for errors.'.format(self.instances.head['Instance'],
+                                                                        self.instances.head['Object']))
 
         self.logger.debug('Instances - All instances have been successfully linked.')
 
@@ -293,18 +360,23 @@ class ExcelObjectFactory:
 
         # Init response codes array.
         codes = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate through each response code.
-        while len(self.response_codes) > 0:
-            rc = self.response_codes[0]
+        while self.response_codes.head is not None:
+            rc = self.response_codes.head
 
             # Create new response code object instance and append.
-            api_code = HLAPIResponseCode(rc['Name'], rc['Description'], rc['Sample'], rc['Raised By'])
+            api_code = HLAPIResponseCode(intern(rc['Name']), intern(rc['Description']), intern(rc['Sample']),
+                                         intern(rc['Raised By']))
             codes.append(api_code)
-            self.logger.debug('Response Codes - Created response code "{}".'.format(api_code.name))
+            if debug:
+                self.logger.debug('Response Codes - Created response code "%s".', api_code.name)
 
-            # Delete parsed response code.
-            del self.response_codes[0]
+            # Consume parsed response code.
+            self.response_codes.pop()
 
         self.logger.debug('Response Codes - All response codes have been successfully linked.')
 
@@ -320,14 +392,17 @@ class ExcelObjectFactory:
         """
 
         versions_list = []
+        intern = self.string_pool.intern
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         while len(self.change_log) > 0:
             version = self.change_log[0]
-            v = HLAPIVersion(version['Number'], version['Date'])
-            v.change_list = version['Changes']
+            v = HLAPIVersion(intern(version['Number']), intern(version['Date']))
+            v.change_list = [(number, intern(change)) for number, change in version['Changes']]
             versions_list.append(v)
-            self.logger.debug('ChangeLog - Added version "{} ({})" with {} changes.'.format(v.number,
-                                                                           v.date,
-                                                                           len(v.change_list)))
+            if debug:
+                self.logger.debug('ChangeLog - Added version "%s (%s)" with %s changes.',
+                                  v.number, v.date, len(v.change_list))
             del self.change_log[0]
 
         return versions_list
@@ -340,10 +415,14 @@ class ExcelObjectFactory:
 
         """
 
-        api_versions = self._get_change_log()
-        api_response_codes = self._get_response_codes()
-        api_objects = self._get_objects()
+        with profiler.span('versions'):
+            api_versions = self._get_change_log()
+        with profiler.span('response_codes'):
+            api_response_codes = self._get_response_codes()
+        with profiler.span('objects'):
+            api_objects = self._get_objects()
 
         api = HLAPI(api_objects, api_response_codes, api_versions)
+        self.logger.info('Strings - %s.', self.string_pool)
 
         return api
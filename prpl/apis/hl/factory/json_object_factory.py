@@ -1,4 +1,6 @@
 
+from collections import namedtuple, OrderedDict
+import json
 import logging
 import re
 
@@ -10,6 +12,13 @@ from prpl.apis.hl.com import Instance as HLAPIInstance
 from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
 from prpl.apis.hl.com import Version as HLAPIVersion
 from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.factory.json_schema_accessor import ProcedureSchema
+from prpl.apis.hl.factory.string_pool import StringPool
+from prpl.apis.hl.spec import profiler
+
+# Immutable description of a flattened field, shared by all procedures with the same property subtree.
+FieldDescriptor = namedtuple('FieldDescriptor', ['name', 'description', 'type', 'is_required', 'default_value',
+                                                 'possible_values', 'format', 'notes'])
 
 
 class JSONObjectFactory:
@@ -24,7 +33,7 @@ class JSONObjectFactory:
 
     """
 
-    def __init__(self, api_json, object_schemas):
+    def __init__(self, api_json, object_schemas, string_pool=None):
         """Initializes the HL-API Object factory.
 
         Args:
@@ -34,11 +43,15 @@ class JSONObjectFactory:
             instances (list<dict>): Array of object instances to be parsed and linked.
             response_codes (list<dict>): Array of response codes to be parsed.
             change_log (list<dict>): Array of changes.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values.
+                Defaults to a new pool, used by this factory only.
 
         """
 
         self.api_json = api_json
         self.object_schemas = object_schemas
+        self.string_pool = string_pool if string_pool is not None else StringPool()
+        self.field_cache = {}
 
         self.logger = logging.getLogger('JSONObjectFactory')
 
@@ -46,14 +59,18 @@ class JSONObjectFactory:
         # iterate over versions in API file and create HL API Objects
 
         versions_list = []
+        intern = self.string_pool.intern
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         for version, value in self.api_json["versions"].items():
             v = HLAPIVersion(
-                version, self.api_json["versions"][version]['date'])
-            v.change_list = self.api_json["versions"][version]['changes']
+                intern(version), intern(self.api_json["versions"][version]['date']))
+            v.change_list = [[number, intern(change)]
+                             for number, change in self.api_json["versions"][version]['changes']]
             versions_list.append(v)
-            self.logger.debug('ChangeLog - Added version "{} ({})" with {} changes.'.format(v.number,
-                                                                                            v.date,
-                                                                                            len(v.change_list)))
+            if debug:
+                self.logger.debug('ChangeLog - Added version "%s (%s)" with %s changes.',
+                                  v.number, v.date, len(v.change_list))
 
         return versions_list
 
@@ -67,6 +84,7 @@ class JSONObjectFactory:
 
         # Init response codes array.
         codes = []
+        intern = self.string_pool.intern
 
         # extract response codes from first API object
         name = list(self.object_schemas.keys())[0]
@@ -74,16 +92,20 @@ class JSONObjectFactory:
         path_name = list(self.object_schemas[name]["paths"].keys())[0]
         responses = self.object_schemas[name]["paths"][path_name]["responses"]
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Iterate through each response code.
         for response_name, response in responses.items():
             if response_name != "99":
 
                 # Create new response code object instance and append.
                 api_code = HLAPIResponseCode(
-                    response_name, response['description'], response['content']['application/json']['example'], response['raised_by'])
+                    intern(response_name), intern(response['description']),
+                    intern(response['content']['application/json']['example']), intern(response['raised_by']))
                 codes.append(api_code)
-                self.logger.debug(
-                    'Response Codes - Created response code "{}".'.format(api_code.name))
+                if debug:
+                    self.logger.debug(
+                        'Response Codes - Created response code "%s".', api_code.name)
 
         self.logger.debug(
             'Response Codes - All response codes have been successfully linked.')
@@ -107,14 +129,18 @@ class JSONObjectFactory:
 
         # Init events array.
         instances = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate through each instance.
         for instance_name, values in instance_entries.items():
 
-            api_instance = HLAPIInstance(instance_name, values['description'])
+            api_instance = HLAPIInstance(intern(instance_name), intern(values['description']))
             instances.append(api_instance)
-            self.logger.debug(
-                'Instances - Added instance "{}".'.format(api_instance.name))
+            if debug:
+                self.logger.debug(
+                    'Instances - Added instance "%s".', api_instance.name)
 
         # Return instances.
         return instances
@@ -138,6 +164,9 @@ class JSONObjectFactory:
 
         # Init events array.
         events = []
+        intern = self.string_pool.intern
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Iterate through each event.
         for name, e in object_schema["events"].items():
@@ -145,19 +174,59 @@ class JSONObjectFactory:
             prefix = "{}_".format(object_name.upper().replace(".", "_"))
             name = "{}".format(name.replace(prefix, ""))
             api_event = HLAPIEvent(
-                e["code"], name, e['description'], e["content"]["application/json"]['example'])
+                intern(e["code"]), intern(name), intern(e['description']),
+                intern(e["content"]["application/json"]['example']))
             events.append(api_event)
-            self.logger.debug(
-                'Events - Added event "{}".'.format(api_event.name))
+            if debug:
+                self.logger.debug(
+                    'Events - Added event "%s".', api_event.name)
 
         # Returns events.
         return events
 
     def _get_field(self, fields, property_name, property_values,
                    is_input, is_output, required_list):
+        """Adds the HL-API Fields described by a (possibly nested) schema property.
+
+        The property subtree is flattened only once per distinct content (e.g.: the 'Body' shared by the 'Get' and
+        'Set' procedures), and the resulting field descriptors are reused for every other procedure.
+
+        Args:
+            fields (dict): Fields of the procedure, indexed by (dotted) name.
+            property_name (str): Name of the property.
+            property_values (dict): Schema of the property.
+            is_input (bool): Whether the fields are part of the request body.
+            is_output (bool): Whether the fields are part of the response body.
+            required_list (list<str>): Names of the required properties.
+
+        """
+
+        key = (property_name, json.dumps(property_values), tuple(required_list))
+
+        descriptors = self.field_cache.get(key)
+        if descriptors is None:
+            descriptors = []
+            self._flatten_field(descriptors, property_name, property_values, required_list)
+            descriptors = tuple(descriptors)
+            self.field_cache[key] = descriptors
+
+        for d in descriptors:
+            # Create new API Field.
+            fields[d.name] = HLAPIField(d.name, d.description, d.type, is_input, d.is_required, d.default_value,
+                                        is_output, d.possible_values, d.format, d.notes)
+
+    def _flatten_field(self, descriptors, property_name, property_values, required_list):
+        """Flattens a (possibly nested) schema property into a list of field descriptors.
 
-        # print(property_values)
-                                # check if we are dealing with a nested object
+        Args:
+            descriptors (list<FieldDescriptor>): Descriptors found so far.
+            property_name (str): Name of the property.
+            property_values (dict): Schema of the property.
+            required_list (list<str>): Names of the required properties.
+
+        """
+
+        # check if we are dealing with a nested object
         if "properties" in property_values.keys() or property_values["type"] == "object":
 
             # if so, iterate through sub objects
@@ -170,8 +239,8 @@ class JSONObjectFactory:
                     combined_name = sp_name
 
                 # recursively call this function
-                self._get_field(
-                    fields, combined_name, property_values["properties"][sp_name], is_input, is_output, property_values["required"])
+                self._flatten_field(
+                    descriptors, combined_name, property_values["properties"][sp_name], property_values["required"])
         else:
             # otherwise, proceed to add new field
 
@@ -203,75 +272,66 @@ class JSONObjectFactory:
             if notes == "":
                 notes = "-"
 
-            # Create new API Field.
-            api_field = HLAPIField(
-                property_name,
-                description,
-                property_values['type'],
-                is_input,
+            # Create new field descriptor.
+            intern = self.string_pool.intern
+            descriptors.append(FieldDescriptor(
+                intern(property_name),
+                intern(description),
+                intern(property_values['type']),
                 is_required,
-                default_value,
-                is_output,
-                possible_values,
-                field_format,
-                notes)
+                intern(default_value),
+                intern(possible_values),
+                intern(field_format),
+                intern(notes)))
 
-            # set new field to object
-            fields[property_name] = api_field
-
-    def _get_fields(self, procedure_name, path_schema):
+    def _get_fields(self, procedure_name, path_schema, procedure_schema=None):
         """Generates a list of HL-API Fields based on the specified object and procedure names.
 
-        For optimal performance, this method assumes that 'self.fields' is sorted by object name (ascending).
-        Once a field which does not match the object and procedure name is found it returns without processing
-        all entries.
+        The request and response schemas (and their required lists) are resolved once per procedure through a
+        'ProcedureSchema', instead of walking the path schema again for every property.
 
         Args:
             procedure_name (str): procedure name.
             path_schema (str): JSON schema for the procedure.
+            procedure_schema (prpl.apis.hl.factory.json_schema_accessor.ProcedureSchema): Already resolved schema.
+                Resolved from 'path_schema' if not specified.
 
         Returns:
             list<prpl.apis.hl.com.Field>: List of fields which matched the specified object and procedure names.
 
         """
 
+        if procedure_schema is None:
+            procedure_schema = ProcedureSchema(path_schema)
+
         # Init fields dictionary.
         fields = {}
 
         # check if we have a request body and add fields from schema
-        if "requestBody" in path_schema.keys():
+        if procedure_schema.request_properties is not None:
+            required_list = procedure_schema.request_required
 
             # iterate over each property and add accordingly
-            for property_name, property_values in path_schema["requestBody"]["content"]["application/json"]["schema"]["properties"].items():
-
-                # for easier reading this is initialized up here
-                is_input = True
-                is_output = False
-
-                self._get_field(fields, property_name, property_values, is_input, is_output,
-                                path_schema["requestBody"]["content"]["application/json"]["schema"]["required"])
-        # check response with code 99 and add fields from schema
-        # iterate over each property and add accordingly
-        for property_name, property_values in path_schema["responses"]["OK"]["content"]["application/json"]["schema"]["allOf"][1]["properties"].items():
+            for property_name, property_values in procedure_schema.request_properties.items():
+                self._get_field(fields, property_name, property_values, True, False, required_list)
 
-            # for easier reading this is initialized up here
-            is_input = False
-            is_output = True
+        # iterate over each response property and add accordingly
+        required_list = procedure_schema.response_body_required
+        for property_name, property_values in procedure_schema.response_properties.items():
 
             # check if we already have an input parameter with the same name
             # if not, create a completely new field
-            if not property_name in fields.keys():
-                self._get_field(fields, property_name, property_values, is_input, is_output,
-                                path_schema["responses"]["OK"]["content"]["application/json"]["schema"]["allOf"][1]["properties"]["Body"]["required"])
+            if property_name not in fields:
+                self._get_field(fields, property_name, property_values, False, True, required_list)
             else:
                 # if yes, update existing field
                 # set field to also be an output field
                 fields[property_name].is_output = True
 
                 # check required, if it is true, set it on the existing property
-                if property_name in path_schema["responses"]["OK"]["content"]["application/json"]["schema"]["required"]:
+                if property_name in procedure_schema.response_required:
                     fields[property_name].is_required = True
-        
+
         return fields
 
     def _get_objects(self):
@@ -283,35 +343,40 @@ class JSONObjectFactory:
         """
 
         objects = []
+        intern = self.string_pool.intern
 
-        # Iterate through each procedure.
-        for object_name, object_schema in self.object_schemas.items():
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-            # iterate over paths to find all root objects
-            object_names = []
-            for p in object_schema["paths"].keys():
-                name = p[0:p.rfind(".")]
-                if name not in object_names:
-                    object_names.append(name)
+        # Iterate through each object file.
+        for object_name, object_schema in self.object_schemas.items():
 
-            for o in object_names:
+            paths = object_schema["paths"]
+            if len(paths) == 0:
+                continue
 
-                schema = object_schema["components"]["schemas"][object_name]
+            schema = object_schema["components"]["schemas"][object_name]
 
-                procedure = list(object_schema["paths"].keys())[0]
+            # The resource is taken from the first path of the file.
+            # resource = re.sub(
+                # r'\{.+?\}\s?', "", paths[procedure]["tags"][0].replace(".", " "))
+            resource = intern(paths[next(iter(paths))]["tags"][0])
 
-                # Create new API Object.
+            # bucket paths by their owning object name (accounting for instance methods)
+            object_paths = OrderedDict()
+            for procedure_name, p in paths.items():
+                name = procedure_name[0:procedure_name.rfind(".")]
+                object_paths.setdefault(name, []).append((procedure_name, p))
 
-                # resource = re.sub(
-                    # r'\{.+?\}\s?', "", object_schema["paths"][procedure]["tags"][0].replace(".", " "))
-                resource = object_schema["paths"][procedure]["tags"][0]
+            for o, procedures in object_paths.items():
 
-                api_object = HLAPIObject(schema["layer"], o, resource)
+                # Create new API Object.
+                api_object = HLAPIObject(schema["layer"], intern(o), resource)
 
                 # Append to list.
                 objects.append(api_object)
-                self.logger.debug(
-                    'Objects - Created object "{}"'.format(o))
+                if debug:
+                    self.logger.debug(
+                        'Objects - Created object "%s"', o)
 
                 # if we are parsing a first level object,
                 # Parse events and append.
@@ -325,36 +390,25 @@ class JSONObjectFactory:
                     api_object.instances += self._get_instances(
                         object_schema["instances"])
 
-                for procedure_name, p in object_schema["paths"].items():
-                    p_name = procedure_name.split(".")[-1]
-                    
-                    # check if the procedure belongs to this object name (accounting for instance methods)
-                    if procedure_name[0:procedure_name.rfind(".")] == o:
-
-                        # collect info about procedure
-
-                        if "requestBody" not in p:
-                            request_example = "-"
-                        else:
-                            request_example = p["requestBody"]["content"]["application/json"]["example"]
+                for procedure_name, p in procedures:
+                    p_name = procedure_name[procedure_name.rfind(".") + 1:]
 
-                        if "responses" not in p:
-                            response_example = "-"
-                        else:
-                            response_example = p["responses"]["OK"]["content"]["application/json"]["example"]
+                    # collect info about procedure
+                    procedure_schema = ProcedureSchema(p)
 
-                        # Create new procedure.
-                        api_procedure = HLAPIProcedure(
-                            p_name, p['summary'], request_example, response_example)
+                    # Create new procedure.
+                    api_procedure = HLAPIProcedure(
+                        intern(p_name), intern(p['summary']), intern(procedure_schema.request_example),
+                        intern(procedure_schema.response_example))
 
-                        # Link it to object.
-                        api_object.procedures.append(api_procedure)
+                    # Link it to object.
+                    api_object.procedures.append(api_procedure)
+                    if debug:
                         self.logger.debug(
-                            'Procedures - Added procedure "{}" to "{}".'.format(
-                                api_procedure.name, o))
+                            'Procedures - Added procedure "%s" to "%s".', api_procedure.name, o)
 
-                        # Parse fields and append.
-                        api_procedure.fields = self._get_fields(p_name, p)
+                    # Parse fields and append.
+                    api_procedure.fields = self._get_fields(p_name, p, procedure_schema)
 
         return objects
 
@@ -366,12 +420,16 @@ class JSONObjectFactory:
 
         """
 
-        api_versions = self._get_change_log()
+        with profiler.span('versions'):
+            api_versions = self._get_change_log()
 
-        api_response_codes = self._get_response_codes()
+        with profiler.span('response_codes'):
+            api_response_codes = self._get_response_codes()
 
-        api_objects = self._get_objects()
+        with profiler.span('objects'):
+            api_objects = self._get_objects()
 
         api = HLAPI(api_objects, api_response_codes, api_versions)
+        self.logger.info('Strings - %s.', self.string_pool)
 
         return api
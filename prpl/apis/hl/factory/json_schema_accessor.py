@@ -0,0 +1,199 @@
+from functools import reduce
+from operator import getitem
+
+_MISSING = object()
+
+
+class JSONPointer:
+    """Precompiled JSON pointer (RFC 6901).
+
+    The pointer is tokenized once into a tuple of keys (array indexes for numeric tokens), so resolving it is a plain
+    chain of subscripts, like the equivalent hand-written lookup (e.g.: 'schema["allOf"][1]["properties"]').
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.factory.json_schema_accessor import JSONPointer
+
+        # Compile pointer.
+        pointer = JSONPointer('/responses/OK/content/application~1json/schema')
+
+        # Resolve it against a procedure path schema.
+        schema = pointer.resolve(path_schema)
+
+        # Or, on hot paths where the pointer is known to match.
+        schema = pointer.get(path_schema)
+
+    """
+
+    __slots__ = ('pointer', 'tokens', 'keys')
+
+    def __init__(self, pointer):
+        """Compiles a JSON pointer.
+
+        Args:
+            pointer (str): JSON pointer (e.g.: '/allOf/1/properties').
+
+        """
+
+        self.pointer = pointer
+        self.tokens = []
+
+        if pointer != '':
+            if pointer[0] != '/':
+                raise Exception('Invalid JSON pointer "{}".'.format(pointer))
+
+            for token in pointer[1:].split('/'):
+                key = token.replace('~1', '/').replace('~0', '~')
+                index = int(key) if key.isdigit() else None
+                self.tokens.append((key, index))
+
+        self.tokens = tuple(self.tokens)
+
+        # Numeric tokens are used as array indexes, 'resolve' falls back to '_walk' for objects with numeric keys.
+        self.keys = tuple(key if index is None else index for key, index in self.tokens)
+
+    def __str__(self):
+        """Converts pointer to human-readable string.
+
+        Returns:
+            str: JSON pointer.
+
+        """
+
+        return self.pointer
+
+    def get(self, document):
+        """Resolves the pointer, assuming that numeric tokens are array indexes.
+
+        Args:
+            document (dict|list): JSON document.
+
+        Returns:
+            object: Referenced value. 'KeyError', 'IndexError' or 'TypeError' is raised if the pointer does not match.
+
+        """
+
+        return reduce(getitem, self.keys, document)
+
+    def _walk(self, document):
+        """Resolves the pointer token by token, telling arrays and objects apart.
+
+        Args:
+            document (dict|list): JSON document.
+
+        Returns:
+            object: Referenced value.
+
+        """
+
+        node = document
+        for key, index in self.tokens:
+            if index is not None and isinstance(node, list):
+                node = node[index]
+            else:
+                node = node[key]
+
+        return node
+
+    def resolve(self, document, default=_MISSING):
+        """Resolves the pointer against a document.
+
+        Args:
+            document (dict|list): JSON document.
+            default (object): Value to return if the pointer cannot be resolved.
+                If not specified, a 'KeyError' is raised instead.
+
+        Returns:
+            object: Referenced value.
+
+        """
+
+        try:
+            return self.get(document)
+        except (KeyError, IndexError, TypeError):
+            pass
+
+        try:
+            return self._walk(document)
+        except (KeyError, IndexError, TypeError):
+            if default is _MISSING:
+                raise KeyError('Unable to resolve JSON pointer "{}".'.format(self.pointer))
+            return default
+
+
+# Pointers relative to a procedure path schema, as written by the 'JSONSchemaWriter'.
+REQUEST_CONTENT = JSONPointer('/requestBody/content/application~1json')
+RESPONSE_CONTENT = JSONPointer('/responses/OK/content/application~1json')
+
+# Pointers relative to a response schema.
+RESPONSE_PROPERTIES = JSONPointer('/allOf/1/properties')
+RESPONSE_REQUIRED = JSONPointer('/required')
+
+
+class ProcedureSchema:
+    """Resolved view of a procedure path schema.
+
+    Looks up the request schema, response schema, their properties, required lists and examples once, so that
+    consumers iterating over the properties do not walk the path schema again for every property.
+
+    Missing response 'Body' and 'required' lists resolve to empty lists (i.e.: no required properties), where the
+    factory used to raise a 'KeyError'.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.factory.json_schema_accessor import ProcedureSchema
+
+        # Resolve schema.
+        schema = ProcedureSchema(object_schema["paths"]["User.Accounts.{AccountId}.Set"])
+
+        for name, values in schema.response_properties.items():
+            pass
+
+    """
+
+    __slots__ = ('request_schema', 'request_properties', 'request_required', 'request_example',
+                 'response_schema', 'response_properties', 'response_body_required', 'response_example')
+
+    def __init__(self, path_schema):
+        """Resolves a procedure path schema.
+
+        Args:
+            path_schema (dict): JSON schema of the procedure.
+
+        """
+
+        # Request.
+        if "requestBody" in path_schema:
+            content = REQUEST_CONTENT.get(path_schema)
+            self.request_schema = content["schema"]
+            self.request_properties = self.request_schema["properties"]
+            self.request_required = self.request_schema["required"]
+            self.request_example = content["example"]
+        else:
+            self.request_schema = None
+            self.request_properties = None
+            self.request_required = []
+            self.request_example = "-"
+
+        # Response.
+        if "responses" in path_schema:
+            content = RESPONSE_CONTENT.get(path_schema)
+            self.response_schema = content["schema"]
+            self.response_properties = RESPONSE_PROPERTIES.get(self.response_schema)
+            body = self.response_properties.get("Body")
+            self.response_body_required = body["required"] if body is not None else []
+            self.response_example = content["example"]
+        else:
+            self.response_schema = None
+            self.response_properties = None
+            self.response_body_required = []
+            self.response_example = "-"
+
+    @property
+    def response_required(self):
+        """list<str>: Required properties of the response schema itself (only needed for request/response clashes)."""
+
+        if self.response_schema is None:
+            return []
+
+        return RESPONSE_REQUIRED.resolve(self.response_schema, [])
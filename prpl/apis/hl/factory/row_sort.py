@@ -0,0 +1,188 @@
+
+from numbers import Number
+from operator import itemgetter
+import heapq
+import pickle
+import tempfile
+
+# Maximum number of rows sorted in memory. Larger inputs are sorted in runs of this size, spilled to temporary files.
+SORT_BUDGET = 100000
+
+
+class RowCursor:
+    """Cursor over sorted raw rows (e.g.: the rows of an Excel sheet), which are consumed from the front.
+
+    Rows may come from a list or be read lazily from any iterable, one row at a time. When a sort key is given, rows
+    are checked as they arrive and an exception is raised as soon as one is out of order.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.factory.row_sort import RowCursor
+
+        # Consume the rows of the first object.
+        cursor = RowCursor(rows)
+        while cursor.head is not None and cursor.head['Object'] == 'User.Accounts':
+            row = cursor.pop()
+
+    """
+
+    def __init__(self, rows, key=None, name='Rows'):
+        """Creates a new cursor.
+
+        Args:
+            rows (iterable<dict>): Rows to be consumed.
+            key (callable): Sort key of a row, used to verify the order of the rows. Defaults to no verification.
+            name (str): Name of the rows (e.g.: the sheet name), used in error messages.
+
+        """
+
+        self.rows = iter(rows)
+        self.key = key
+        self.name = name
+        self.head = next(self.rows, None)
+
+    def pop(self):
+        """Consumes the first row.
+
+        Returns:
+            dict: First row.
+
+        """
+
+        row = self.head
+        self.head = next(self.rows, None)
+
+        if self.key is not None and self.head is not None and self.key(self.head) < self.key(row):
+            raise Exception('{} are not sorted (row "{}" follows "{}").'.format(
+                self.name, self.key(self.head), self.key(row)))
+
+        return row
+
+
+def get_sort_key(columns):
+    """Returns a sort key of rows, made of the values of the specified columns.
+
+    Unlike 'operator.itemgetter', the key is safe to compare when columns are empty ('None') or hold values of
+    different types (e.g.: numeric and textual event codes in merged specifications): numbers come first, then any
+    other value (compared as text), then empty cells.
+
+    Args:
+        columns (tuple<str>): Names of the columns the rows are sorted by.
+
+    Returns:
+        callable: Function returning the key (a tuple) of a row.
+
+    """
+
+    getter = itemgetter(*columns)
+
+    def get_value(value):
+        if value.__class__ is str:
+            return 1, value
+        if value is None:
+            return 2, ''
+        if isinstance(value, Number):
+            return 0, value
+
+        return 1, str(value)
+
+    if len(columns) == 1:
+        def get_key(row):
+            return get_value(getter(row)),
+    else:
+        def get_key(row):
+            return tuple([get_value(v) for v in getter(row)])
+
+    return get_key
+
+
+def check_sorted(rows, key):
+    """Checks if rows are sorted, without holding more than two of them in memory.
+
+    Args:
+        rows (iterable<dict>): Rows to be checked.
+        key (callable): Sort key of a row.
+
+    Returns:
+        tuple: Whether the rows are sorted, and the number of rows.
+
+    """
+
+    count = 0
+    is_sorted = True
+    last = None
+
+    for row in rows:
+        current = key(row)
+        if count > 0 and current < last:
+            is_sorted = False
+        last = current
+        count += 1
+
+    return is_sorted, count
+
+
+def _write_run(entries):
+    """Sorts (key, row) entries and writes them to a temporary file, one pickled entry after the other."""
+
+    entries.sort(key=itemgetter(0))
+
+    run = tempfile.TemporaryFile()
+    for entry in entries:
+        pickle.dump(entry, run, pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+
+    return run
+
+
+def _read_run(run):
+    """Reads back the (key, row) entries of a temporary file written by '_write_run'."""
+
+    while True:
+        try:
+            yield pickle.load(run)
+        except EOFError:
+            return
+
+
+def external_sort(rows, key, run_size=SORT_BUDGET):
+    """Sorts rows on disk, holding at most 'run_size' rows (plus one row per run) in memory.
+
+    Rows are split into sorted runs written to temporary files, which are then merged lazily. Rows which fit in a
+    single run are sorted in memory instead. The key of each row is computed once, and stored next to the row in the
+    runs, so that merging does not compute it again. The sort is stable.
+
+    Args:
+        rows (iterable<dict>): Rows to be sorted.
+        key (callable): Sort key of a row.
+        run_size (int): Number of rows of each run.
+
+    Yields:
+        dict: Rows, in sorted order.
+
+    """
+
+    runs = []
+    try:
+        chunk = []
+        for row in rows:
+            chunk.append((key(row), row))
+            if len(chunk) == run_size:
+                runs.append(_write_run(chunk))
+                chunk = []
+
+        if len(runs) == 0:
+            chunk.sort(key=itemgetter(0))
+            for entry in chunk:
+                yield entry[1]
+            return
+
+        if len(chunk) > 0:
+            runs.append(_write_run(chunk))
+        del chunk
+
+        for entry in heapq.merge(*[_read_run(run) for run in runs], key=itemgetter(0)):
+            yield entry[1]
+    finally:
+        for run in runs:
+            run.close()
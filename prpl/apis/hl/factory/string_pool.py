@@ -0,0 +1,114 @@
+
+import sys
+
+
+class StringPool:
+    """Interning pool for repeated HL-API string values.
+
+    Both 'ExcelObjectFactory' and 'JSONObjectFactory' route every string they store on the HL-API Python objects
+    through a pool, so that equal values (e.g.: type names, '-' placeholders, object and procedure names) share a
+    single copy in memory. Each factory uses its own pool by default, so that strings are released with the API
+    they belong to; a pool may also be shared explicitly (e.g.: 'SHARED_STRING_POOL'), to deduplicate strings across
+    several parsed APIs which are kept in memory together.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.factory import StringPool as HLAPIStringPool
+
+        # Create a pool and share it between factories.
+        pool = HLAPIStringPool()
+        name = pool.intern('String')
+
+        # Print memory report.
+        print(pool.get_report())
+
+    """
+
+    def __init__(self):
+        """Creates a new, empty, string pool."""
+
+        self.strings = {}
+        self.lookups = 0
+        self.duplicates = 0
+        self.saved_bytes = 0
+
+    def __len__(self):
+        """Returns the number of unique strings held by the pool.
+
+        Returns:
+            int: Number of unique strings.
+
+        """
+
+        return len(self.strings)
+
+    def __str__(self):
+        """Converts the memory report to a human-readable string.
+
+        Returns:
+            str: Human-readable representation of the pool statistics.
+
+        """
+
+        report = self.get_report()
+
+        return '{} unique strings ({} bytes), {} of {} lookups deduplicated ({} bytes saved)'.format(
+            report['unique'], report['pool_bytes'], report['duplicates'], report['lookups'], report['saved_bytes'])
+
+    def intern(self, value):
+        """Returns the pooled copy of the specified value.
+
+        Non-string values (e.g.: 'None', layer numbers or booleans) are returned untouched.
+
+        Args:
+            value (object): Value to be interned.
+
+        Returns:
+            object: Pooled string equal to value, or value itself if it is not a string.
+
+        """
+
+        if type(value) is not str:
+            return value
+
+        self.lookups += 1
+
+        pooled = self.strings.setdefault(value, value)
+
+        # Only count values which are actually dropped in favour of the pooled copy.
+        if pooled is not value:
+            self.duplicates += 1
+            self.saved_bytes += sys.getsizeof(value)
+
+        return pooled
+
+    def get_report(self):
+        """Generates a memory report of the pool.
+
+        Returns:
+            dict: Number of unique strings ('unique') and the bytes they use ('pool_bytes'), number of interned
+                values ('lookups'), number of duplicated copies dropped ('duplicates') and the bytes they used to
+                take ('saved_bytes').
+
+        """
+
+        return {
+            'unique': len(self.strings),
+            'pool_bytes': sum(map(sys.getsizeof, self.strings)),
+            'lookups': self.lookups,
+            'duplicates': self.duplicates,
+            'saved_bytes': self.saved_bytes
+        }
+
+    def clear(self):
+        """Drops all pooled strings and resets the statistics."""
+
+        self.strings = {}
+        self.lookups = 0
+        self.duplicates = 0
+        self.saved_bytes = 0
+
+
+# Pool shared across parses, for callers which opt in (e.g.: the jobs of a batch worker process). It is never cleared,
+# so it holds every string it has seen.
+SHARED_STRING_POOL = StringPool()
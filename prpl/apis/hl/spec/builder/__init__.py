@@ -1,6 +1,30 @@
 
-from prpl.apis.hl.spec.builder.word_writer import WordWriter
-from prpl.apis.hl.spec.builder.json_writer import JSONSchemaWriter
-from prpl.apis.hl.spec.builder.excel_writer import ExcelWriter
+import importlib
 
-__all__ = ['WordWriter', 'JSONSchemaWriter', 'ExcelWriter']
+# Writers are imported on first access, so that heavy backends (e.g.: python-docx for the 'WordWriter', openpyxl for
+# the 'ExcelWriter') are only loaded when the matching format is used.
+_WRITERS = {
+    'WordWriter': 'prpl.apis.hl.spec.builder.word_writer',
+    'JSONSchemaWriter': 'prpl.apis.hl.spec.builder.json_writer',
+    'ExcelWriter': 'prpl.apis.hl.spec.builder.excel_writer',
+    'SnapshotWriter': 'prpl.apis.hl.spec.builder.snapshot_writer',
+    'SQLiteWriter': 'prpl.apis.hl.spec.builder.sqlite_writer',
+    'ValidatorWriter': 'prpl.apis.hl.spec.builder.validator_writer',
+}
+
+__all__ = ['WordWriter', 'JSONSchemaWriter', 'ExcelWriter', 'SnapshotWriter', 'SQLiteWriter', 'ValidatorWriter']
+
+
+def __getattr__(name):
+    module = _WRITERS.get(name)
+    if module is None:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    writer = getattr(importlib.import_module(module), name)
+    globals()[name] = writer
+
+    return writer
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
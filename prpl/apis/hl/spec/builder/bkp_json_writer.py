@@ -38,13 +38,13 @@ class JSONSchemaWriter:
         # Load template styles.
         
         # Remove old folder.
-        self.logger.debug('File - Removing previous files "{}".'.format(self.folder))
+        self.logger.debug('File - Removing previous files "%s".', self.folder)
         # try:
         shutil.rmtree(self.folder)
         # except Exception as e:
             # self.logger.debug("ran into an exception removing old files")
 
-        self.logger.debug('File - Finished removing files "{}".'.format(self.folder))
+        self.logger.debug('File - Finished removing files "%s".', self.folder)
 
         # create new folder
         os.mkdir(self.folder)
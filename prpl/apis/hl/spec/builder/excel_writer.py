@@ -9,6 +9,8 @@ from openpyxl.styles import Font, PatternFill,\
     NamedStyle, Border, Side, Alignment
 from openpyxl.styles.fills import FILL_SOLID
 
+from prpl.apis.hl.spec import profiler
+
 SAMPLE_STUB = {"Header": {"Name": "OK"}}
 
 HEADLINESTYLE = NamedStyle(name="headline")
@@ -714,11 +716,13 @@ class ExcelWriter:
 
         wb = Workbook()
 
-        self.makeChangeLogSheet(wb)
+        with profiler.span('change_log'):
+            self.makeChangeLogSheet(wb)
 
         self.createSheets(wb)
 
-        self.iterateThroughObjects(wb)
+        with profiler.span('objects'):
+            self.iterateThroughObjects(wb)
 
         # self.makeFieldsSheet(wb)
 
@@ -728,4 +732,5 @@ class ExcelWriter:
 
         number = self.api.get_version()
 
-        wb.save("{}/Prpl-SSI-API_v{}.xlsx".format(self.targetFolder, number))
+        with profiler.span('save'):
+            wb.save("{}/Prpl-SSI-API_v{}.xlsx".format(self.targetFolder, number))
@@ -8,6 +8,10 @@ import json
 from json import JSONDecodeError
 import copy
 
+from prpl.apis.hl.com.field_store import get_inputs, get_outputs
+from prpl.apis.hl.spec import profiler
+from prpl.apis.hl.spec.builder import templates
+
 PATH_PARAMETER_TEMPLATE = {
     "in": "path",
     "name": "",
@@ -56,10 +60,8 @@ class JSONSchemaWriter:
         self.template = os.path.abspath(
             os.path.join(os.path.dirname(__file__), template))
 
-        f = open(os.path.abspath(os.path.join(
-            os.path.dirname(__file__), object_template)), "r")
-        self.objectTemplateString = f.read()
-        f.close()
+        self.objectTemplateString = templates.read_text(os.path.abspath(os.path.join(
+            os.path.dirname(__file__), object_template)))
 
         self.jsonResponses = None
         self.objects_and_paths = {}
@@ -71,22 +73,20 @@ class JSONSchemaWriter:
 
         # Remove old folder.
         self.logger.debug(
-            'File - Removing previous files "{}".'.format(self.folder))
+            'File - Removing previous files "%s".', self.folder)
         try:
             shutil.rmtree(self.folder)
         except Exception as e:
             self.logger.debug("ran into an exception removing old files")
 
         self.logger.debug(
-            'File - Finished removing files "{}".'.format(self.folder))
+            'File - Finished removing files "%s".', self.folder)
 
         # create new folder
         os.makedirs(self.folder)
 
         # load template into object
-        f = open(self.template, "r")
-        self.json_api_object = json.loads(f.read())
-        f.close()
+        self.json_api_object = json.loads(templates.read_text(self.template))
 
         self.objects_only = False
 
@@ -319,7 +319,7 @@ class JSONSchemaWriter:
             try:
                 r_sample = json.dumps(json.loads(r.sample))
             except JSONDecodeError as e:
-                log.info('Running fun_test ! {}\n{}'.format(e, r.sample))
+                log.info('Running fun_test ! %s\n%s', e, r.sample)
                 print("error ")
 
             self.jsonResponses[r.name] = {
@@ -380,14 +380,13 @@ class JSONSchemaWriter:
                                           collect_request_parameters):
         schema = {"properties": {}, "required": []}
 
-        for f in procedure.parameters:
-            if (collect_request_parameters and f.is_input) or\
-                    (not collect_request_parameters and f.is_output):
-                if "." in f.name:
-                    self.getNestedProperty(f, schema)
+        fields = get_inputs(procedure) if collect_request_parameters else get_outputs(procedure)
+        for f in fields:
+            if "." in f.name:
+                self.getNestedProperty(f, schema)
 
-                else:
-                    self.getSimpleProperty(f, schema)
+            else:
+                self.getSimpleProperty(f, schema)
 
         return schema
 
@@ -550,18 +549,20 @@ class JSONSchemaWriter:
 
             # add schemas
             # TODO: this changes the field.name
-            out["components"]["schemas"][name] = self.getSchema(name, idx, obj)
-            if (self.objects_only):
-                object_schemas[name] = json.loads(
-                    json.dumps(out["components"]["schemas"][name]))
-            out = self.fillResponseSchema(out)
+            with profiler.span('object/schema'):
+                out["components"]["schemas"][name] = self.getSchema(name, idx, obj)
+                if (self.objects_only):
+                    object_schemas[name] = json.loads(
+                        json.dumps(out["components"]["schemas"][name]))
+                out = self.fillResponseSchema(out)
 
             # add paths
-            if out["paths"] is None:
-                out["paths"] = self.getPaths(name, idx, obj)
-            else:
-                out["paths"] = {**out["paths"], **
-                                self.getPaths(name, idx, obj)}
+            with profiler.span('object/paths'):
+                if out["paths"] is None:
+                    out["paths"] = self.getPaths(name, idx, obj)
+                else:
+                    out["paths"] = {**out["paths"], **
+                                    self.getPaths(name, idx, obj)}
 
             if len(obj.instances) > 0:
                 out["instances"] = self.getInstances(obj)
@@ -572,12 +573,11 @@ class JSONSchemaWriter:
             self.json_api_object["components"]["schemas"].update(
                 {name: {"$ref": "{}.json#/components/schemas/{}"
                         .format(name, name)}})
-            self.writeFile(name, out)
+            with profiler.span('object/write'):
+                self.writeFile(name, out)
 
             if (self.objects_only):
-                f = open(self.template, "r")
-                objects_only = json.loads(f.read())
-                f.close()
+                objects_only = json.loads(templates.read_text(self.template))
 
                 del objects_only["components"]["schemas"]["ListRequest"]
                 objects_only["components"]["schemas"] = object_schemas
@@ -0,0 +1,180 @@
+
+from array import array
+import logging
+import os
+import sys
+
+from prpl.apis.hl.spec.snapshot_format import MAGIC, FORMAT_VERSION, HEADER, BYTE_ORDERS,\
+    KIND_STR, KIND_INT, KIND_FLOAT, REF_NONE, REF_FALSE, REF_TRUE, REF_BASE, LAYOUT_PARAMETERS, LAYOUT_FIELDS
+
+
+class SnapshotWriter:
+    """Binary snapshot writer for prpl HL-API.
+
+    Serializes a linked API (objects, procedures, fields, events, instances, response codes and versions) into a
+    compact binary file, which can be loaded back by 'prpl.apis.hl.spec.parser.SnapshotReader' without parsing
+    the original specification again.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.builder import SnapshotWriter as HLAPISnapshotWriter
+
+        # Load API.
+        writer = HLAPISnapshotWriter(api, 'specs/generated/snapshot/prpl HL-API ({}).hlapi'.format(api.get_version()))
+
+        # Write snapshot.
+        writer.build()
+
+    """
+
+    def __init__(self, api, file):
+        """Initializes the snapshot writer.
+
+        Args:
+            api (prpl.apis.hl.com.api): API to be serialized.
+            file (str): Target filename for the snapshot.
+
+        """
+
+        self.api = api
+        self.file = file
+
+        self.values = {}
+        self.kinds = array('B')
+        self.texts = []
+        self.graph = array('I')
+
+        # Init logger.
+        self.logger = logging.getLogger('SnapshotWriter')
+
+    def _ref(self, value):
+        """Returns the reference of a value, adding it to the value table if needed.
+
+        Args:
+            value (object): Value to be referenced ('None', bool, str, int or float).
+
+        Returns:
+            int: Value reference.
+
+        """
+
+        if value is None:
+            return REF_NONE
+        if value is True:
+            return REF_TRUE
+        if value is False:
+            return REF_FALSE
+
+        key = (type(value), value)
+        ref = self.values.get(key)
+
+        if ref is None:
+            if isinstance(value, str):
+                self.kinds.append(KIND_STR)
+                self.texts.append(value)
+            elif isinstance(value, int):
+                self.kinds.append(KIND_INT)
+                self.texts.append(str(value))
+            elif isinstance(value, float):
+                self.kinds.append(KIND_FLOAT)
+                self.texts.append(repr(value))
+            else:
+                raise Exception('Value "{}" of type "{}" cannot be stored on a snapshot.'.format(
+                    value, type(value).__name__))
+
+            ref = REF_BASE + len(self.values)
+            self.values[key] = ref
+
+        return ref
+
+    def _append(self, *values):
+        """Appends the references of the specified values to the graph."""
+
+        self.graph.extend(map(self._ref, values))
+
+    def _append_fields(self, fields):
+        """Appends a list of fields to the graph."""
+
+        self.graph.append(len(fields))
+        for f in fields:
+            self._append(f.name, f.description, f.type, f.is_input, f.is_required, f.default_value, f.is_output,
+                         f.possible_values, f.format, f.notes)
+
+    def _write_graph(self):
+        """Flattens the API into the graph section."""
+
+        graph = self.graph
+
+        graph.append(len(self.api.versions))
+        for v in self.api.versions:
+            self._append(v.number, v.date)
+            graph.append(len(v.change_list))
+            for number, change in v.change_list:
+                self._append(number, change)
+
+        graph.append(len(self.api.response_codes))
+        for rc in self.api.response_codes:
+            self._append(rc.name, rc.description, rc.sample, rc.raised_by)
+
+        graph.append(len(self.api.objects))
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for o in self.api.objects:
+            self._append(o.layer, o.name, o.resource)
+
+            graph.append(len(o.procedures))
+            for p in o.procedures:
+                self._append(p.name, p.description, p.sample_request, p.sample_response)
+
+                # Procedures built from JSON specifications hold their fields on a dictionary.
+                fields = getattr(p, 'fields', None)
+                if isinstance(fields, dict):
+                    graph.append(LAYOUT_FIELDS)
+                    self._append_fields(p.parameters)
+                    self._append_fields(list(fields.values()))
+                else:
+                    graph.append(LAYOUT_PARAMETERS)
+                    self._append_fields(p.parameters)
+
+            graph.append(len(o.events))
+            for e in o.events:
+                self._append(e.code, e.name, e.description, e.sample)
+
+            graph.append(len(o.instances))
+            for i in o.instances:
+                self._append(i.name, i.description)
+
+            if debug:
+                self.logger.debug('Objects - Added object "%s".', o.name)
+
+    def build(self):
+        """Generates the snapshot file."""
+
+        self._write_graph()
+
+        # Build value table.
+        offsets = array('I', [0])
+        length = 0
+        for t in self.texts:
+            length += len(t)
+            offsets.append(length)
+
+        text = ''.join(self.texts).encode('utf-8')
+
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDERS[sys.byteorder], len(self.kinds), len(text),
+                             len(self.graph))
+
+        # Save file.
+        folder = os.path.dirname(self.file)
+        if folder != '':
+            os.makedirs(folder, exist_ok=True)
+
+        with open(self.file, 'wb') as f:
+            f.write(header)
+            f.write(self.kinds.tobytes())
+            f.write(offsets.tobytes())
+            f.write(text)
+            f.write(self.graph.tobytes())
+
+        self.logger.debug('File - Saved %s values and %s graph entries to "%s".',
+                          len(self.kinds), len(self.graph), self.file)
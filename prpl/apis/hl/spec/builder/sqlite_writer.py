@@ -0,0 +1,268 @@
+
+import logging
+import os
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE versions (
+    id INTEGER PRIMARY KEY,
+    number TEXT,
+    date TEXT
+);
+
+CREATE TABLE changes (
+    version_id INTEGER REFERENCES versions(id),
+    number TEXT,
+    description TEXT
+);
+
+CREATE TABLE response_codes (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    sample TEXT,
+    raised_by TEXT
+);
+
+CREATE TABLE objects (
+    id INTEGER PRIMARY KEY,
+    layer INTEGER,
+    name TEXT,
+    resource TEXT
+);
+
+CREATE TABLE procedures (
+    id INTEGER PRIMARY KEY,
+    object_id INTEGER REFERENCES objects(id),
+    name TEXT,
+    description TEXT,
+    sample_request TEXT,
+    sample_response TEXT
+);
+
+CREATE TABLE fields (
+    id INTEGER PRIMARY KEY,
+    procedure_id INTEGER REFERENCES procedures(id),
+    name TEXT,
+    description TEXT,
+    type TEXT,
+    is_input INTEGER,
+    is_output INTEGER,
+    is_required INTEGER,
+    default_value TEXT,
+    possible_values TEXT,
+    format TEXT,
+    notes TEXT
+);
+
+CREATE TABLE events (
+    id INTEGER PRIMARY KEY,
+    object_id INTEGER REFERENCES objects(id),
+    code TEXT,
+    name TEXT,
+    full_name TEXT,
+    description TEXT,
+    sample TEXT
+);
+
+CREATE TABLE instances (
+    id INTEGER PRIMARY KEY,
+    object_id INTEGER REFERENCES objects(id),
+    name TEXT,
+    description TEXT
+);
+
+CREATE VIEW procedure_fields AS
+    SELECT o.name AS object, p.name AS procedure, f.*
+    FROM fields f
+    JOIN procedures p ON p.id = f.procedure_id
+    JOIN objects o ON o.id = p.object_id;
+
+CREATE VIEW object_events AS
+    SELECT o.name AS object, e.*
+    FROM events e
+    JOIN objects o ON o.id = e.object_id;
+"""
+
+INDEXES = """
+CREATE INDEX ix_changes_version ON changes(version_id);
+CREATE INDEX ix_response_codes_name ON response_codes(name);
+CREATE INDEX ix_objects_name ON objects(name);
+CREATE INDEX ix_procedures_object ON procedures(object_id);
+CREATE INDEX ix_procedures_name ON procedures(name);
+CREATE INDEX ix_fields_procedure ON fields(procedure_id);
+CREATE INDEX ix_fields_name ON fields(name);
+CREATE INDEX ix_events_object ON events(object_id);
+CREATE INDEX ix_events_name ON events(name);
+CREATE INDEX ix_events_full_name ON events(full_name);
+CREATE INDEX ix_events_code ON events(code);
+CREATE INDEX ix_instances_object ON instances(object_id);
+"""
+
+FULL_TEXT_SEARCH = """
+CREATE VIRTUAL TABLE descriptions USING fts5(kind UNINDEXED, ref UNINDEXED, name, description);
+"""
+
+
+class SQLiteWriter:
+    """SQLite database writer for prpl HL-API.
+
+    Exports the API into an indexed SQLite database, with one table for each of the objects, procedures, fields,
+    events, instances, response codes and versions (plus the 'procedure_fields' and 'object_events' views), and a
+    full-text search table ('descriptions') over all descriptions, whenever SQLite is built with FTS5.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.builder import SQLiteWriter as HLAPISQLiteWriter
+
+        # Load API.
+        writer = HLAPISQLiteWriter(api, 'specs/generated/sqlite/prpl HL-API ({}).db'.format(api.get_version()))
+
+        # Generate database.
+        writer.build()
+
+        # Which procedures take 'AccountId'?
+        #   SELECT object, procedure FROM procedure_fields WHERE name = 'AccountId' AND is_input;
+        # Which objects raise 'USER_ACCOUNTS_ADDED'?
+        #   SELECT object FROM object_events WHERE full_name = 'USER_ACCOUNTS_ADDED';
+        # Which entries mention 'password'?
+        #   SELECT kind, ref, name FROM descriptions WHERE descriptions MATCH 'password';
+
+    """
+
+    def __init__(self, api, file):
+        """Initializes the database writer.
+
+        Args:
+            api (prpl.apis.hl.com.api): API to be exported.
+            file (str): Target filename for the database.
+
+        """
+
+        self.api = api
+        self.file = file
+        self.descriptions = []
+
+        # Init logger.
+        self.logger = logging.getLogger('SQLiteWriter')
+
+        # Remove old file.
+        self.logger.debug('File - Removing previous database "%s".', self.file)
+        try:
+            os.remove(self.file)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _get_fields(procedure):
+        """Returns the fields of a procedure, regardless of whether they are held on a list or a dictionary.
+
+        Args:
+            procedure (prpl.apis.hl.com.Procedure): Procedure.
+
+        Returns:
+            list<prpl.apis.hl.com.Field>: Procedure fields.
+
+        """
+
+        fields = getattr(procedure, 'fields', None)
+        if len(procedure.parameters) == 0 and isinstance(fields, dict):
+            return list(fields.values())
+
+        return list(procedure.parameters)
+
+    def _insert_versions(self, db):
+        """Inserts versions and their changes."""
+
+        for v in self.api.versions:
+            version_id = db.execute('INSERT INTO versions (number, date) VALUES (?, ?)',
+                                    (v.number, v.date)).lastrowid
+            db.executemany('INSERT INTO changes (version_id, number, description) VALUES (?, ?, ?)',
+                           [(version_id, str(number), change) for number, change in v.change_list])
+
+    def _insert_response_codes(self, db):
+        """Inserts response codes."""
+
+        for rc in self.api.response_codes:
+            rc_id = db.execute('INSERT INTO response_codes (name, description, sample, raised_by) VALUES (?, ?, ?, ?)',
+                               (rc.name, rc.description, rc.sample, rc.raised_by)).lastrowid
+            self.descriptions.append(('response_code', rc_id, rc.name, rc.description))
+
+    def _insert_objects(self, db):
+        """Inserts objects along with their procedures, fields, events and instances."""
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for o in self.api.objects:
+            object_id = db.execute('INSERT INTO objects (layer, name, resource) VALUES (?, ?, ?)',
+                                   (o.layer, o.name, o.resource)).lastrowid
+
+            for p in o.procedures:
+                procedure_id = db.execute(
+                    'INSERT INTO procedures (object_id, name, description, sample_request, sample_response) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (object_id, p.name, p.description, p.sample_request, p.sample_response)).lastrowid
+                self.descriptions.append(('procedure', procedure_id, '{}.{}'.format(o.name, p.name), p.description))
+
+                for f in self._get_fields(p):
+                    field_id = db.execute(
+                        'INSERT INTO fields (procedure_id, name, description, type, is_input, is_output, is_required, '
+                        'default_value, possible_values, format, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (procedure_id, f.name, f.description, f.type, f.is_input, f.is_output, f.is_required,
+                         f.default_value, f.possible_values, f.format, f.notes)).lastrowid
+                    self.descriptions.append(('field', field_id, f.name, f.description))
+
+            prefix = '{}_'.format(o.name.upper().replace('.', '_'))
+            for e in o.events:
+                event_id = db.execute(
+                    'INSERT INTO events (object_id, code, name, full_name, description, sample) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (object_id, str(e.code), e.name, '{}{}'.format(prefix, e.name), e.description,
+                     e.sample)).lastrowid
+                self.descriptions.append(('event', event_id, e.name, e.description))
+
+            for i in o.instances:
+                instance_id = db.execute('INSERT INTO instances (object_id, name, description) VALUES (?, ?, ?)',
+                                         (object_id, i.name, i.description)).lastrowid
+                self.descriptions.append(('instance', instance_id, i.name, i.description))
+
+            if debug:
+                self.logger.debug('Objects - Added object "%s".', o.name)
+
+    def _insert_descriptions(self, db):
+        """Creates and fills the full-text search table, if supported."""
+
+        try:
+            db.executescript(FULL_TEXT_SEARCH)
+        except sqlite3.OperationalError as e:
+            self.logger.warning('Descriptions - Full-text search not available (%s).', e)
+            return
+
+        db.executemany('INSERT INTO descriptions (kind, ref, name, description) VALUES (?, ?, ?, ?)',
+                       self.descriptions)
+
+    def build(self):
+        """Generates the SQLite database."""
+
+        folder = os.path.dirname(self.file)
+        if folder != '':
+            os.makedirs(folder, exist_ok=True)
+
+        db = sqlite3.connect(self.file)
+
+        try:
+            db.executescript(SCHEMA)
+
+            with db:
+                self._insert_versions(db)
+                self._insert_response_codes(db)
+                self._insert_objects(db)
+
+            # Indexes are cheaper to build once all rows are in place.
+            db.executescript(INDEXES)
+            self._insert_descriptions(db)
+            db.commit()
+        finally:
+            db.close()
+
+        self.logger.debug('File - Saved database "%s".', self.file)
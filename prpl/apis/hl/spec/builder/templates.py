@@ -0,0 +1,65 @@
+
+from functools import lru_cache
+import os
+
+# Default templates folder ('specs/templates' at the root of the repository).
+TEMPLATE_FOLDER = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../specs/templates'))
+
+# Templates loaded by the writers.
+TEMPLATES = ['prpl.json', 'object.json', 'prpl.docx']
+
+
+@lru_cache(maxsize=None)
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def read_bytes(path):
+    """Returns the content of a template file, reading it from disk only once per process.
+
+    Writers must copy (or parse) the returned content before modifying it.
+
+    Args:
+        path (str): Template file name, relative to the working directory or absolute.
+
+    Returns:
+        bytes: Template content.
+
+    """
+
+    return _read(os.path.abspath(path))
+
+
+def read_text(path):
+    """Returns the content of a text template file, reading it from disk only once per process.
+
+    Args:
+        path (str): Template file name, relative to the working directory or absolute.
+
+    Returns:
+        str: Template content.
+
+    """
+
+    return read_bytes(path).decode('utf-8')
+
+
+def preload(folder=TEMPLATE_FOLDER):
+    """Loads the default templates, so that forked workers (e.g.: batch jobs) inherit them already in memory.
+
+    Args:
+        folder (str): Templates folder.
+
+    """
+
+    for name in TEMPLATES:
+        path = os.path.join(folder, name)
+        if os.path.isfile(path):
+            read_bytes(path)
+
+
+def clear():
+    """Drops all cached templates (e.g.: after a template was edited)."""
+
+    _read.cache_clear()
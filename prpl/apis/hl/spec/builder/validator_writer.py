@@ -0,0 +1,463 @@
+
+from collections import OrderedDict
+import importlib.util
+import logging
+import os
+import re
+
+from prpl.apis.hl.com.field_store import get_inputs, get_outputs
+
+# Message directions.
+REQUEST = 'request'
+RESPONSE = 'response'
+
+# Python classes accepted for each HL-API field type (lower case). Fields of other types are not type checked.
+TYPE_CLASSES = {
+    'string': ('str',),
+    'integer': ('int',),
+    'boolean': ('bool',),
+    'float': ('int', 'float'),
+    'number': ('int', 'float'),
+    'list': ('list',),
+    'array': ('list',),
+    'object': ('dict',),
+}
+
+# Possible values made only of quoted values (e.g.: '"MD5", "SHA-256" or "SHA-512"') are turned into enum checks.
+_QUOTED_VALUE = re.compile(r'"([^"]*)"')
+_SEPARATORS = re.compile(r'^(?:\s|,|\bor\b|\.)*$')
+
+MODULE_HEADER = '''# Generated by prpl.apis.hl.spec.builder.ValidatorWriter from prpl HL-API {version}. Do not edit.
+"""Request and response validators of prpl HL-API {version}.
+
+Every validator takes a message (the arguments of a request, or the body of a response) and returns the list of
+errors found in it, which is empty for valid messages.
+
+"""
+
+import re
+
+REQUEST = 'request'
+RESPONSE = 'response'
+
+_MISSING = object()
+'''
+
+MODULE_FOOTER = '''
+
+# Object name patterns, to look up the validators of object instances (e.g.: 'User.Accounts.1').
+_PATTERNS = [(re.compile(pattern), name) for pattern, name in _OBJECT_PATTERNS]
+_RESOLVED = {}
+
+
+def get_validator(object_name, procedure_name, direction):
+    """Returns the validator of a procedure, or None if the procedure is unknown.
+
+    Args:
+        object_name (str): Object name, either as in the specification or as an instance path.
+        procedure_name (str): Procedure name.
+        direction (str): 'request' or 'response'.
+
+    Returns:
+        callable: Validator.
+
+    """
+
+    validator = VALIDATORS.get((object_name, procedure_name, direction))
+    if validator is not None:
+        return validator
+
+    name = _RESOLVED.get(object_name, _MISSING)
+    if name is _MISSING:
+        name = next((n for pattern, n in _PATTERNS if pattern.match(object_name)), None)
+        _RESOLVED[object_name] = name
+
+    return VALIDATORS.get((name, procedure_name, direction))
+
+
+def validate(object_name, procedure_name, direction, message):
+    """Validates a message.
+
+    Args:
+        object_name (str): Object name, either as in the specification or as an instance path.
+        procedure_name (str): Procedure name.
+        direction (str): 'request' or 'response'.
+        message (dict): Request arguments or response body.
+
+    Returns:
+        list<str>: Errors found in the message.
+
+    """
+
+    validator = get_validator(object_name, procedure_name, direction)
+    if validator is None:
+        return ['unknown procedure "{}.{}"'.format(object_name, procedure_name)]
+
+    return validator(message)
+
+
+def validate_batch(messages):
+    """Validates many messages, e.g.: captured traffic being replayed.
+
+    Args:
+        messages (iterable<tuple>): (object name, procedure name, direction, message) tuples.
+
+    Returns:
+        list<tuple>: Index and errors of each invalid message.
+
+    """
+
+    invalid = []
+    validators = {}
+
+    for index, (object_name, procedure_name, direction, message) in enumerate(messages):
+        key = (object_name, procedure_name, direction)
+        validator = validators.get(key, _MISSING)
+        if validator is _MISSING:
+            validator = validators[key] = get_validator(object_name, procedure_name, direction)
+
+        if validator is None:
+            invalid.append((index, ['unknown procedure "{}.{}"'.format(object_name, procedure_name)]))
+            continue
+
+        errors = validator(message)
+        if errors:
+            invalid.append((index, errors))
+
+    return invalid
+'''
+
+
+def get_enum(field):
+    """Returns the values allowed for a field, if its possible values are an explicit list.
+
+    Only 'String' fields whose possible values are made of quoted values (and separators) are considered, e.g.:
+    '"MD5", "SHA-256" or "SHA-512"'. Free text (e.g.: 'any string with length from 1 up to 64 chars') is ignored.
+
+    Args:
+        field (prpl.apis.hl.com.Field): Field.
+
+    Returns:
+        list<str>: Allowed values, or None.
+
+    """
+
+    if not isinstance(field.type, str) or field.type.lower() != 'string' or not isinstance(field.possible_values, str):
+        return None
+
+    values = _QUOTED_VALUE.findall(field.possible_values)
+    if len(values) < 2 or _SEPARATORS.match(_QUOTED_VALUE.sub('', field.possible_values)) is None:
+        return None
+
+    return values
+
+
+def get_object_pattern(name):
+    """Returns a regular expression matching the instances of a templated object.
+
+    Args:
+        name (str): Object name, e.g.: 'User.Accounts.{AccountId}'.
+
+    Returns:
+        str: Pattern, e.g.: matching 'User.Accounts.1', or None if the object is not templated.
+
+    """
+
+    if '{' not in name:
+        return None
+
+    return '^{}$'.format('[^.]+'.join(re.escape(p) for p in re.split(r'\{[^}]*\}', name)))
+
+
+def get_comment_text(value):
+    """Escapes a specification value (e.g.: an object name), to be embedded in a comment or docstring.
+
+    Line breaks, quotes and other special characters are escaped, so that they cannot end the comment (or docstring)
+    and inject code into the generated module.
+
+    Args:
+        value (object): Value.
+
+    Returns:
+        str: Escaped text, on a single line.
+
+    """
+
+    return repr(str(value))[1:-1].replace('"', '\\"')
+
+
+class FieldNode:
+    """Field tree node: dotted field names (e.g.: 'Hash.Type') are nested objects."""
+
+    def __init__(self):
+        self.field = None
+        self.required = False
+        self.children = OrderedDict()
+
+
+def get_field_tree(procedure, direction):
+    """Arranges the fields of a procedure which are part of its request (or response) as a tree.
+
+    Args:
+        procedure (prpl.apis.hl.com.Procedure): Procedure.
+        direction (str): 'request' or 'response'.
+
+    Returns:
+        prpl.apis.hl.spec.builder.validator_writer.FieldNode: Root node, whose children are the top-level fields.
+
+    """
+
+    root = FieldNode()
+
+    for f in (get_inputs(procedure) if direction == REQUEST else get_outputs(procedure)):
+        node = root
+        for name in f.name.split('.'):
+            node = node.children.setdefault(name, FieldNode())
+
+        node.field = f
+        node.required = node.required or f.is_required is True
+
+    return root
+
+
+def get_type_classes(node):
+    """Returns the names of the Python classes accepted for the value of a field tree node.
+
+    Args:
+        node (prpl.apis.hl.spec.builder.validator_writer.FieldNode): Field tree node.
+
+    Returns:
+        tuple<str>: Class names (e.g.: ('int', 'float')), or None if the value is not type checked.
+
+    """
+
+    is_object = len(node.children) > 0
+    field = node.field
+
+    if field is None or not isinstance(field.type, str):
+        return ('dict',) if is_object else None
+
+    classes = TYPE_CLASSES.get(field.type.lower())
+    if is_object and classes != ('list',):
+        classes = ('dict',)
+
+    return classes
+
+
+class _Path:
+    """Path of a value in a message, as generated code (list items are only known at validation time)."""
+
+    def __init__(self, parts=(), args=()):
+        self.parts = list(parts)
+        self.args = list(args)
+
+    def child(self, name):
+        return _Path(self.parts + (['.'] if self.parts else []) + [name], self.args)
+
+    def item(self, index):
+        return _Path(self.parts + [None], self.args + [index])
+
+    def get_code(self, suffix):
+        if len(self.args) == 0:
+            return repr(''.join(self.parts) + suffix)
+
+        # List indexes are formatted in, so literal braces are escaped.
+        template = ''.join('[{}]' if p is None else p.replace('{', '{{').replace('}', '}}') for p in self.parts)
+        return '{}.format({})'.format(repr(template + suffix.replace('{', '{{').replace('}', '}}')),
+                                      ', '.join(self.args))
+
+
+class ValidatorWriter:
+    """Python validator writer for prpl HL-API.
+
+    Generates a Python module with a specialized validator function for the request arguments and for the response
+    body of every procedure, built from the same input and output fields as the JSON schemas of the
+    'JSONSchemaWriter'. Required field, type and enum checks are unrolled into plain Python code, so validating a
+    message costs a handful of dictionary lookups and class comparisons, instead of walking a schema.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.builder import ValidatorWriter as HLAPIValidatorWriter
+
+        # Generate validators.
+        file = 'specs/generated/validators/v{}/hlapi_validators.py'.format(api.get_version())
+        HLAPIValidatorWriter(api, file).build()
+
+        # Load and use them.
+        from prpl.apis.hl.spec.builder.validator_writer import load_validators
+
+        validators = load_validators(file)
+        errors = validators.validate('User.Accounts', 'Add', 'request', {'Name': 'Admin'})
+        invalid = validators.validate_batch(captured_messages)
+
+    """
+
+    def __init__(self, api, file):
+        """Initializes the validator writer.
+
+        Args:
+            api (prpl.apis.hl.com.api): API to be converted.
+            file (str): Target filename for the generated module.
+
+        """
+
+        self.api = api
+        self.file = file
+
+        self.lines = []
+        self.variables = 0
+
+        # Init logger.
+        self.logger = logging.getLogger('ValidatorWriter')
+
+    def _emit(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+    def _new_variable(self, prefix='v'):
+        self.variables += 1
+        return '{}{}'.format(prefix, self.variables)
+
+    def _emit_type_check(self, indent, variable, path, node):
+        """Emits the type (and enum) checks of a value, as 'elif' branches. Returns the class of the value."""
+
+        classes = get_type_classes(node)
+        if classes is None:
+            return None
+
+        field = node.field
+        is_object = len(node.children) > 0
+
+        type_name = field.type if field is not None else 'Object'
+        if len(classes) == 1:
+            self._emit(indent, 'elif {}.__class__ is not {}:'.format(variable, classes[0]))
+        else:
+            self._emit(indent, 'elif {}.__class__ not in ({}):'.format(variable, ', '.join(classes)))
+        self._emit(indent + 1, 'errors.append({})'.format(path.get_code(': expected {}'.format(type_name))))
+
+        enum = get_enum(field) if field is not None and not is_object else None
+        if enum is not None:
+            # Set literals are compiled into constants.
+            self._emit(indent, 'elif {} not in {{{}}}:'.format(variable, ', '.join(repr(v) for v in sorted(set(enum)))))
+            self._emit(indent + 1, 'errors.append({})'.format(
+                path.get_code(': expected one of {}'.format(', '.join('"{}"'.format(v) for v in enum)))))
+
+        return classes[0]
+
+    def _emit_children(self, indent, parent, node, path):
+        """Emits the checks of the children of an object."""
+
+        for name, child in node.children.items():
+            variable = self._new_variable()
+            child_path = path.child(name)
+
+            self._emit(indent, '{} = {}.get({}, _MISSING)'.format(variable, parent, repr(name)))
+            self._emit(indent, 'if {} is _MISSING:'.format(variable))
+            if child.required:
+                self._emit(indent + 1, 'errors.append({})'.format(child_path.get_code(': missing required field')))
+            else:
+                self._emit(indent + 1, 'pass')
+
+            value_class = self._emit_type_check(indent, variable, child_path, child)
+            if len(child.children) == 0:
+                continue
+
+            self._emit(indent, 'else:')
+            if value_class == 'list':
+                # List of objects.
+                index = self._new_variable('i')
+                item = self._new_variable()
+                item_path = child_path.item(index)
+
+                self._emit(indent + 1, 'for {}, {} in enumerate({}):'.format(index, item, variable))
+                self._emit(indent + 2, 'if {}.__class__ is not dict:'.format(item))
+                self._emit(indent + 3, 'errors.append({})'.format(item_path.get_code(': expected Object')))
+                self._emit(indent + 2, 'else:')
+                self._emit_children(indent + 3, item, child, item_path)
+            else:
+                self._emit_children(indent + 1, variable, child, child_path)
+
+    def _emit_validator(self, name, api_object, procedure, direction):
+        """Emits the validator of the request (or response) of a procedure."""
+
+        self._emit(0, '')
+        self._emit(0, '')
+        self._emit(0, 'def {}(message):'.format(name))
+        self._emit(1, '# {}.{} ({})'.format(get_comment_text(api_object.name), get_comment_text(procedure.name),
+                                            direction))
+        self._emit(1, 'if message.__class__ is not dict:')
+        self._emit(2, "return ['expected an object']")
+        self._emit(1, 'errors = []')
+        self._emit_children(1, 'message', get_field_tree(procedure, direction), _Path())
+        self._emit(1, 'return errors')
+
+    def get_source(self):
+        """Generates the source code of the validators module.
+
+        Returns:
+            str: Python source code.
+
+        """
+
+        self.lines = [MODULE_HEADER.format(version=get_comment_text(self.api.get_version()))]
+        self.variables = 0
+
+        validators = []
+        for api_object in self.api.objects:
+            for procedure in api_object.procedures:
+                for direction in (REQUEST, RESPONSE):
+                    name = '_validate_{}'.format(len(validators))
+                    self._emit_validator(name, api_object, procedure, direction)
+                    validators.append(((api_object.name, procedure.name, direction), name))
+
+        self._emit(0, '')
+        self._emit(0, '')
+        self._emit(0, 'VALIDATORS = {')
+        for key, name in validators:
+            self._emit(1, '{}: {},'.format(repr(key), name))
+        self._emit(0, '}')
+
+        # Templated objects (e.g.: 'User.Accounts.{AccountId}') also match their instances.
+        self._emit(0, '')
+        self._emit(0, '_OBJECT_PATTERNS = [')
+        for api_object in self.api.objects:
+            pattern = get_object_pattern(api_object.name)
+            if pattern is not None:
+                self._emit(1, '({}, {}),'.format(repr(pattern), repr(api_object.name)))
+        self._emit(0, ']')
+
+        self.lines.append(MODULE_FOOTER)
+
+        return '\n'.join(self.lines)
+
+    def build(self):
+        """Writes the validators module."""
+
+        self.logger.info('Validators - Generating validators of %s objects.', len(self.api.objects))
+        source = self.get_source()
+
+        folder = os.path.dirname(self.file)
+        if folder != '':
+            os.makedirs(folder, exist_ok=True)
+
+        with open(self.file, 'w') as f:
+            f.write(source)
+
+        self.logger.info('Validators - Finished writing "%s".', self.file)
+
+
+def load_validators(file):
+    """Imports a validators module generated by the 'ValidatorWriter'.
+
+    Args:
+        file (str): Path of the generated module.
+
+    Returns:
+        module: Validators module, with the 'validate', 'validate_batch' and 'get_validator' functions.
+
+    """
+
+    spec = importlib.util.spec_from_file_location('hlapi_validators', file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
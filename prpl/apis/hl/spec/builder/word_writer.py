@@ -2,10 +2,15 @@
 from docx import Document
 from docx.styles.style import _ParagraphStyle
 from docx.styles.style import _TableStyle
+import io
 import logging
 import os
 from collections import OrderedDict
 
+from prpl.apis.hl.com.field_store import get_inputs, get_outputs
+from prpl.apis.hl.spec import profiler
+from prpl.apis.hl.spec.builder import templates
+
 
 class WordWriter:
     """Microsoft Word specification writer for prpl HL-API.
@@ -51,7 +56,7 @@ class WordWriter:
 
         self.api = api
         self.file = file
-        self.document = Document(template)
+        self.document = Document(io.BytesIO(templates.read_bytes(template)))
 
         # Init logger.
         self.logger = logging.getLogger('WordWriter')
@@ -73,12 +78,12 @@ class WordWriter:
         self.logger.debug('Styles - Finished looking up template styles.')
 
         # Remove old file.
-        self.logger.debug('File - Removing previous report "{}".'.format(self.file))
+        self.logger.debug('File - Removing previous report "%s".', self.file)
         try:
             os.remove(self.file)
         except FileNotFoundError:
             pass
-        self.logger.debug('File - Finished removing previous report "{}".'.format(self.file))
+        self.logger.debug('File - Finished removing previous report "%s".', self.file)
 
     def _append_table(self, headers, entries):
         """Creates a new table with the specified entries.
@@ -120,7 +125,7 @@ class WordWriter:
                 # Replace text with version number.
                 paragraph.text = 'Version {}'.format(self.api.get_version())
                 paragraph.style = self.prpl_cover_version_number_style
-                self.logger.debug('Cover - Updated with version {}.'.format(paragraph.text))
+                self.logger.debug('Cover - Updated with version %s.', paragraph.text)
                 break
 
     def _append_change_log(self):
@@ -128,12 +133,15 @@ class WordWriter:
 
         cl_table = self.document.tables[0]
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         for v in self.api.versions:
             cl_table.add_row()
             cl_table.rows[-1].cells[0].text = v.number
             cl_table.rows[-1].cells[1].text = v.date
             cl_table.rows[-1].cells[2].text = v.get_changes()
-            self.logger.debug('ChangeLog - Appended version {}.'.format(v.number))
+            if debug:
+                self.logger.debug('ChangeLog - Appended version %s.', v.number)
 
     def _append_return_codes(self):
         """Adds return codes section."""
@@ -148,7 +156,7 @@ class WordWriter:
 
         # Append response codes table.
         self._append_table(
-            OrderedDict([('code', 'Code'), ('name', 'Name'), ('sample', 'Sample'), ('description', 'Description')]),
+            OrderedDict([('name', 'Name'), ('sample', 'Sample'), ('description', 'Description')]),
             self.api.response_codes)
 
     def _append_procedures(self):
@@ -157,6 +165,8 @@ class WordWriter:
         # Add heading.
         self.document.add_heading('Procedures', level=1)
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Iterate through each object.
         for idx, obj in enumerate(self.api.objects):
             # Include page break between objects unless first and last.
@@ -166,7 +176,8 @@ class WordWriter:
             # Object Header.
             self.document.add_heading(obj.name, 2)
 
-            self.logger.debug('Procedures - Appended object "{}".'.format(obj.name))
+            if debug:
+                self.logger.debug('Procedures - Appended object "%s".', obj.name)
 
             # Iterate through each procedure.
             for idx_proc, procedure in enumerate(obj.procedures):
@@ -193,7 +204,7 @@ class WordWriter:
                 # Input.
                 self.document.add_heading('Input', 4)
 
-                args = list(filter(lambda x: x.is_input is True, procedure.fields))
+                args = get_inputs(procedure)
                 if len(args) == 0:
                     self.document.add_paragraph('N/A.', style=self.paragraph_style)
                 else:
@@ -207,7 +218,7 @@ class WordWriter:
                 # Output.
                 self.document.add_heading('Output', 4)
 
-                fields = list(filter(lambda x: x.is_output is True, procedure.fields))
+                fields = get_outputs(procedure)
                 if len(fields) == 0:
                     self.document.add_paragraph('N/A.', style=self.paragraph_style)
                 else:
@@ -217,7 +228,8 @@ class WordWriter:
                                                     ('notes', 'Notes')]),
                                        fields)
 
-                self.logger.debug('Procedures - Appended procedure "{}".'.format(procedure.name))
+                if debug:
+                    self.logger.debug('Procedures - Appended procedure "%s".', procedure.name)
 
     def _append_events(self):
         """Adds events section.
@@ -235,6 +247,8 @@ class WordWriter:
         # Filter out objects with no events.
         objects_with_events = list(filter(lambda x: len(x.events) > 0, self.api.objects))
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Iterate through each object.
         for idx, obj in enumerate(objects_with_events):
             # Include page break between objects unless first and last.
@@ -251,38 +265,45 @@ class WordWriter:
                                             ('sample', 'Sample')]),
                                obj.events)
 
-            self.logger.debug('Events - Added events for object "{}" with {} entries.'.format(obj.name,
-                                                                                              len(obj.events)))
+            if debug:
+                self.logger.debug('Events - Added events for object "%s" with %s entries.',
+                                  obj.name, len(obj.events))
 
     def build(self):
         """Generates a Word file specification for the HL-API."""
 
         # Cover.
         self.logger.debug('Cover - Started writing.')
-        self._update_cover()
+        with profiler.span('cover'):
+            self._update_cover()
         self.logger.debug('Cover - Finished.\n')
 
         # Add Change-Log.
         self.logger.debug('ChangeLog - Started writing.')
-        self._append_change_log()
+        with profiler.span('change_log'):
+            self._append_change_log()
         self.logger.debug('ChangeLog - Finished.\n')
 
         # Add Return Codes.
         self.logger.debug('Response Codes - Started writing.')
-        self._append_return_codes()
+        with profiler.span('response_codes'):
+            self._append_return_codes()
         self.logger.debug('Response - Finished.\n')
 
         # Add Objects.
         self.logger.debug('Procedures - Started writing.')
-        self._append_procedures()
+        with profiler.span('procedures'):
+            self._append_procedures()
         self.logger.debug('Procedures - Finished.\n')
 
         # Add Events.
         self.logger.debug('Events - Started writing.')
-        self._append_events()
+        with profiler.span('events'):
+            self._append_events()
         self.logger.debug('Events - Finished.\n')
 
         # Save file.
         self.logger.debug('File - Saving.')
-        self.document.save(self.file)
+        with profiler.span('save'):
+            self.document.save(self.file)
         self.logger.debug('File - Finished.\n')
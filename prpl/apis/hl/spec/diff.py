@@ -0,0 +1,274 @@
+from collections import OrderedDict
+import hashlib
+
+from prpl.apis.hl.com.field_store import get_fields
+
+# Change status.
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+# Kinds of compared items.
+OBJECT = 'object'
+PROCEDURE = 'procedure'
+FIELD = 'field'
+EVENT = 'event'
+INSTANCE = 'instance'
+RESPONSE_CODE = 'response_code'
+
+# Compared attributes of each kind (the attribute identifying an item is part of its key instead).
+ATTRIBUTES = {
+    OBJECT: ('layer', 'resource'),
+    PROCEDURE: ('description', 'sample_request', 'sample_response'),
+    FIELD: ('description', 'type', 'is_input', 'is_required', 'default_value', 'is_output', 'possible_values',
+            'format', 'notes'),
+    EVENT: ('name', 'description', 'sample'),
+    INSTANCE: ('description',),
+    RESPONSE_CODE: ('description', 'sample', 'raised_by'),
+}
+
+LABELS = {
+    OBJECT: 'object',
+    PROCEDURE: 'procedure',
+    FIELD: 'field',
+    EVENT: 'event',
+    INSTANCE: 'instance',
+    RESPONSE_CODE: 'response code',
+}
+
+
+def _get_name(kind, item):
+    # Codes may be read as numbers or strings, depending on the specification format.
+    return str(item.code) if kind == EVENT else item.name
+
+
+def _get_children(kind, item):
+    if kind == OBJECT:
+        return [(PROCEDURE, item.procedures), (EVENT, item.events), (INSTANCE, item.instances)]
+    if kind == PROCEDURE:
+        return [(FIELD, get_fields(item))]
+
+    return []
+
+
+def _index(kind, items):
+    """Indexes items by name. Items sharing a name are told apart by their order of appearance."""
+
+    index = OrderedDict()
+    for item in items:
+        name = _get_name(kind, item)
+        key, occurrence = name, 1
+        while key in index:
+            occurrence += 1
+            key = '{}#{}'.format(name, occurrence)
+        index[key] = item
+
+    return index
+
+
+class Change:
+    """Difference between two HL-API graphs, for a single item.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.diff import Change as HLAPIChange
+
+        # Create new instance.
+        change = HLAPIChange('field', ('User.Accounts', 'Add', 'Password'), 'changed', old_field, new_field,
+                             [('type', 'String', 'Integer')])
+
+    """
+
+    def __init__(self, kind, key, status, old=None, new=None, attributes=()):
+        """Creates a new change.
+
+        Args:
+            kind (str): Kind of the item, e.g.: 'object', 'procedure' or 'field'.
+            key (tuple<str>): Stable key of the item: the names of its parents (object, then procedure) and its own.
+            status (str): 'added', 'removed' or 'changed'.
+            old (object): Item in the old API, if any.
+            new (object): Item in the new API, if any.
+            attributes (list<tuple>): Changed attributes, as (name, old value, new value) tuples.
+
+        """
+
+        self.kind = kind
+        self.key = key
+        self.status = status
+        self.old = old
+        self.new = new
+        self.attributes = list(attributes)
+
+    def __str__(self):
+        """Converts object to human-readable string.
+
+        Returns:
+            str: Human-readable representation of the change.
+
+        """
+
+        return '{} {} {}'.format(self.status, self.kind, self.get_path())
+
+    def get_path(self):
+        """Returns the key of the item as a single string (e.g.: 'User.Accounts/Add/Password')."""
+
+        return '/'.join(self.key)
+
+    def get_description(self):
+        """Drafts a change list entry describing the change.
+
+        Returns:
+            str: Description of the change, e.g.: 'Added "Password" field to the "Add" procedure of the
+                "User.Accounts" object.'.
+
+        """
+
+        item = self.new if self.new is not None else self.old
+        name = item.name if self.kind in (EVENT, RESPONSE_CODE) else self.key[-1]
+
+        parents = []
+        if len(self.key) == 3:
+            parents.append('the "{}" procedure'.format(self.key[1]))
+        if len(self.key) > 1:
+            parents.append('the "{}" object'.format(self.key[0]))
+        parent = ' of '.join(parents)
+
+        if self.status == ADDED:
+            return 'Added "{}" {}{}.'.format(name, LABELS[self.kind], ' to ' + parent if parent else '')
+        if self.status == REMOVED:
+            return 'Removed "{}" {}{}.'.format(name, LABELS[self.kind], ' from ' + parent if parent else '')
+
+        attributes = ', '.join(a[0].replace('_', ' ') for a in self.attributes)
+        return 'Updated {} of "{}" {}{}.'.format(attributes, name, LABELS[self.kind], ' of ' + parent if parent else '')
+
+
+class APIDiff:
+    """Semantic diff of two HL-API graphs.
+
+    Objects, procedures, fields, events, instances and response codes are matched by name (events by code) and
+    reported as added, removed or changed. Every object, procedure and field is summarized by a digest which covers
+    its whole subtree. Both sides are still walked once to compute the digests (which are cached for the lifetime of the
+    diff), but unchanged objects and procedures are then skipped by comparing their digests, instead of being compared
+    attribute by attribute and field by field.
+
+    Added and removed items are reported once, for the top-most item (i.e.: the procedures of an added object are not
+    reported individually).
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.diff import APIDiff as HLAPIDiff
+
+        # Compare APIs.
+        diff = HLAPIDiff(old_api, new_api)
+        for change in diff.compare():
+            print(change)
+
+        # Draft the change list of the new version.
+        new_api.versions[0].change_list = diff.get_change_list()
+
+    """
+
+    def __init__(self, old_api, new_api):
+        """Creates a new diff.
+
+        Args:
+            old_api (prpl.apis.hl.com.API): Reference API.
+            new_api (prpl.apis.hl.com.API): API to be compared with the reference.
+
+        """
+
+        self.old_api = old_api
+        self.new_api = new_api
+        self.changes = None
+        self.skipped = 0
+        self._digests = {}
+
+    def get_digest(self, kind, item):
+        """Returns the digest of an item and all of its children (e.g.: the procedures and fields of an object).
+
+        Args:
+            kind (str): Kind of the item.
+            item (object): Item.
+
+        Returns:
+            bytes: Digest of the item.
+
+        """
+
+        entry = self._digests.get(id(item))
+        if entry is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(repr([_get_name(kind, item)] + [getattr(item, a) for a in ATTRIBUTES[kind]]).encode())
+            for child_kind, children in _get_children(kind, item):
+                h.update(child_kind.encode())
+                for child in children:
+                    h.update(self.get_digest(child_kind, child))
+
+            # The item is cached along with its digest, so that its id cannot be reused by another item (e.g.: the
+            # short-lived views of packed fields) for the lifetime of the diff.
+            entry = self._digests[id(item)] = (item, h.digest())
+
+        return entry[1]
+
+    def _compare(self, kind, parent_key, old_items, new_items):
+        old_index = _index(kind, old_items)
+        new_index = _index(kind, new_items)
+
+        for name, item in old_index.items():
+            if name not in new_index:
+                self.changes.append(Change(kind, parent_key + (name,), REMOVED, old=item))
+
+        for name, item in new_index.items():
+            key = parent_key + (name,)
+            old = old_index.get(name)
+            if old is None:
+                self.changes.append(Change(kind, key, ADDED, new=item))
+                continue
+
+            # Unchanged subtree.
+            if self.get_digest(kind, old) == self.get_digest(kind, item):
+                self.skipped += 1
+                continue
+
+            attributes = [(a, getattr(old, a), getattr(item, a)) for a in ATTRIBUTES[kind]
+                          if getattr(old, a) != getattr(item, a)]
+            if len(attributes) > 0:
+                self.changes.append(Change(kind, key, CHANGED, old, item, attributes))
+
+            for (child_kind, old_children), (_, new_children) in zip(_get_children(kind, old),
+                                                                      _get_children(kind, item)):
+                self._compare(child_kind, key, old_children, new_children)
+
+    def compare(self):
+        """Compares the APIs.
+
+        Returns:
+            list<prpl.apis.hl.spec.diff.Change>: Changes, response codes first, then objects (and their children).
+                Within each level, removed items come first, followed by added and changed items in the order of
+                the new API.
+
+        """
+
+        self.changes = []
+        self.skipped = 0
+
+        self._compare(RESPONSE_CODE, (), self.old_api.response_codes, self.new_api.response_codes)
+        self._compare(OBJECT, (), self.old_api.objects, self.new_api.objects)
+
+        return self.changes
+
+    def get_change_list(self, start=1):
+        """Drafts change list entries (see 'prpl.apis.hl.com.Version.change_list') describing every change.
+
+        Args:
+            start (int): Number of the first entry.
+
+        Returns:
+            list<tuple>: Numbered change descriptions.
+
+        """
+
+        if self.changes is None:
+            self.compare()
+
+        return [(start + i, c.get_description()) for i, c in enumerate(self.changes)]
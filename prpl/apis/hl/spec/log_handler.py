@@ -0,0 +1,142 @@
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+LOG_FORMAT = '[%(asctime)s] (%(name)s) <%(levelname)s>: %(message)s'
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler which leaves the formatting of records to the listener thread.
+
+    The stock handler merges the message and arguments before queueing. Records only travel between threads of the
+    same process here, so they can be queued as they are, as long as logged arguments are not mutated afterwards.
+
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class _Writer:
+    """Queue handler and background listener writing the records of the root logger to a single file."""
+
+    def __init__(self, filename, log_format, mode):
+        self.filename = filename
+
+        self.file_handler = logging.FileHandler(filename, mode=mode)
+        self.file_handler.setFormatter(logging.Formatter(log_format))
+
+        records = queue.SimpleQueue()
+        self.queue_handler = _DeferredQueueHandler(records)
+        self.listener = logging.handlers.QueueListener(records, self.file_handler)
+
+        # Number of started 'AsyncFileLogging' instances using this writer.
+        self.users = 0
+
+
+# Writers running in this process, by absolute log file name.
+_WRITERS = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+class AsyncFileLogging:
+    """Asynchronous file logging for prpl HL-API tools.
+
+    Log records are handed over to a queue by the calling thread and written to disk by a background listener, so
+    that DEBUG runs do not block the parsers and writers on file I/O. Records are formatted by the listener thread.
+
+    Instances logging to the same file share a single handler and listener within the process (e.g.: several
+    launchers created by the same script), which is only detached once all of them are stopped. The file is only
+    truncated when its handler is first created, restarting an instance appends to the file.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.log_handler import AsyncFileLogging
+
+        # Start logging to file.
+        log = AsyncFileLogging('parser.log', logging.DEBUG)
+        log.start()
+
+        ...
+
+        # Flush pending records and close file.
+        log.stop()
+
+    """
+
+    def __init__(self, filename, level=logging.INFO, log_format=LOG_FORMAT, mode='w'):
+        """Initializes the file logging.
+
+        Args:
+            filename (str): Log file name.
+            level (int): Root logger level (e.g.: 'logging.INFO').
+            log_format (str): Log record format.
+            mode (str): File mode, either 'w' (truncate) or 'a' (append).
+
+        """
+
+        self.filename = filename
+        self.level = level
+        self.log_format = log_format
+        self.mode = mode
+
+        self.writer = None
+        self.started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Attaches the queue handler to the root logger and starts the background writer."""
+
+        if self.writer is not None:
+            return
+
+        root = logging.getLogger()
+        filename = os.path.abspath(self.filename)
+
+        with _WRITERS_LOCK:
+            writer = _WRITERS.get(filename)
+            if writer is None:
+                writer = _Writer(filename, self.log_format, 'a' if self.started else self.mode)
+                _WRITERS[filename] = writer
+
+                root.addHandler(writer.queue_handler)
+                writer.listener.start()
+
+            writer.users += 1
+
+        root.setLevel(self.level)
+
+        self.writer = writer
+        self.started = True
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Detaches the queue handler, writes all pending records and closes the file, unless still used elsewhere."""
+
+        if self.writer is None:
+            return
+
+        writer = self.writer
+        self.writer = None
+        atexit.unregister(self.stop)
+
+        with _WRITERS_LOCK:
+            writer.users -= 1
+            if writer.users > 0:
+                return
+
+            del _WRITERS[writer.filename]
+
+        logging.getLogger().removeHandler(writer.queue_handler)
+        writer.listener.stop()
+        writer.file_handler.close()
@@ -0,0 +1,448 @@
+
+from collections import OrderedDict
+import asyncio
+import fnmatch
+import json
+import logging
+import math
+import os
+import re
+import signal
+import stat
+import time
+
+from prpl.apis.hl.spec.builder.validator_writer import REQUEST, RESPONSE
+from prpl.apis.hl.spec.builder.validator_writer import get_enum, get_field_tree, get_object_pattern, get_type_classes
+from prpl.apis.hl.spec.samples import EMPTY_SAMPLES, check_payload, check_sample, get_schema
+
+# JSON-RPC error codes.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+# ubus status codes, returned as the first item of the result of 'call' requests.
+UBUS_STATUS_OK = 0
+UBUS_STATUS_INVALID_ARGUMENT = 2
+UBUS_STATUS_METHOD_NOT_FOUND = 3
+UBUS_STATUS_NOT_FOUND = 4
+
+# Example values of fields with neither possible values nor a default value, by accepted class.
+EXAMPLE_VALUES = {
+    'str': '',
+    'int': 0,
+    'float': 0.0,
+    'bool': False,
+    'list': [],
+    'dict': {},
+}
+
+# Number of latencies kept for the percentiles (the most recent ones).
+LATENCY_SAMPLES = 100000
+
+# Maximum number of instance paths whose object is remembered.
+RESOLVED_LIMIT = 100000
+
+# Maximum length of a request line, and listen backlog of the socket.
+LINE_LIMIT = 1024 * 1024
+BACKLOG = 4096
+
+# Size of the pending responses of a connection past which the server waits for the client to read them.
+HIGH_WATER = 64 * 1024
+
+
+def _convert(value, classes):
+    """Converts a default value (text in specifications) to the type of a field."""
+
+    if not isinstance(value, str):
+        return value
+
+    if classes[0] == 'int':
+        return int(value)
+    if classes[0] == 'float':
+        return float(value)
+    if classes[0] == 'bool':
+        if value.lower() not in ('true', 'false'):
+            raise ValueError(value)
+        return value.lower() == 'true'
+    if classes[0] == 'str':
+        return value
+
+    return json.loads(value)
+
+
+def get_example(node):
+    """Makes up an example value of a field tree node, from the declared possible values, defaults and types.
+
+    Args:
+        node (prpl.apis.hl.spec.builder.validator_writer.FieldNode): Field tree node.
+
+    Returns:
+        object: Example value.
+
+    """
+
+    classes = get_type_classes(node)
+
+    if len(node.children) > 0:
+        value = OrderedDict((name, get_example(child)) for name, child in node.children.items())
+        return [value] if classes == ('list',) else value
+
+    field = node.field
+    enum = get_enum(field) if field is not None else None
+    if enum is not None:
+        return enum[0]
+
+    if classes is None:
+        return ''
+
+    default = field.default_value if field is not None else None
+    if default is not None and str(default).strip() not in EMPTY_SAMPLES:
+        try:
+            return _convert(default, classes)
+        except ValueError:
+            pass
+
+    return EXAMPLE_VALUES[classes[0]]
+
+
+class MockServer:
+    """Local ubus mock server for prpl HL-API.
+
+    Answers 'call' requests (i.e.: 'ubus call <Object> <Procedure>') with the responses of the specification, over a
+    JSON-RPC endpoint on a Unix socket, with one request (and one response) per line. Requests follow the ubus
+    JSON-RPC conventions, e.g.:
+
+        {"jsonrpc": "2.0", "id": 1, "method": "call", "params": [session, "User.Accounts.1", "Get", {}]}
+
+    and the result is a list made of the ubus status code and the response payload. Instances of templated objects
+    (e.g.: 'User.Accounts.1' for 'User.Accounts.{AccountId}') are resolved to their objects. 'list' requests return
+    the procedures of the objects, and the types of their arguments.
+
+    Every response is encoded once, when the server is created: from the sample response when it is valid JSON and
+    matches the declared output fields, otherwise made up from the output fields themselves. Request arguments are
+    checked against the declared input fields. The time spent on each request is recorded, to report latency
+    percentiles.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.mock_server import MockServer as HLAPIMockServer
+
+        # Serve the API until interrupted.
+        server = HLAPIMockServer(api, '/tmp/hlapi.sock')
+        server.run()
+
+        # Check latencies.
+        print(server.get_latency_percentiles())
+
+    """
+
+    def __init__(self, api, path, validate_requests=True, latency_samples=LATENCY_SAMPLES):
+        """Initializes the mock server, and precomputes its responses.
+
+        Args:
+            api (prpl.apis.hl.com.API): API to be served.
+            path (str): Path of the Unix socket.
+            validate_requests (bool): Whether to reject requests whose arguments do not match the declared input
+                fields, with an 'invalid argument' status.
+            latency_samples (int): Number of latencies kept for the percentiles (the most recent ones).
+
+        """
+
+        self.api = api
+        self.path = path
+        self.validate_requests = validate_requests
+        self.latency_samples = latency_samples
+
+        self.server = None
+        self.socket = None
+        self.requests = 0
+        self.latencies = []
+
+        # Init logger.
+        self.logger = logging.getLogger('MockServer')
+
+        self.header = self._get_header()
+        self.procedures = {}
+        self.signatures = OrderedDict()
+        self.patterns = []
+        self.resolved = {}
+        self.generated = 0
+
+        for api_object in api.objects:
+            self._add_object(api_object)
+
+        self.logger.info('Mock Server - Prepared %s procedures (%s responses made up from the fields).',
+                         len(self.procedures), self.generated)
+
+    def _get_header(self):
+        """Returns the header of successful responses, if responses of the specification have one."""
+
+        for response_code in self.api.response_codes:
+            if response_code.name != 'OK':
+                continue
+
+            try:
+                sample = json.loads(response_code.sample)
+            except (TypeError, ValueError):
+                return None
+
+            if isinstance(sample, dict) and isinstance(sample.get('Header'), dict):
+                return sample['Header']
+
+        return None
+
+    def _get_response(self, api_object, procedure):
+        """Returns the response payload of a procedure."""
+
+        tree = get_field_tree(procedure, RESPONSE)
+
+        sample = procedure.sample_response
+        if isinstance(sample, str) and sample.strip() not in EMPTY_SAMPLES:
+            issues = check_sample(sample, get_schema(tree))
+            if len(issues) == 0:
+                return json.loads(sample)
+
+            self.logger.debug('Mock Server - Sample response of %s.%s not used: %s', api_object.name,
+                              procedure.name, '; '.join(issues))
+
+        self.generated += 1
+        body = get_example(tree)
+
+        if self.header is None:
+            return body
+        if len(body) == 0:
+            return OrderedDict([('Header', self.header)])
+
+        return OrderedDict([('Header', self.header), ('Body', body)])
+
+    def _add_object(self, api_object):
+        """Precomputes the responses of the procedures of an object."""
+
+        signature = OrderedDict()
+
+        for procedure in api_object.procedures:
+            tree = get_field_tree(procedure, REQUEST)
+            schema = get_schema(tree) if self.validate_requests else None
+
+            result = json.dumps([UBUS_STATUS_OK, self._get_response(api_object, procedure)],
+                                separators=(',', ':')).encode()
+            self.procedures[(api_object.name, procedure.name)] = (schema, result)
+
+            signature[procedure.name] = OrderedDict(
+                (name, node.field.type if node.field is not None else 'Object') for name, node in tree.children.items())
+
+        self.signatures[api_object.name] = signature
+
+        pattern = get_object_pattern(api_object.name)
+        if pattern is not None:
+            self.patterns.append((re.compile(pattern), api_object.name))
+
+    def _resolve(self, object_name):
+        """Returns the name of the object matching an object name or instance path, or None."""
+
+        if object_name in self.signatures:
+            return object_name
+
+        name = self.resolved.get(object_name, '')
+        if name == '':
+            name = next((n for pattern, n in self.patterns if pattern.match(object_name)), None)
+
+            # Instance paths are made up by clients, so the cache is bounded.
+            if len(self.resolved) < RESOLVED_LIMIT:
+                self.resolved[object_name] = name
+
+        return name
+
+    @staticmethod
+    def _reply(request_id, result):
+        return b''.join([b'{"jsonrpc":"2.0","id":', request_id, b',"result":', result, b'}\n'])
+
+    @staticmethod
+    def _error(request_id, code, message):
+        return b''.join([b'{"jsonrpc":"2.0","id":', request_id, b',"error":',
+                         json.dumps({'code': code, 'message': message}).encode(), b'}\n'])
+
+    def _call(self, request_id, params):
+        """Answers a 'call' request."""
+
+        if not isinstance(params, list) or len(params) not in (3, 4) or not isinstance(params[1], str) or \
+                not isinstance(params[2], str):
+            return self._error(request_id, INVALID_PARAMS, 'Invalid params')
+
+        args = params[3] if len(params) == 4 else {}
+        if not isinstance(args, dict):
+            return self._error(request_id, INVALID_PARAMS, 'Invalid params')
+
+        name = self._resolve(params[1])
+        if name is None:
+            return self._reply(request_id, b'[%d]' % UBUS_STATUS_NOT_FOUND)
+
+        procedure = self.procedures.get((name, params[2]))
+        if procedure is None:
+            return self._reply(request_id, b'[%d]' % UBUS_STATUS_METHOD_NOT_FOUND)
+
+        schema, result = procedure
+        if schema is not None and len(args) + len(schema.children) > 0 and len(check_payload(args, schema)) > 0:
+            return self._reply(request_id, b'[%d]' % UBUS_STATUS_INVALID_ARGUMENT)
+
+        return self._reply(request_id, result)
+
+    def _list(self, request_id, params):
+        """Answers a 'list' request, with the objects matching an optional pattern."""
+
+        pattern = params[-1] if isinstance(params, list) and len(params) > 0 else '*'
+        if not isinstance(pattern, str):
+            return self._error(request_id, INVALID_PARAMS, 'Invalid params')
+
+        result = OrderedDict((n, s) for n, s in self.signatures.items() if fnmatch.fnmatchcase(n, pattern))
+
+        return self._reply(request_id, json.dumps(result, separators=(',', ':')).encode())
+
+    def respond(self, line):
+        """Answers a request.
+
+        Args:
+            line (bytes): JSON-RPC request.
+
+        Returns:
+            bytes: JSON-RPC response line, or an empty string for notifications (i.e.: requests without id).
+
+        """
+
+        try:
+            request = json.loads(line)
+        except (ValueError, RecursionError):
+            # Too deeply nested requests are reported as 'RecursionError'.
+            return self._error(b'null', PARSE_ERROR, 'Parse error')
+
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return self._error(b'null', INVALID_REQUEST, 'Invalid Request')
+
+        if 'id' not in request:
+            return b''
+
+        request_id = json.dumps(request['id']).encode()
+        method = request['method']
+
+        if method == 'call':
+            return self._call(request_id, request.get('params'))
+        if method == 'list':
+            return self._list(request_id, request.get('params'))
+
+        return self._error(request_id, METHOD_NOT_FOUND, 'Method not found')
+
+    def _record(self, latency):
+        if len(self.latencies) < self.latency_samples:
+            self.latencies.append(latency)
+        else:
+            self.latencies[self.requests % self.latency_samples] = latency
+        self.requests += 1
+
+    async def _handle(self, reader, writer):
+        """Serves a connection, answering its requests in order."""
+
+        try:
+            while True:
+                line = await reader.readline()
+                if len(line) == 0:
+                    break
+
+                started = time.perf_counter_ns()
+                writer.write(self.respond(line))
+                self._record(time.perf_counter_ns() - started)
+
+                # Only wait for slow clients.
+                if writer.transport.get_write_buffer_size() > HIGH_WATER:
+                    await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            # Lines past the limit are reported as 'ValueError'.
+            self.logger.debug('Mock Server - Connection closed: %s', e)
+        finally:
+            writer.close()
+
+    async def start(self):
+        """Starts listening on the Unix socket. Stale socket files are removed, but no other kind of file.
+
+        Raises:
+            Exception: If the path of the socket exists, but is not a socket.
+
+        """
+
+        try:
+            if not stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                raise Exception('"{}" exists and is not a socket.'.format(self.path))
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+        self.server = await asyncio.start_unix_server(self._handle, self.path, limit=LINE_LIMIT, backlog=BACKLOG)
+
+        status = os.lstat(self.path)
+        self.socket = (status.st_dev, status.st_ino)
+        self.logger.info('Mock Server - Listening on "%s".', self.path)
+
+    async def stop(self):
+        """Stops listening, and removes the socket file created by the server (unless it has been replaced since)."""
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+        if self.socket is not None:
+            try:
+                status = os.lstat(self.path)
+                if (status.st_dev, status.st_ino) == self.socket:
+                    os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.socket = None
+
+    async def serve(self):
+        """Serves requests until cancelled."""
+
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _serve_until_signaled(self):
+        task = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, task.cancel)
+
+        try:
+            await self.serve()
+        except asyncio.CancelledError:
+            pass
+
+    def run(self):
+        """Serves requests until interrupted (e.g.: with Ctrl+C) or terminated."""
+
+        asyncio.run(self._serve_until_signaled())
+
+    def get_latency_percentiles(self, percentiles=(50, 90, 99, 99.9)):
+        """Returns the percentiles of the time spent on the most recent requests.
+
+        Latencies cover decoding, checking and answering each request, from the moment it has been read to the
+        moment its response is queued for sending.
+
+        Args:
+            percentiles (tuple<float>): Percentiles to be computed.
+
+        Returns:
+            collections.OrderedDict: Latency of each percentile, in microseconds. Empty if no request was served.
+
+        """
+
+        latencies = sorted(self.latencies)
+        if len(latencies) == 0:
+            return OrderedDict()
+
+        # Nearest-rank percentiles.
+        return OrderedDict(
+            (p, latencies[min(len(latencies) - 1, max(0, math.ceil(len(latencies) * p / 100.0) - 1))] / 1000.0)
+            for p in percentiles)
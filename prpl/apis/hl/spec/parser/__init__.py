@@ -1,5 +1,28 @@
 
-from prpl.apis.hl.spec.parser.excel_reader import ExcelReader
-from prpl.apis.hl.spec.parser.json_reader import JSONReader
+import importlib
 
-__all__ = ['ExcelReader', 'JSONReader']
+# Readers are imported on first access, so that heavy backends (e.g.: openpyxl for the 'ExcelReader') are only
+# loaded when the matching format is used.
+_READERS = {
+    'ExcelReader': 'prpl.apis.hl.spec.parser.excel_reader',
+    'StreamingExcelReader': 'prpl.apis.hl.spec.parser.excel_reader',
+    'JSONReader': 'prpl.apis.hl.spec.parser.json_reader',
+    'SnapshotReader': 'prpl.apis.hl.spec.parser.snapshot_reader',
+}
+
+__all__ = ['ExcelReader', 'StreamingExcelReader', 'JSONReader', 'SnapshotReader']
+
+
+def __getattr__(name):
+    module = _READERS.get(name)
+    if module is None:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    reader = getattr(importlib.import_module(module), name)
+    globals()[name] = reader
+
+    return reader
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,9 @@ import os
 import logging
 
 from prpl.apis.hl.factory import ExcelObjectFactory as HLAPIObjectFactory
+from prpl.apis.hl.factory import excel_object_factory as HLAPIObjectFactoryModule
+from prpl.apis.hl.factory.row_sort import check_sorted, external_sort, get_sort_key
+from prpl.apis.hl.spec import profiler
 
 
 class ExcelReader:
@@ -36,17 +39,44 @@ class ExcelReader:
         # Parse events.
         events = parser.get_events()
 
+        # Iterate over the rows of a sheet, one at a time.
+        for row in parser.iter_sheet('Parameters'):
+            print(row['Parameter'])
+
+        # Parse and link the whole specification without holding whole sheets in memory.
+        api = HLAPIExcelParser('specs/hl-api.xlsx', streaming=True).parse()
+
     """
 
-    def __init__(self, spec):
+    # Sheets read by the streaming mode, with the sort key of their rows.
+    STREAMED_SHEETS = [
+        ('Objects & Methods', HLAPIObjectFactoryModule.PROCEDURE_KEY),
+        ('Parameters', HLAPIObjectFactoryModule.PARAMETER_KEY),
+        ('Data Types', HLAPIObjectFactoryModule.DATA_TYPE_KEY),
+        ('Events', HLAPIObjectFactoryModule.EVENT_KEY),
+        ('ToC', HLAPIObjectFactoryModule.INSTANCE_KEY),
+        ('Response Codes', HLAPIObjectFactoryModule.RESPONSE_CODE_KEY),
+    ]
+
+    # Maximum number of rows held in memory when the streaming mode sorts a sheet on disk.
+    STREAMING_SORT_BUDGET = 10000
+
+    def __init__(self, spec, string_pool=None, streaming=False):
         """Initializes the ExcelReader parser.
 
         Args:
             spec (str): Relative path to Excel specification file.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values.
+                Defaults to a new pool for each parse.
+            streaming (bool): Whether 'parse' links rows as they are read instead of reading whole sheets first.
+                Memory then scales with a single object rather than the whole specification, at the cost of reading
+                every sheet twice (once to check the order of its rows). Unsorted sheets are sorted on disk.
 
         """
 
         self.spec_path = '{}/{}'.format(os.getcwd(), spec)
+        self.string_pool = string_pool
+        self.streaming = streaming
         self.raw_procedures = None
         self.raw_parameters = None
         self.raw_data_types = None
@@ -57,16 +87,14 @@ class ExcelReader:
 
         self.logger = logging.getLogger('ExcelReader')
 
-    def _parse_sheet(self, name):
-        """Parses de specified Excel sheet and returns its contents
-        as a list of dictionaries.
+    def iter_sheet(self, name):
+        """Reads the specified Excel sheet lazily, one row at a time.
 
         Args:
-            name (str): Name of the Excel sheet to be parsed.
+            name (str): Name of the Excel sheet to be read.
 
-        Returns:
-            list<dict>: Array of dictionaries with cell contents. The keys are
-            the header names.
+        Yields:
+            dict: Cell contents of a row. The keys are the header names. Rows with an empty first cell are skipped.
 
         """
 
@@ -74,52 +102,62 @@ class ExcelReader:
         work_book = load_workbook(
             self.spec_path, data_only=True, read_only=True)
 
-        # Init return array.
-        entries = []
+        try:
+            rows = work_book[name].iter_rows(values_only=True)
+
+            # Read headers.
+            headers = next(rows, None)
+            if headers is None:
+                return
 
-        # Open specified sheet.
-        sheet = work_book[name]
+            for row in rows:
+                # make sure we don't capture empty rows
+                if len(row) > 0 and row[0]:
+                    yield dict(zip(headers, row))
+        finally:
+            # Close workbook.
+            work_book.close()
 
-        # Read headers.
-        headers = []
+    def _parse_sheet(self, name):
+        """Parses de specified Excel sheet and returns its contents
+        as a list of dictionaries.
 
-        # run through row iterator
-        for row in sheet.iter_rows():
+        Args:
+            name (str): Name of the Excel sheet to be parsed.
 
-            # use first iterator to create headers list
-            if headers == []:
+        Returns:
+            list<dict>: Array of dictionaries with cell contents. The keys are
+            the header names.
 
-                # iterate over each cell in row
-                for r in range(len(row)):
+        """
 
-                    # append cell value to header list
-                    headers.append(row[r].value)
+        with profiler.span('sheet/{}'.format(name)):
+            return list(self.iter_sheet(name))
 
-            # if we have the headers, let's parse the rest of the objects
-            else:
+    def _get_sorted_rows(self, name, key):
+        """Returns a lazy iterator over the rows of a sheet, in sorted order.
 
-                # create empty entry
-                entry = {}
+        The sheet is read once to check the order of its rows. Sorted sheets are then read again lazily, while unsorted
+        ones are sorted on disk.
 
-                # iterate over each cell in row
-                for r in range(len(row)):
+        Args:
+            name (str): Name of the Excel sheet to be read.
+            key (tuple<str>): Names of the columns the rows are sorted by.
 
-                    # make sure we don't capture empty rows
-                    if row[0].value:
+        Returns:
+            iterator<dict>: Sorted rows.
 
-                        # assign value to attribute on entry
-                        # object named after header
-                        entry[headers[r]] = row[r].value
+        """
 
-                if entry != {}:
-                    # append entry to entries list
-                    entries.append(entry)
+        with profiler.span('sheet/{}'.format(name)):
+            is_sorted, count = check_sorted(self.iter_sheet(name), get_sort_key(key))
 
-        # Close workbook.
-        work_book.close()
+        if is_sorted:
+            self.logger.info('%s - Found %s sorted rows.', name, count)
+            return self.iter_sheet(name)
 
-        # Return found procedures.
-        return entries
+        self.logger.info('%s - Found %s unsorted rows, sorting them.', name, count)
+        return external_sort(self.iter_sheet(name), get_sort_key(key), self.STREAMING_SORT_BUDGET)
 
     def get_change_log(self):
         """Parses the 'Change-Log' Excel sheet and returns a list of HL-API
@@ -143,6 +181,8 @@ class ExcelReader:
         # Start reading at B2.
         cell = ['B', '2']
 
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Iterate trough each row until two empty lines are found.
         while True:
                 # Read Version Header.
@@ -165,13 +205,9 @@ class ExcelReader:
 
                 # Quit if no more changes are available.
                 if change_number is None:
-                    self.logger.debug('ChangeLog - Found version "{}" \
-                        ({}) with {} changes.'.format(
-                            api_version['Number'],
-                            api_version['Date'],
-                            len(api_version['Changes'])
-                        )
-                    )
+                    if debug:
+                        self.logger.debug('ChangeLog - Found version "%s" (%s) with %s changes.',
+                                          api_version['Number'], api_version['Date'], len(api_version['Changes']))
 
                     # Skip the blank line for the next version.
                     cell[1] = str(int(cell[1]) + 1)
@@ -187,8 +223,9 @@ class ExcelReader:
                 cell = ['B', str(int(cell[1]) + 1)]
 
             change_log.append(api_version)
-            self.logger.debug(
-                'ChangeLog - Parsed entry {}.'.format(api_version))
+            if debug:
+                self.logger.debug(
+                    'ChangeLog - Parsed entry %s.', api_version)
 
         # Close work book.
         work_book.close()
@@ -276,9 +313,32 @@ class ExcelReader:
                                      self.raw_events,
                                      self.raw_instances,
                                      self.raw_response_codes,
-                                     self.raw_change_log)
+                                     self.raw_change_log,
+                                     string_pool=self.string_pool)
+
+        with profiler.span('link'):
+            return factory.get_api()
 
-        return factory.get_api()
+    def _stream_objects(self):
+        """Builds HL-API objects, linking rows as they are read."""
+
+        logger = logging.getLogger('ExcelReader')
+
+        # Parse change-log.
+        logger.info('ChangeLog - Parsing started.')
+        with profiler.span('sheet/Change-Log'):
+            change_log = self.get_change_log()
+        logger.info(
+            'ChangeLog - Parsing finished with %s versions discovered.\n', len(change_log))
+
+        rows = [self._get_sorted_rows(name, key) for name, key in self.STREAMED_SHEETS]
+
+        # Build objects.
+        logging.getLogger('ObjectFactory').info('Building API objects.\n')
+        factory = HLAPIObjectFactory(*rows, change_log, string_pool=self.string_pool, presorted=True)
+
+        with profiler.span('link'):
+            return factory.get_api()
 
     def parse(self):
         """Parses the Excel HL-API specification file.
@@ -286,57 +346,82 @@ class ExcelReader:
         It reads all Excel sheets and converts into list of dictionaries.
 
         """
+        if self.streaming:
+            return self._stream_objects()
+
         logger = logging.getLogger('ExcelReader')
 
         # Parse change-log.
         logger.info('ChangeLog - Parsing started.')
-        self.raw_change_log = self.get_change_log()
+        with profiler.span('sheet/Change-Log'):
+            self.raw_change_log = self.get_change_log()
         logger.info(
-            'ChangeLog - Parsing finished with {} versions discovered.\n'
-            .format(len(self.raw_change_log)))
+            'ChangeLog - Parsing finished with %s versions discovered.\n', len(self.raw_change_log))
 
         # Parse objects.
         logger.info('Objects - Parsing started.')
         self.raw_procedures = self.get_procedures()
         logger.info(
-            'Objects - Parsing finished with {} procedures discovered.\n'
-            .format(len(self.raw_procedures)))
+            'Objects - Parsing finished with %s procedures discovered.\n', len(self.raw_procedures))
 
         # Parse Parameters.
         logger.info('Parameters - Parsing started.')
         self.raw_parameters = self.get_parameters()
         logger.info(
-            'Parameters - Parsing finished with {} fields discovered.\n'
-            .format(len(self.raw_parameters)))
+            'Parameters - Parsing finished with %s fields discovered.\n', len(self.raw_parameters))
 
         # Parse Data Types
         logger.info('Data Types - Parsing started.')
         self.raw_data_types = self.get_data_types()
         logger.info(
-            'Data Types - Parsing finished with {} fields discovered.\n'
-            .format(len(self.raw_data_types)))
+            'Data Types - Parsing finished with %s fields discovered.\n', len(self.raw_data_types))
 
         # Parse response codes.
         logger.info('Response Codes - Parsing started.')
         self.raw_response_codes = self.get_response_codes()
         logger.info(
-            'Response Codes - Parsing finished with {} response codes.\n'
-            .format(len(self.raw_response_codes)))
+            'Response Codes - Parsing finished with %s response codes.\n', len(self.raw_response_codes))
 
         # Parse events.
         logger.info('Events - Parsing started.')
         self.raw_events = self.get_events()
         logger.info(
-            'Events - Parsing finished with {} events.\n'
-            .format(len(self.raw_events)))
+            'Events - Parsing finished with %s events.\n', len(self.raw_events))
 
         # Parse ToC (instances).
         logger.info('ToC - Parsing started.')
         self.raw_instances = self.get_instances()
         logger.info(
-            'ToC - Parsing finished with {} instances.\n'
-            .format(len(self.raw_instances)))
+            'ToC - Parsing finished with %s instances.\n', len(self.raw_instances))
 
         logger.info('Excel - Parsing finished.\n')
 
         return self._build_objects()
+
+
+class StreamingExcelReader(ExcelReader):
+    """Excel Parser for prpl HL-API, which links rows as they are read.
+
+    Same as the 'streaming' mode of 'ExcelReader': memory scales with a single object rather than the whole
+    specification, at the cost of reading every sheet twice.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.parser import StreamingExcelReader as HLAPIStreamingExcelParser
+
+        # Parse and link the specification.
+        api = HLAPIStreamingExcelParser('specs/hl-api.xlsx').parse()
+
+    """
+
+    def __init__(self, spec, string_pool=None):
+        """Initializes the StreamingExcelReader parser.
+
+        Args:
+            spec (str): Relative path to Excel specification file.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values.
+                Defaults to a new pool for each parse.
+
+        """
+
+        super().__init__(spec, string_pool=string_pool, streaming=True)
@@ -4,6 +4,7 @@ import json
 import logging
 
 from prpl.apis.hl.factory import JSONObjectFactory
+from prpl.apis.hl.spec import profiler
 
 
 class JSONReader:
@@ -23,16 +24,19 @@ class JSONReader:
         f.close()
         return res
 
-    def __init__(self, spec):
+    def __init__(self, spec, string_pool=None):
         """Initializes the ExcelReader parser.
 
         Args:
             spec (str): Relative path to Excel specification file.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values.
+                Defaults to a new pool for each parse.
 
         """
 
         self.api_json = None
         self.object_schemas = None
+        self.string_pool = string_pool
 
         self.spec_path = '{}/{}'.format(os.getcwd(), spec)
 
@@ -51,9 +55,11 @@ class JSONReader:
         # Build objects.
         logger.info('Building API objects.\n')
         factory = JSONObjectFactory(self.api_json,
-                                    self.object_schemas)
+                                    self.object_schemas,
+                                    string_pool=self.string_pool)
 
-        return factory.get_api()
+        with profiler.span('link'):
+            return factory.get_api()
 
     def _parse_objects(self):
         res = {}
@@ -75,9 +81,10 @@ class JSONReader:
         """
         logger = logging.getLogger('JSONReader')
 
-        self.api_json = json.loads(self._getFileContents("{}/api.json".format(self.spec_path)))
+        with profiler.span('read'):
+            self.api_json = json.loads(self._getFileContents("{}/api.json".format(self.spec_path)))
 
-        self.object_schemas = self._parse_objects()
+            self.object_schemas = self._parse_objects()
 
         logger.info('Excel - Parsing finished.\n')
 
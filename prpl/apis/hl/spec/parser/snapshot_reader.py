@@ -0,0 +1,204 @@
+
+from array import array
+from collections import OrderedDict
+import logging
+import mmap
+import os
+import sys
+
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Instance as HLAPIInstance
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.spec.snapshot_format import MAGIC, FORMAT_VERSION, HEADER, BYTE_ORDERS,\
+    KIND_STR, KIND_INT, REF_BASE, LAYOUT_FIELDS
+
+
+class SnapshotReader:
+    """Binary snapshot parser for prpl HL-API.
+
+    Loads an API written by 'prpl.apis.hl.spec.builder.SnapshotWriter'. The snapshot file is memory-mapped and
+    every unique value is decoded only once, so loading a snapshot is much faster than parsing the original
+    Excel or JSON specification.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.parser import SnapshotReader as HLAPISnapshotParser
+
+        # Loads parser with the snapshot.
+        parser = HLAPISnapshotParser('specs/generated/snapshot/prpl HL-API (3.8.2.7).hlapi')
+
+        # Load API.
+        api = parser.parse()
+
+    """
+
+    def __init__(self, spec):
+        """Initializes the SnapshotReader parser.
+
+        Args:
+            spec (str): Relative path to the snapshot file.
+
+        """
+
+        self.spec_path = os.path.join(os.getcwd(), spec)
+
+        self.values = None
+        self.graph = None
+        self.position = 0
+
+        self.logger = logging.getLogger('SnapshotReader')
+
+    def _load(self, buffer):
+        """Decodes the value table and graph section of a snapshot.
+
+        Args:
+            buffer (mmap.mmap): Snapshot contents.
+
+        """
+
+        magic, version, byte_order, value_count, text_size, graph_size = HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC:
+            raise Exception('File "{}" is not a HL-API snapshot.'.format(self.spec_path))
+
+        if version != FORMAT_VERSION:
+            raise Exception('Snapshot "{}" uses format version {}, expected {}.'.format(
+                self.spec_path, version, FORMAT_VERSION))
+
+        swap = byte_order != BYTE_ORDERS[sys.byteorder]
+        position = HEADER.size
+
+        # Read value kinds.
+        kinds = buffer[position:position + value_count]
+        position += value_count
+
+        # Read value offsets.
+        offsets = array('I')
+        offsets.frombytes(buffer[position:position + (value_count + 1) * offsets.itemsize])
+        position += (value_count + 1) * offsets.itemsize
+        if swap:
+            offsets.byteswap()
+
+        # Decode all values at once and slice them.
+        text = buffer[position:position + text_size].decode('utf-8')
+        position += text_size
+
+        values = [None, False, True]
+        values += [text[offsets[idx]:offsets[idx + 1]] for idx in range(value_count)]
+
+        # Convert non-string values.
+        for idx, kind in enumerate(kinds):
+            if kind != KIND_STR:
+                value = values[REF_BASE + idx]
+                values[REF_BASE + idx] = int(value) if kind == KIND_INT else float(value)
+
+        # Read graph.
+        graph = array('I')
+        graph.frombytes(buffer[position:position + graph_size * graph.itemsize])
+        if swap:
+            graph.byteswap()
+
+        self.values = values
+        self.graph = graph
+        self.position = 0
+
+    def _next(self, count=1):
+        """Reads the next entries of the graph.
+
+        Args:
+            count (int): Number of entries to read.
+
+        Returns:
+            list<int>: Graph entries.
+
+        """
+
+        start = self.position
+        self.position += count
+
+        return self.graph[start:self.position]
+
+    def _next_values(self, count):
+        """Reads the next value references of the graph and resolves them.
+
+        Args:
+            count (int): Number of values to read.
+
+        Returns:
+            list<object>: Resolved values.
+
+        """
+
+        values = self.values
+
+        return [values[ref] for ref in self._next(count)]
+
+    def _get_fields(self):
+        """Reads a list of fields from the graph.
+
+        Returns:
+            list<prpl.apis.hl.com.Field>: List of fields.
+
+        """
+
+        return [HLAPIField(*self._next_values(10)) for _ in range(self._next()[0])]
+
+    def _get_api(self):
+        """Rebuilds the API from the graph.
+
+        Returns:
+            prpl.apis.hl.com.API: Snapshot API.
+
+        """
+
+        versions = []
+        for _ in range(self._next()[0]):
+            v = HLAPIVersion(*self._next_values(2))
+            v.change_list = [tuple(self._next_values(2)) for _ in range(self._next()[0])]
+            versions.append(v)
+
+        response_codes = [HLAPIResponseCode(*self._next_values(4)) for _ in range(self._next()[0])]
+
+        objects = []
+        for _ in range(self._next()[0]):
+            api_object = HLAPIObject(*self._next_values(3))
+
+            for _ in range(self._next()[0]):
+                api_procedure = HLAPIProcedure(*self._next_values(4))
+                layout = self._next()[0]
+
+                api_procedure.parameters = self._get_fields()
+                if layout == LAYOUT_FIELDS:
+                    api_procedure.fields = OrderedDict((f.name, f) for f in self._get_fields())
+
+                api_object.procedures.append(api_procedure)
+
+            api_object.events = [HLAPIEvent(*self._next_values(4)) for _ in range(self._next()[0])]
+            api_object.instances = [HLAPIInstance(*self._next_values(2)) for _ in range(self._next()[0])]
+
+            objects.append(api_object)
+
+        return HLAPI(objects, response_codes, versions)
+
+    def parse(self):
+        """Parses the HL-API snapshot file.
+
+        Returns:
+            prpl.apis.hl.com.API: Snapshot API.
+
+        """
+
+        with open(self.spec_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self._load(buffer)
+
+        api = self._get_api()
+
+        self.logger.info('Snapshot - Parsing finished with %s objects.\n', len(api.objects))
+
+        return api
@@ -0,0 +1,307 @@
+
+from collections import OrderedDict
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+
+# Profiler collecting the spans, if any (see 'Profiler.start').
+_active = None
+
+
+class _NullSpan:
+    """Span used while profiling is disabled, which does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """Measures a block of code, if profiling is enabled.
+
+    Spans nest: the name of a span is prefixed with the names of the spans it runs in (e.g.: 'json/object/paths'
+    for an 'object/paths' span inside the 'json' stage). Spans with the same name are aggregated, so they can be
+    placed in per-object loops. Disabled spans cost a function call.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec import profiler
+
+        with profiler.span('object/paths'):
+            paths = self.getPaths(name, idx, obj)
+
+    Args:
+        name (str): Span name.
+
+    Returns:
+        object: Context manager.
+
+    """
+
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+
+    return profiler.span(name)
+
+
+class _Span:
+    """Measurement of a single run of a span."""
+
+    __slots__ = ('profiler', 'name', 'wall', 'cpu', 'memory', 'child_peak')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._get_stack()
+        parent = stack[-1] if len(stack) > 0 else None
+        if parent is not None:
+            self.name = '{}/{}'.format(parent.name, self.name)
+        stack.append(self)
+
+        self.memory = None
+        self.child_peak = 0
+        if self.profiler.trace_memory and tracemalloc.is_tracing():
+            self.memory, peak = tracemalloc.get_traced_memory()
+            if parent is not None and parent.memory is not None:
+                # Keep the peak reached by the parent so far, before resetting it.
+                parent.child_peak = max(parent.child_peak, peak)
+            tracemalloc.reset_peak()
+
+        self.wall, self.cpu = time.perf_counter(), time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall, cpu = time.perf_counter() - self.wall, time.thread_time() - self.cpu
+
+        peak = None
+        if self.memory is not None:
+            # The peak was reset by every nested span, so the peaks reached before those resets are kept too.
+            peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+
+        stack = self.profiler._get_stack()
+        stack.pop()
+        if len(stack) > 0 and peak is not None:
+            stack[-1].child_peak = max(stack[-1].child_peak, peak)
+
+        self.profiler._record(self.name, wall, cpu, None if peak is None else peak - self.memory)
+        return False
+
+
+class Profiler:
+    """Span based profiler for prpl HL-API tools.
+
+    Collects the wall time, CPU time, number of calls and memory peak (with 'tracemalloc') of every span, and can
+    keep a cProfile dump of the slowest stage, which can be explored with e.g. 'snakeviz' or turned into a
+    flamegraph with 'flameprof'.
+
+    Memory peaks are measured above the memory in use when the span started. As 'tracemalloc' traces the whole
+    process, spans should not run concurrently on several threads while memory is traced.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.profiler import Profiler
+
+        # Profile a run.
+        profiler = Profiler(dump_stages=True)
+        with profiler:
+            with profiler.stage('parse'):
+                api = parser.parse()
+
+        profiler.write_report('profile.json')
+        profiler.dump_slowest_stage('profile.prof')
+
+    """
+
+    def __init__(self, trace_memory=True, dump_stages=False):
+        """Initializes the profiler.
+
+        Args:
+            trace_memory (bool): Whether to measure memory peaks with 'tracemalloc' (slows down allocations).
+            dump_stages (bool): Whether to run stages under cProfile, to dump the slowest one.
+
+        """
+
+        self.trace_memory = trace_memory
+        self.dump_stages = dump_stages
+
+        self.spans = OrderedDict()
+        self.stages = OrderedDict()
+        self.stage_profiles = {}
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracing = False
+        self._previous = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _get_stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+    def _record(self, name, wall, cpu, peak):
+        with self._lock:
+            entry = self.spans.get(name)
+            if entry is None:
+                entry = self.spans[name] = {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'max_wall': 0.0,
+                                            'peak_memory': None}
+
+            entry['calls'] += 1
+            entry['wall'] += wall
+            entry['cpu'] += cpu
+            entry['max_wall'] = max(entry['max_wall'], wall)
+            if peak is not None:
+                entry['peak_memory'] = max(entry['peak_memory'] or 0, peak)
+
+    def start(self):
+        """Makes this the active profiler, so that 'span' calls are measured."""
+
+        global _active
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self._previous = _active
+        _active = self
+
+    def stop(self):
+        """Deactivates the profiler."""
+
+        global _active
+
+        if _active is self:
+            _active = self._previous
+        self._previous = None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def span(self, name):
+        """Measures a block of code (see the module 'span' function).
+
+        Args:
+            name (str): Span name.
+
+        Returns:
+            object: Context manager.
+
+        """
+
+        return _Span(self, name)
+
+    def stage(self, name):
+        """Measures a top-level stage (e.g.: parsing, or building an output).
+
+        Args:
+            name (str): Stage name.
+
+        Returns:
+            object: Context manager.
+
+        """
+
+        return _Stage(self, name)
+
+    def get_slowest_stage(self):
+        """Returns the name of the stage with the longest wall time, or None if no stage ran."""
+
+        if len(self.stages) == 0:
+            return None
+
+        return max(self.stages, key=lambda name: self.stages[name])
+
+    def get_report(self):
+        """Builds the profiling report.
+
+        Returns:
+            dict: Stages (wall times, in seconds), slowest stage and spans (calls, total wall and CPU time, longest
+            call and memory peak in bytes), in the order spans first finished.
+
+        """
+
+        with self._lock:
+            spans = OrderedDict((name, dict(entry)) for name, entry in self.spans.items())
+
+        return OrderedDict([
+            ('stages', OrderedDict(self.stages)),
+            ('slowest_stage', self.get_slowest_stage()),
+            ('trace_memory', self.trace_memory),
+            ('spans', spans),
+        ])
+
+    def write_report(self, file):
+        """Writes the profiling report in JSON format.
+
+        Args:
+            file (str): Report file name.
+
+        """
+
+        with open(file, 'w') as f:
+            json.dump(self.get_report(), f, indent=2)
+
+    def dump_slowest_stage(self, file):
+        """Writes the cProfile statistics of the slowest stage (requires 'dump_stages').
+
+        Args:
+            file (str): Statistics file name (in 'pstats' format).
+
+        Returns:
+            str: Name of the dumped stage, or None if there is nothing to dump.
+
+        """
+
+        stage = self.get_slowest_stage()
+        if stage is None or stage not in self.stage_profiles:
+            return None
+
+        self.stage_profiles[stage].dump_stats(file)
+        return stage
+
+
+class _Stage:
+    """Top-level span, optionally run under cProfile."""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.span = profiler.span(name)
+        self.profile = cProfile.Profile() if profiler.dump_stages else None
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.span.__enter__()
+        if self.profile is not None:
+            self.profile.enable()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.profile is not None:
+            self.profile.disable()
+            self.profiler.stage_profiles[self.name] = self.profile
+
+        self.span.__exit__(exc_type, exc_value, traceback)
+        self.profiler.stages[self.name] = time.perf_counter() - self.wall
+
+        return False
@@ -0,0 +1,354 @@
+
+from collections import OrderedDict
+import importlib
+import logging
+import os
+
+# Backend kinds.
+READER = 'reader'
+WRITER = 'writer'
+
+# Backend capabilities.
+STREAMING = 'streaming'
+INCREMENTAL = 'incremental'
+INTERNING = 'interning'
+CAPABILITIES = frozenset([STREAMING, INCREMENTAL, INTERNING])
+
+# Entry point groups scanned for third-party backends. Entry point names are format names, and values reference a
+# 'Backend' (or a list of them) declared in a module which is cheap to import.
+ENTRY_POINT_GROUPS = {
+    READER: 'prpl.hlapi.readers',
+    WRITER: 'prpl.hlapi.writers',
+}
+
+# Default folder of the writer outputs.
+OUTPUT_FOLDER = 'specs/generated'
+
+
+class Backend:
+    """HL-API reader or writer declaration.
+
+    A backend declares what it can do without being imported: the implementation class is referenced by name and
+    only loaded when the backend is actually used.
+
+    Readers are created as 'reader(spec)' and provide 'parse()', which returns the API. Incremental readers also
+    provide 'update(api)', which updates a parsed API in place and returns the changed parts. Interning readers also
+    accept a 'string_pool' argument (see 'prpl.apis.hl.factory.StringPool'), which may be shared between parses.
+
+    Writers are created as 'writer(api, output)' and provide 'build()'. The output is given by the 'output' pattern,
+    where '{folder}' is replaced by the output folder and '{version}' by the API version.
+
+    Cost hints are rough estimates, in milliseconds, of the fixed cost of the backend (e.g.: importing its
+    dependencies) and of its cost per unit of work (MB of input specification for readers, API object for writers).
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.registry import Backend, WRITER, STREAMING
+
+        # Declare backend.
+        backend = Backend(WRITER, 'xls', 'StreamingExcelWriter', 'my.package.excel:StreamingExcelWriter',
+                          capabilities=[STREAMING], startup_cost=40, unit_cost=0.2,
+                          output='{folder}/')
+
+    """
+
+    def __init__(self, kind, format, name, target, capabilities=(), startup_cost=0.0, unit_cost=0.0,
+                 output=None, label=None):
+        """Creates a new backend declaration.
+
+        Args:
+            kind (str): Backend kind ('reader' or 'writer').
+            format (str): Format name (e.g.: 'xls').
+            name (str): Backend name, also used as its logger name (e.g.: 'ExcelReader').
+            target (str): Implementation, as 'module:attribute'.
+            capabilities (list<str>): Capabilities ('streaming', 'incremental' and/or 'interning').
+            startup_cost (float): Fixed cost hint, in milliseconds.
+            unit_cost (float): Cost hint per unit of work, in milliseconds.
+            output (str): Output file (or folder) pattern of a writer (e.g.: '{folder}/{version}.db').
+            label (str): Human-readable format label used in log messages. Defaults to the format name.
+
+        """
+
+        if kind not in ENTRY_POINT_GROUPS:
+            raise Exception('Unknown backend kind "{}".'.format(kind))
+        unknown = set(capabilities) - CAPABILITIES
+        if len(unknown) > 0:
+            raise Exception('Unknown capabilities {} of backend "{}".'.format(sorted(unknown), name))
+
+        self.kind = kind
+        self.format = format
+        self.name = name
+        self.target = target
+        self.capabilities = frozenset(capabilities)
+        self.startup_cost = startup_cost
+        self.unit_cost = unit_cost
+        self.output = output
+        self.label = label or format
+
+    def __str__(self):
+        """Converts object to human-readable string.
+
+        Returns:
+            str: Human-readable representation of the backend.
+
+        """
+
+        return '{} {} "{}" ({})'.format(self.format, self.kind, self.name, ', '.join(sorted(self.capabilities)))
+
+    def supports(self, capabilities):
+        """Tells whether the backend has all the specified capabilities.
+
+        Args:
+            capabilities (list<str>): Required capabilities.
+
+        Returns:
+            bool: Whether all capabilities are supported.
+
+        """
+
+        return self.capabilities.issuperset(capabilities)
+
+    def get_cost(self, size=0):
+        """Estimates the cost of running the backend.
+
+        Args:
+            size (float): Units of work (MB of input specification for readers, API objects for writers).
+
+        Returns:
+            float: Estimated cost, in milliseconds.
+
+        """
+
+        return self.startup_cost + self.unit_cost * size
+
+    def load(self):
+        """Imports the implementation of the backend.
+
+        Returns:
+            type: Reader or writer class.
+
+        """
+
+        module, _, attribute = self.target.partition(':')
+        return getattr(importlib.import_module(module), attribute)
+
+    def get_output(self, api, folder=OUTPUT_FOLDER):
+        """Returns the output file (or folder) of a writer for the specified API.
+
+        Args:
+            api (prpl.apis.hl.com.API): API to be written.
+            folder (str): Output folder. Defaults to 'specs/generated'.
+
+        Returns:
+            str: Output file (or folder).
+
+        """
+
+        return self.output.format(folder=folder, version=api.get_version())
+
+
+class FormatRegistry:
+    """Registry of the HL-API readers and writers, indexed by format.
+
+    Built-in backends are declared up front. Third-party backends are discovered from the 'prpl.hlapi.readers'
+    and 'prpl.hlapi.writers' entry point groups, only when a format is first looked up, and only the entry points
+    of that format are loaded.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.registry import registry, WRITER, STREAMING
+
+        # Pick the cheapest streaming Excel writer, for an API of 2000 objects.
+        backend = registry.select(WRITER, 'xls', [STREAMING], 2000)
+        writer = backend.load()(api, backend.get_output(api))
+        writer.build()
+
+    """
+
+    def __init__(self, backends=(), discover=True):
+        """Initializes the registry.
+
+        Args:
+            backends (list<Backend>): Initial backends.
+            discover (bool): Whether to discover backends from entry points.
+
+        """
+
+        self.backends = {READER: OrderedDict(), WRITER: OrderedDict()}
+        self.discover = discover
+        self.discovered = set()
+        self.entry_points = {}
+
+        self.logger = logging.getLogger('FormatRegistry')
+
+        for backend in backends:
+            self.register(backend)
+
+    def register(self, backend):
+        """Adds a backend. A backend with the same kind, format and name is replaced.
+
+        Args:
+            backend (Backend): Backend declaration.
+
+        """
+
+        formats = self.backends[backend.kind]
+        formats.setdefault(backend.format, OrderedDict())[backend.name] = backend
+
+    def _get_entry_points(self, kind):
+        """Returns the entry points of a backend kind (without loading them), scanning installed packages once."""
+
+        if kind not in self.entry_points:
+            try:
+                from importlib.metadata import entry_points
+            except ImportError:
+                return []
+
+            group = ENTRY_POINT_GROUPS[kind]
+            found = entry_points()
+            self.entry_points[kind] = list(found.select(group=group) if hasattr(found, 'select')
+                                           else found.get(group, []))
+
+        return self.entry_points[kind]
+
+    def _discover(self, kind, format):
+        """Loads the entry points of a format, once.
+
+        Args:
+            kind (str): Backend kind.
+            format (str): Format name.
+
+        """
+
+        if not self.discover or (kind, format) in self.discovered:
+            return
+        self.discovered.add((kind, format))
+
+        for entry_point in self._get_entry_points(kind):
+            if entry_point.name != format:
+                continue
+
+            try:
+                declared = entry_point.load()
+            except Exception:
+                self.logger.exception('Unable to load %s entry point "%s".', kind, entry_point.value)
+                continue
+
+            for backend in (declared if isinstance(declared, (list, tuple)) else [declared]):
+                self.logger.debug('Discovered %s.', backend)
+                self.register(backend)
+
+    def get_formats(self, kind):
+        """Returns the names of all known formats of a backend kind.
+
+        Args:
+            kind (str): Backend kind ('reader' or 'writer').
+
+        Returns:
+            list<str>: Format names.
+
+        """
+
+        formats = list(self.backends[kind])
+        if self.discover:
+            formats += [e.name for e in self._get_entry_points(kind) if e.name not in formats]
+
+        return formats
+
+    def get_backends(self, kind, format):
+        """Returns all backends of a format.
+
+        Args:
+            kind (str): Backend kind ('reader' or 'writer').
+            format (str): Format name.
+
+        Returns:
+            list<Backend>: Backends, in registration order.
+
+        """
+
+        self._discover(kind, format)
+        return list(self.backends[kind].get(format, {}).values())
+
+    def select(self, kind, format, capabilities=(), size=0):
+        """Picks the cheapest backend of a format with all the required capabilities.
+
+        Args:
+            kind (str): Backend kind ('reader' or 'writer').
+            format (str): Format name.
+            capabilities (list<str>): Required capabilities.
+            size (float): Units of work (MB of input specification for readers, API objects for writers).
+
+        Returns:
+            Backend: Selected backend.
+
+        """
+
+        backends = self.get_backends(kind, format)
+        if len(backends) == 0:
+            raise Exception('Unknown {} format "{}".'.format(kind, format))
+
+        capable = [b for b in backends if b.supports(capabilities)]
+        if len(capable) == 0:
+            raise Exception('No {} of format "{}" supports {}.'.format(kind, format, ', '.join(sorted(capabilities))))
+
+        # Ties are resolved in registration order (i.e.: built-in backends first).
+        return min(capable, key=lambda b: b.get_cost(size))
+
+
+def get_spec_size(spec):
+    """Returns the size of a specification file (or folder), in MB.
+
+    Args:
+        spec (str): Specification file or folder.
+
+    Returns:
+        float: Size in MB (0 if it does not exist).
+
+    """
+
+    if os.path.isdir(spec):
+        size = sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(spec) for f in files)
+    elif os.path.isfile(spec):
+        size = os.path.getsize(spec)
+    else:
+        size = 0
+
+    return size / (1024 * 1024)
+
+
+# Built-in backends. Startup costs come from 'benchmarks/bench_import_time.py', unit costs are order-of-magnitude
+# estimates, only meant to rank backends of the same format.
+BUILTIN_BACKENDS = [
+    Backend(READER, 'xls', 'ExcelReader', 'prpl.apis.hl.spec.parser:ExcelReader',
+            capabilities=[INTERNING], startup_cost=160, unit_cost=2000, label='Excel'),
+    Backend(READER, 'xls', 'StreamingExcelReader', 'prpl.apis.hl.spec.parser:StreamingExcelReader',
+            capabilities=[STREAMING, INTERNING], startup_cost=160, unit_cost=3000, label='Excel'),
+    Backend(READER, 'json', 'JSONReader', 'prpl.apis.hl.spec.parser:JSONReader',
+            capabilities=[INTERNING], startup_cost=20, unit_cost=300, label='JSON'),
+    Backend(READER, 'snapshot', 'SnapshotReader', 'prpl.apis.hl.spec.parser:SnapshotReader',
+            startup_cost=15, unit_cost=50, label='Snapshot'),
+    Backend(READER, 'xls', 'ExcelSource', 'prpl.apis.hl.spec.watch:ExcelSource',
+            capabilities=[INCREMENTAL, INTERNING], startup_cost=185, unit_cost=2000, label='Excel'),
+    Backend(READER, 'json', 'JSONSource', 'prpl.apis.hl.spec.watch:JSONSource',
+            capabilities=[INCREMENTAL, INTERNING], startup_cost=45, unit_cost=300, label='JSON'),
+    # Schemas are built from copies of the fields which are renamed (see 'JSONSchemaWriter.getNestedProperty'), so the
+    # parsed API is left untouched for the writers which run after it.
+    Backend(WRITER, 'json', 'JSONSchemaWriter', 'prpl.apis.hl.spec.builder:JSONSchemaWriter',
+            startup_cost=15, unit_cost=2, label='JSON Schema', output='{folder}/json/v{version}/'),
+    Backend(WRITER, 'word', 'WordWriter', 'prpl.apis.hl.spec.builder:WordWriter',
+            startup_cost=70, unit_cost=20, label='Word', output='{folder}/prpl HL-API ({version}).docx'),
+    Backend(WRITER, 'xls', 'ExcelWriter', 'prpl.apis.hl.spec.builder:ExcelWriter',
+            startup_cost=165, unit_cost=5, label='Excel', output='{folder}/'),
+    Backend(WRITER, 'snapshot', 'SnapshotWriter', 'prpl.apis.hl.spec.builder:SnapshotWriter',
+            startup_cost=5, unit_cost=0.5, label='Snapshot',
+            output='{folder}/snapshot/prpl HL-API ({version}).hlapi'),
+    Backend(WRITER, 'sqlite', 'SQLiteWriter', 'prpl.apis.hl.spec.builder:SQLiteWriter',
+            startup_cost=10, unit_cost=1, label='SQLite', output='{folder}/sqlite/prpl HL-API ({version}).db'),
+    Backend(WRITER, 'validator', 'ValidatorWriter', 'prpl.apis.hl.spec.builder:ValidatorWriter',
+            startup_cost=5, unit_cost=0.5, label='Validators',
+            output='{folder}/validators/v{version}/hlapi_validators.py'),
+]
+
+# Default registry.
+registry = FormatRegistry(BUILTIN_BACKENDS)
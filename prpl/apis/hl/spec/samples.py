@@ -0,0 +1,333 @@
+
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+import os
+import weakref
+
+from prpl.apis.hl.spec.builder.validator_writer import REQUEST, RESPONSE
+from prpl.apis.hl.spec.builder.validator_writer import get_enum, get_field_tree, get_type_classes
+
+# Kinds of samples.
+EVENT = 'event'
+RESPONSE_CODE = 'response_code'
+
+LABELS = {
+    REQUEST: 'request',
+    RESPONSE: 'response',
+    EVENT: 'event',
+    RESPONSE_CODE: 'response code',
+}
+
+# Values used in specifications for missing samples.
+EMPTY_SAMPLES = frozenset(['', '-'])
+
+# Minimum number of samples to be checked before worker processes are used.
+PARALLEL_THRESHOLD = 2000
+
+# Declared fields of a payload (see 'get_schema'). Children are (name, schema) tuples.
+Schema = namedtuple('Schema', ['type_name', 'classes', 'required', 'enum', 'children'])
+
+_CLASSES = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'list': list,
+    'dict': dict,
+}
+
+
+class SampleIssue:
+    """Mismatch between a sample payload and its declaration.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.samples import SampleIssue as HLAPISampleIssue
+
+        # Create new instance.
+        issue = HLAPISampleIssue('request', ('User.Accounts', 'Add'), 'Password: undeclared field')
+
+    """
+
+    def __init__(self, kind, key, message):
+        """Creates a new issue.
+
+        Args:
+            kind (str): Kind of the sample: 'request', 'response', 'event' or 'response_code'.
+            key (tuple<str>): Key of the sample owner: object and procedure (or event code) names, or the response
+                code name.
+            message (str): Description of the mismatch.
+
+        """
+
+        self.kind = kind
+        self.key = key
+        self.message = message
+
+    def __str__(self):
+        """Converts object to human-readable string.
+
+        Returns:
+            str: Human-readable representation of the issue.
+
+        """
+
+        return '{} ({} sample): {}'.format('/'.join(self.key), LABELS[self.kind], self.message)
+
+
+def get_schema(node):
+    """Converts a field tree into plain tuples, which are cheap to hash and to send to worker processes.
+
+    Args:
+        node (prpl.apis.hl.spec.builder.validator_writer.FieldNode): Field tree node.
+
+    Returns:
+        prpl.apis.hl.spec.samples.Schema: Type name, accepted classes, whether the value is required, allowed values
+            and children.
+
+    """
+
+    field = node.field
+    type_name = field.type if field is not None and isinstance(field.type, str) else 'Object'
+    enum = get_enum(field) if field is not None and len(node.children) == 0 else None
+
+    return Schema(type_name, get_type_classes(node), node.required, tuple(enum) if enum is not None else None,
+                  tuple((name, get_schema(child)) for name, child in node.children.items()))
+
+
+def _check_value(value, schema, path, errors):
+    type_name, classes, _, enum, children = schema
+
+    if classes is not None and not isinstance(value, tuple(_CLASSES[c] for c in classes)):
+        errors.append('{}: expected {}'.format(path, type_name))
+        return
+
+    # Booleans are integers in Python, but not in JSON.
+    if classes is not None and value.__class__ is bool and 'bool' not in classes:
+        errors.append('{}: expected {}'.format(path, type_name))
+        return
+
+    if enum is not None and value not in enum:
+        errors.append('{}: expected one of {}'.format(path, ', '.join('"{}"'.format(v) for v in enum)))
+        return
+
+    if len(children) == 0:
+        return
+
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, dict):
+                _check_object(item, children, '{}[{}]'.format(path, index), errors)
+            else:
+                errors.append('{}[{}]: expected Object'.format(path, index))
+    elif isinstance(value, dict):
+        _check_object(value, children, path, errors)
+
+
+def _check_object(value, children, path, errors):
+    prefix = path + '.' if path else ''
+    declared = set()
+
+    for name, schema in children:
+        declared.add(name)
+        if name in value:
+            _check_value(value[name], schema, prefix + name, errors)
+        elif schema.required:
+            errors.append('{}{}: missing required field'.format(prefix, name))
+
+    for name in value:
+        if name not in declared:
+            errors.append('{}{}: undeclared field'.format(prefix, name))
+
+
+def check_payload(value, schema):
+    """Checks a parsed payload (e.g.: the arguments of a request) against its declared fields.
+
+    Args:
+        value (object): Payload.
+        schema (prpl.apis.hl.spec.samples.Schema): Declared fields (see 'get_schema').
+
+    Returns:
+        list<str>: Mismatches found in the payload.
+
+    """
+
+    if not isinstance(value, dict):
+        return ['expected an object']
+
+    errors = []
+    _check_object(value, schema.children, '', errors)
+
+    return errors
+
+
+def check_sample(sample, schema=None, name=None):
+    """Parses a sample and checks it against its declaration.
+
+    Args:
+        sample (str): Sample payload, as JSON text.
+        schema (prpl.apis.hl.spec.samples.Schema): Declared fields (see 'get_schema'), if any. Responses wrapped in a 'Header' (and 'Body')
+            are checked on their body.
+        name (str): Expected response name (i.e.: the 'Name' of the 'Header'), if any.
+
+    Returns:
+        list<str>: Mismatches found in the sample.
+
+    """
+
+    try:
+        value = json.loads(sample)
+    except ValueError as e:
+        return ['invalid JSON ({})'.format(e)]
+
+    if not isinstance(value, dict):
+        return ['expected an object']
+
+    errors = []
+    header = value.get('Header')
+
+    if name is not None and isinstance(header, dict) and header.get('Name', name) != name:
+        errors.append('Header.Name: expected "{}"'.format(name))
+
+    if schema is not None:
+        if header is not None:
+            body = value.get('Body', {})
+            if isinstance(body, dict):
+                _check_object(body, schema.children, 'Body', errors)
+            else:
+                errors.append('Body: expected an object')
+        else:
+            _check_object(value, schema.children, '', errors)
+
+    return errors
+
+
+def _check_samples(tasks):
+    """Checks a chunk of samples, in a worker process."""
+
+    return [check_sample(*task) for task in tasks]
+
+
+class SampleChecker:
+    """Sample payload checker for prpl HL-API.
+
+    Parses the request and response samples of every procedure, and the samples of events and response codes, and
+    reports the samples which are not valid JSON, instead of having the writers silently drop them. Procedure samples
+    are also checked against the declared fields of their procedure (undeclared or missing required fields, types and
+    enums), and response code samples against the name of their response code. Events do not declare fields, so their
+    samples are only checked to be JSON objects.
+
+    Results are cached across calls (e.g.: when rechecking a specification being edited), by sample text and, for
+    procedure samples, by procedure. The declared fields of a procedure are only converted when one of its samples
+    has not been checked before, so procedures are expected to be replaced rather than modified in place when their
+    fields change, as the incremental readers do (see 'prpl.apis.hl.spec.watch'). Large specifications are checked in
+    parallel by worker processes, one chunk of objects at a time.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.samples import SampleChecker as HLAPISampleChecker
+
+        # Check samples.
+        checker = HLAPISampleChecker(api)
+        for issue in checker.check():
+            print(issue)
+
+    """
+
+    def __init__(self, api, jobs=None):
+        """Initializes the sample checker.
+
+        Args:
+            api (prpl.apis.hl.com.API): API to be checked.
+            jobs (int): Number of worker processes. Defaults to the number of CPUs.
+
+        """
+
+        self.api = api
+        self.jobs = jobs or os.cpu_count() or 1
+
+        # Results of procedure samples by procedure (held weakly), and of other samples by task.
+        self.procedures = weakref.WeakKeyDictionary()
+        self.cache = {}
+        self.checked = 0
+        self.cached = 0
+
+        # Init logger.
+        self.logger = logging.getLogger('SampleChecker')
+
+    def _get_samples(self, api_object):
+        """Lists the samples of an object, as (kind, key, results, cache key, procedure) tuples."""
+
+        samples = []
+
+        for procedure in api_object.procedures:
+            results = self.procedures.get(procedure)
+            if results is None:
+                results = self.procedures[procedure] = {}
+
+            for kind, sample in ((REQUEST, procedure.sample_request), (RESPONSE, procedure.sample_response)):
+                if isinstance(sample, str) and sample.strip() not in EMPTY_SAMPLES:
+                    samples.append((kind, (api_object.name, procedure.name), results, (kind, sample), procedure))
+
+        for event in api_object.events:
+            if isinstance(event.sample, str) and event.sample.strip() not in EMPTY_SAMPLES:
+                samples.append((EVENT, (api_object.name, str(event.code)), self.cache, (event.sample,), None))
+
+        return samples
+
+    def _run(self, tasks):
+        """Checks samples, in worker processes if there are enough of them."""
+
+        jobs = min(self.jobs, len(tasks) // PARALLEL_THRESHOLD + 1)
+        if jobs < 2:
+            return _check_samples(tasks)
+
+        size = len(tasks) // (jobs * 4) + 1
+        chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return [errors for chunk in executor.map(_check_samples, chunks) for errors in chunk]
+
+    def check(self):
+        """Checks every sample of the API.
+
+        Returns:
+            list<prpl.apis.hl.spec.samples.SampleIssue>: Issues, in the order of the specification (response
+                codes first).
+
+        """
+
+        samples = []
+        for response_code in self.api.response_codes:
+            if isinstance(response_code.sample, str) and response_code.sample.strip() not in EMPTY_SAMPLES:
+                samples.append((RESPONSE_CODE, (response_code.name,), self.cache,
+                                (response_code.sample, None, response_code.name), None))
+
+        # Objects are listed in order, so each chunk of samples covers a run of consecutive objects.
+        for api_object in self.api.objects:
+            samples.extend(self._get_samples(api_object))
+
+        # Only check samples which were not seen before, once per distinct sample and declaration.
+        pending = OrderedDict()
+        for kind, _, results, cache_key, procedure in samples:
+            if cache_key not in results:
+                task = cache_key if procedure is None else (cache_key[1], get_schema(get_field_tree(procedure, kind)))
+                pending.setdefault(task, []).append((results, cache_key))
+
+        self.checked = len(pending)
+        self.cached = len(samples) - sum(len(owners) for owners in pending.values())
+
+        for owners, errors in zip(pending.values(), self._run(list(pending))):
+            for results, cache_key in owners:
+                results[cache_key] = errors
+
+        issues = []
+        for kind, key, results, cache_key, _ in samples:
+            issues.extend(SampleIssue(kind, key, message) for message in results[cache_key])
+
+        self.logger.info('Samples - Checked %s samples (%s cached), found %s issues.', self.checked, self.cached,
+                         len(issues))
+
+        return issues
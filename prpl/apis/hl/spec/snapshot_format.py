@@ -0,0 +1,36 @@
+
+import struct
+
+# Binary snapshot format of a linked HL-API.
+#
+# A snapshot is made of a header, a value table and a graph section:
+#
+#   header   MAGIC, format version, byte order, number of values, text size (bytes) and graph size (words).
+#   kinds    One byte per value, either 'KIND_STR', 'KIND_INT' or 'KIND_FLOAT'.
+#   offsets  Character offsets (uint32) of each value within the text, plus the end offset.
+#   text     UTF-8 encoded concatenation of all (unique) values in their textual form.
+#   graph    Flat uint32 stream describing versions, response codes and objects, in that order. Values are
+#            referenced by 'REF_NONE', 'REF_FALSE', 'REF_TRUE' or 'REF_BASE' plus their index in the table.
+#
+# Every unique value is stored (and decoded) exactly once, no matter how many fields reference it.
+
+MAGIC = b'HLAPISNP'
+
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<8sHHIII')
+
+BYTE_ORDERS = {'little': 0, 'big': 1}
+
+KIND_STR = 0
+KIND_INT = 1
+KIND_FLOAT = 2
+
+REF_NONE = 0
+REF_FALSE = 1
+REF_TRUE = 2
+REF_BASE = 3
+
+# Procedure field layouts.
+LAYOUT_PARAMETERS = 0
+LAYOUT_FIELDS = 1
@@ -0,0 +1,348 @@
+
+from collections import OrderedDict
+import json
+import logging
+import os
+import posixpath
+import xml.etree.ElementTree as ElementTree
+import zipfile
+
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.factory import ExcelObjectFactory as HLAPIExcelObjectFactory
+from prpl.apis.hl.factory import JSONObjectFactory as HLAPIJSONObjectFactory
+
+# Parts of the API which can be updated independently.
+VERSIONS = 'versions'
+RESPONSE_CODES = 'response_codes'
+OBJECTS = 'objects'
+ALL_PARTS = frozenset([VERSIONS, RESPONSE_CODES, OBJECTS])
+
+_SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_RELATIONSHIPS_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PACKAGE_RELATIONSHIPS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def _get_stamp(path):
+    """Returns the modification stamp of a file, or None if it does not exist."""
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ExcelSource:
+    """Incrementally parsed Excel specification.
+
+    Keeps the raw rows of every sheet in memory. When the file changes, only the sheets whose content changed are
+    read again (an Excel file is a zip archive with one member per sheet, so this is told from the member checksums
+    without opening the workbook), and only the affected parts of the API are linked again.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.watch import ExcelSource
+
+        # Parse specification.
+        source = ExcelSource('specs/input/3.8.2.7RC.xlsx')
+        api = source.load()
+
+        # Later on, update the API in place (returns the changed parts).
+        parts = source.update(api)
+
+    """
+
+    # Sheet name, raw attribute and getter of the 'ExcelReader', and API part linked from it.
+    SHEETS = [
+        ('Change-Log', 'raw_change_log', 'get_change_log', VERSIONS),
+        ('Objects & Methods', 'raw_procedures', 'get_procedures', OBJECTS),
+        ('Parameters', 'raw_parameters', 'get_parameters', OBJECTS),
+        ('Data Types', 'raw_data_types', 'get_data_types', OBJECTS),
+        ('Response Codes', 'raw_response_codes', 'get_response_codes', RESPONSE_CODES),
+        ('Events', 'raw_events', 'get_events', OBJECTS),
+        ('ToC', 'raw_instances', 'get_instances', OBJECTS),
+    ]
+
+    # Members shared by all sheets (e.g.: cell strings), which may change the content of any sheet.
+    SHARED_MEMBERS = ['xl/sharedStrings.xml']
+
+    def __init__(self, spec, string_pool=None):
+        """Initializes the source.
+
+        Args:
+            spec (str): Relative path to Excel specification file.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values. Defaults to a new
+                pool for each (partial) parse.
+
+        """
+
+        from prpl.apis.hl.spec.parser import ExcelReader as HLAPIExcelParser
+
+        self.reader = HLAPIExcelParser(spec, string_pool=string_pool)
+        self.string_pool = string_pool
+        self.stamp = None
+        self.checksums = {}
+
+        self.logger = logging.getLogger('ExcelSource')
+
+    def _get_checksums(self):
+        """Returns the checksum of each sheet (and shared member) of the Excel file.
+
+        Returns:
+            dict: Checksums indexed by sheet (or member) name.
+
+        """
+
+        with zipfile.ZipFile(self.reader.spec_path) as archive:
+            members = {info.filename: info.CRC for info in archive.infolist()}
+
+            workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+            relationships = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+
+        targets = {r.get('Id'): r.get('Target')
+                   for r in relationships.iter(_PACKAGE_RELATIONSHIPS_NS + 'Relationship')}
+
+        checksums = {name: members.get(name) for name in self.SHARED_MEMBERS}
+        for sheet in workbook.iter(_SPREADSHEET_NS + 'sheet'):
+            target = targets.get(sheet.get(_RELATIONSHIPS_NS + 'id'), '')
+            target = target[1:] if target.startswith('/') else posixpath.join('xl', target)
+            checksums[sheet.get('name')] = members.get(posixpath.normpath(target))
+
+        return checksums
+
+    def _link(self, api, parts):
+        """Links the specified API parts from the raw rows.
+
+        Args:
+            api (prpl.apis.hl.com.API): API to be updated.
+            parts (set<str>): Parts to be linked.
+
+        """
+
+        r = self.reader
+        factory = HLAPIExcelObjectFactory(r.raw_procedures, r.raw_parameters, r.raw_data_types, r.raw_events,
+                                          r.raw_instances, r.raw_response_codes, list(r.raw_change_log),
+                                          string_pool=self.string_pool)
+
+        if VERSIONS in parts:
+            api.versions = factory._get_change_log()
+        if RESPONSE_CODES in parts:
+            api.response_codes = factory._get_response_codes()
+        if OBJECTS in parts:
+            api.objects = factory._get_objects()
+
+    def load(self):
+        """Parses the whole specification.
+
+        Returns:
+            prpl.apis.hl.com.API: Parsed API.
+
+        """
+
+        self.stamp = _get_stamp(self.reader.spec_path)
+        self.checksums = self._get_checksums()
+
+        for _, attribute, getter, _ in self.SHEETS:
+            setattr(self.reader, attribute, getattr(self.reader, getter)())
+
+        api = HLAPI([], [], [])
+        self._link(api, ALL_PARTS)
+
+        return api
+
+    def parse(self):
+        """Parses the whole specification, like the non-incremental readers (same as 'load').
+
+        Returns:
+            prpl.apis.hl.com.API: Parsed API.
+
+        """
+
+        return self.load()
+
+    def update(self, api):
+        """Updates the API with the sheets changed since the last call.
+
+        Args:
+            api (prpl.apis.hl.com.API): API returned by 'load'.
+
+        Returns:
+            set<str>: Updated API parts (empty if nothing changed).
+
+        """
+
+        stamp = _get_stamp(self.reader.spec_path)
+        if stamp is None or stamp == self.stamp:
+            return set()
+
+        try:
+            checksums = self._get_checksums()
+        except (zipfile.BadZipFile, KeyError, OSError):
+            # File is still being written, try again on the next call.
+            return set()
+
+        self.stamp = stamp
+        shared_changed = any(checksums.get(m) != self.checksums.get(m) for m in self.SHARED_MEMBERS)
+
+        parts = set()
+        for sheet, attribute, getter, part in self.SHEETS:
+            if shared_changed or checksums.get(sheet) != self.checksums.get(sheet):
+                rows = getattr(self.reader, getter)()
+                if rows != getattr(self.reader, attribute):
+                    self.logger.info('Sheet "%s" changed.', sheet)
+                    setattr(self.reader, attribute, rows)
+                    parts.add(part)
+
+        self.checksums = checksums
+
+        if len(parts) > 0:
+            self._link(api, parts)
+
+        return parts
+
+
+class JSONSource:
+    """Incrementally parsed JSON specification.
+
+    Keeps the schema and the objects of every object file in memory. When files change, only those are parsed and
+    linked again.
+
+    Example:
+        # Import module.
+        from prpl.apis.hl.spec.watch import JSONSource
+
+        # Parse specification.
+        source = JSONSource('specs/generated/json/v3.8.2.7')
+        api = source.load()
+
+        # Later on, update the API in place (returns the changed parts).
+        parts = source.update(api)
+
+    """
+
+    def __init__(self, spec, string_pool=None):
+        """Initializes the source.
+
+        Args:
+            spec (str): Relative path to the JSON specification folder.
+            string_pool (prpl.apis.hl.factory.StringPool): Pool used to deduplicate string values. Defaults to a new
+                pool for each (partial) parse.
+
+        """
+
+        self.spec_path = '{}/{}'.format(os.getcwd(), spec)
+        self.string_pool = string_pool
+
+        self.api_json = None
+        self.files = OrderedDict()
+        self.stamps = {}
+        self.object_schemas = {}
+        self.objects = {}
+
+        self.logger = logging.getLogger('JSONSource')
+
+    def _read(self, path):
+        stamp = _get_stamp(path)
+        with open(path, 'r') as f:
+            content = json.load(f)
+
+        self.stamps[path] = stamp
+        return content
+
+    def _load_file(self, name, schema=None):
+        """Parses an object file (unless its schema is given) and builds its objects."""
+
+        self.object_schemas[name] = schema if schema is not None else self._read(self.files[name])
+        factory = HLAPIJSONObjectFactory(self.api_json, {name: self.object_schemas[name]},
+                                         string_pool=self.string_pool)
+        self.objects[name] = factory._get_objects()
+
+    def _get_factory(self):
+        return HLAPIJSONObjectFactory(self.api_json, self.object_schemas, string_pool=self.string_pool)
+
+    def _get_objects(self):
+        return [o for name in self.files for o in self.objects[name]]
+
+    def load(self):
+        """Parses the whole specification.
+
+        Returns:
+            prpl.apis.hl.com.API: Parsed API.
+
+        """
+
+        self.api_json = self._read(os.path.join(self.spec_path, 'api.json'))
+
+        self.files = OrderedDict(
+            (name, os.path.join(self.spec_path, self.api_json["paths"][name]['$ref'].replace("#/paths", "")))
+            for name in self.api_json["paths"])
+        self.object_schemas = {}
+        self.objects = {}
+
+        for name in self.files:
+            self._load_file(name)
+
+        factory = self._get_factory()
+        return HLAPI(self._get_objects(), factory._get_response_codes(), factory._get_change_log())
+
+    def parse(self):
+        """Parses the whole specification, like the non-incremental readers (same as 'load').
+
+        Returns:
+            prpl.apis.hl.com.API: Parsed API.
+
+        """
+
+        return self.load()
+
+    def update(self, api):
+        """Updates the API with the object files changed since the last call.
+
+        Args:
+            api (prpl.apis.hl.com.API): API returned by 'load'.
+
+        Returns:
+            set<str>: Updated API parts (empty if nothing changed).
+
+        """
+
+        api_file = os.path.join(self.spec_path, 'api.json')
+        if _get_stamp(api_file) != self.stamps[api_file]:
+            self.logger.info('File "api.json" changed.')
+            try:
+                loaded = self.load()
+            except ValueError:
+                # A file is still being written, load everything again on the next call.
+                self.stamps[api_file] = None
+                return set()
+
+            api.versions, api.response_codes, api.objects = loaded.versions, loaded.response_codes, loaded.objects
+            return set(ALL_PARTS)
+
+        changed = []
+        for name, path in self.files.items():
+            if _get_stamp(path) != self.stamps[path]:
+                try:
+                    schema = self._read(path)
+                except ValueError:
+                    # File is still being written, try again on the next call.
+                    continue
+
+                if schema != self.object_schemas[name]:
+                    self.logger.info('File "%s" changed.', os.path.basename(path))
+                    self._load_file(name, schema)
+                    changed.append(name)
+
+        if len(changed) == 0:
+            return set()
+
+        parts = {OBJECTS}
+        api.objects = self._get_objects()
+
+        # Response codes are taken from the first object file.
+        if next(iter(self.files)) in changed:
+            api.response_codes = self._get_factory()._get_response_codes()
+            parts.add(RESPONSE_CODES)
+
+        return parts
@@ -47,7 +47,8 @@ def diff_files(path_ORIGINAL, path_GENERATED):
             diff_sheet, newRows, droppedRows =\
                 generate_sheet_diff(
                                     original_sheet,
-                                    generated_sheet
+                                    generated_sheet,
+                                    SHEET_KEYS.get(sheet)
                                     )
 
             diff_sheet_name = "DIFF {}".format(sheet)
@@ -70,17 +71,17 @@ def diff_files(path_ORIGINAL, path_GENERATED):
 
             # set format over range
             # highlight changed cells
-            worksheet.conditional_format('A1:ZZ1000', {'type': 'text',
-                                                    'criteria': 'containing',
-                                                    'value':'→',
-                                                    'format': highlight_fmt})
-
-            # highlight new/changed rows
-            for row in range(diff_sheet.shape[0]):
-                if row+1 in newRows:
-                    worksheet.set_row(row+1, 15, new_fmt)
-                if row+1 in droppedRows:
-                    worksheet.set_row(row+1, 15, grey_fmt)
+            worksheet.conditional_format(1, 0, max(diff_sheet.shape[0], 1), max(diff_sheet.shape[1] - 1, 0),
+                                         {'type': 'text',
+                                          'criteria': 'containing',
+                                          'value':'→',
+                                          'format': highlight_fmt})
+
+            # highlight new/dropped rows (row 0 is the header)
+            for row in sorted(newRows):
+                worksheet.set_row(row+1, 15, new_fmt)
+            for row in sorted(droppedRows):
+                worksheet.set_row(row+1, 15, grey_fmt)
 
         # if not, add it to dropped_sheets
         else:
@@ -88,45 +89,103 @@ def diff_files(path_ORIGINAL, path_GENERATED):
             dropped_sheets.append(sheet)
             worksheet.write(len(dropped_sheets), 0, sheet)
 
-    writer.save()
-
-
-def generate_sheet_diff(sheet_ORIGINAL, sheet_GENERATED):
-    sheet_ORIGINAL = sheet_ORIGINAL.fillna(0)
-    sheet_GENERATED = sheet_GENERATED.fillna(0)
-
-    # index_col = sheet_GENERATED.column[0]
-
-    # Perform Diff
-    sheet_DIFF = sheet_GENERATED.copy()
-    droppedRows = []
-    newRows = []
-
-    cols_ORIGINAL = sheet_ORIGINAL.columns
-    cols_GENERATED = sheet_GENERATED.columns
-    sharedCols = list(set(cols_ORIGINAL).intersection(cols_GENERATED))
-
-    for row in sheet_DIFF.index:
-        if (row in sheet_ORIGINAL.index) and (row in sheet_GENERATED.index):
-            for col in sharedCols:
-                value_ORIGINAL = sheet_ORIGINAL.loc[row, col]
-                value_GENERATED = sheet_GENERATED.loc[row, col]
-                if value_ORIGINAL == value_GENERATED:
-                    sheet_DIFF.loc[row, col] = sheet_GENERATED.loc[row, col]
-                else:
-                    sheet_DIFF.loc[row, col] = ('{}→{}').format(
-                                                                value_ORIGINAL,
-                                                                value_GENERATED
-                                                            )
+    writer.close()
+
+
+# Natural keys of the rows of each sheet, used to align the original and generated rows.
+# (keys missing from either sheet are ignored, e.g.: 'Procedure' in older specifications)
+SHEET_KEYS = {
+    'Objects & Methods': ['Object', 'Method'],
+    'Parameters': ['Object', 'Method', 'Parameter'],
+    'Objects': ['Object', 'Procedure'],
+    'Fields': ['Object', 'Procedure', 'Field'],
+    'Events': ['Object', 'Code'],
+    'Response Codes': ['Name'],
+    'Data Types': ['HL-API'],
+    'ToC': ['Object', 'Instance'],
+    '_Resource Map': ['Object'],
+    '_Procedures Description Map': ['Procedure'],
+    '_Fields Description Map': ['Field'],
+    '_Events Description Map': ['Event'],
+}
+
+
+def format_key(value):
+    # Whole numbers are read as floats from columns with empty cells (e.g.: 1.0 instead of 1).
+    if pd.isna(value):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+
+    return str(value)
+
+
+def index_sheet(sheet, keys):
+    sheet = sheet.reset_index(drop=True)
+    indexed = pd.DataFrame({key: sheet[key].map(format_key) for key in keys})
+
+    # Tell rows sharing the same key apart by their order of appearance.
+    indexed['_occurrence'] = indexed.groupby(keys, sort=False).cumcount() if len(keys) > 0 else sheet.index
+    indexed['_position'] = sheet.index
+
+    return indexed
+
+
+def generate_sheet_diff(sheet_ORIGINAL, sheet_GENERATED, keys=None):
+    # Align rows on their natural keys (or on their position, for sheets without any)
+    if keys is None:
+        keys = []
+    keys = [key for key in keys if key in sheet_ORIGINAL.columns and key in sheet_GENERATED.columns]
+
+    sheet_ORIGINAL = sheet_ORIGINAL.reset_index(drop=True)
+    sheet_GENERATED = sheet_GENERATED.reset_index(drop=True)
+
+    merged = index_sheet(sheet_ORIGINAL, keys).merge(index_sheet(sheet_GENERATED, keys), how='outer',
+                                                     on=keys + ['_occurrence'],
+                                                     suffixes=('_ORIGINAL', '_GENERATED'))
+
+    # Keep the generated order, and show dropped rows right after the row which preceded them in the original
+    merged = merged.sort_values('_position_ORIGINAL', kind='mergesort')
+    order = merged['_position_GENERATED'].copy()
+    dropped = order.isna()
+    order[dropped] = order.ffill().fillna(-1)[dropped] + 0.5
+    merged = merged.assign(_order=order).sort_values(['_order', '_position_ORIGINAL'], kind='mergesort')
+
+    in_ORIGINAL = merged['_position_ORIGINAL'].notna().to_numpy()
+    in_GENERATED = merged['_position_GENERATED'].notna().to_numpy()
+    rows_ORIGINAL = merged['_position_ORIGINAL'].fillna(0).astype(int).to_numpy()
+    rows_GENERATED = merged['_position_GENERATED'].fillna(0).astype(int).to_numpy()
+
+    # Perform Diff, one column at a time
+    sheet_DIFF = pd.DataFrame(index=range(len(merged)))
+    cols_ORIGINAL = list(sheet_ORIGINAL.columns)
+    cols = list(sheet_GENERATED.columns) + [col for col in cols_ORIGINAL if col not in sheet_GENERATED.columns]
+    shared_cols = set(cols_ORIGINAL).intersection(sheet_GENERATED.columns)
+
+    for col in cols:
+        empty = pd.Series([None] * len(merged), dtype=object)
+        if col in sheet_ORIGINAL.columns:
+            value_ORIGINAL = sheet_ORIGINAL[col].astype(object).iloc[rows_ORIGINAL].reset_index(drop=True)
+            value_ORIGINAL = value_ORIGINAL.where(in_ORIGINAL, None)
         else:
-            newRows.append(row)
+            value_ORIGINAL = empty
+        if col in sheet_GENERATED.columns:
+            value_GENERATED = sheet_GENERATED[col].astype(object).iloc[rows_GENERATED].reset_index(drop=True)
+            value_GENERATED = value_GENERATED.where(in_GENERATED, None)
+        else:
+            value_GENERATED = empty
+
+        equal = (value_ORIGINAL == value_GENERATED) | (value_ORIGINAL.isna() & value_GENERATED.isna())
+        changed = in_ORIGINAL & in_GENERATED & ~equal.to_numpy() & (col in shared_cols)
 
-    for row in sheet_ORIGINAL.index:
-        if row not in sheet_GENERATED.index:
-            droppedRows.append(row)
-            sheet_DIFF = sheet_DIFF.append(sheet_ORIGINAL.loc[row, :])
+        value = value_GENERATED.where(in_GENERATED, value_ORIGINAL)
+        value[changed] = (value_ORIGINAL[changed].fillna('').astype(str) + '→' +
+                          value_GENERATED[changed].fillna('').astype(str))
+        sheet_DIFF[col] = value
 
-    sheet_DIFF = sheet_DIFF.sort_index().fillna('')
+    sheet_DIFF = sheet_DIFF.fillna('')
+    newRows = set(sheet_DIFF.index[~in_ORIGINAL])
+    droppedRows = set(sheet_DIFF.index[~in_GENERATED])
 
     return (sheet_DIFF, newRows, droppedRows)
 
@@ -0,0 +1,118 @@
+from openpyxl import Workbook
+
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Version as HLAPIVersion
+
+
+def make_field(name, type, is_input, is_required, is_output, possible_values=None):
+    """Creates a field, with placeholder description and without default value, format and notes."""
+
+    return HLAPIField(name, 'Description.', type, is_input, is_required, None, is_output, possible_values, None, None)
+
+
+def make_api(procedures=(), object_name='User.Accounts', events=(), instances=(), response_codes=(), objects=(),
+             version='3.5'):
+    """Creates an API with a 'User Account' object, followed by the specified extra objects."""
+
+    accounts = HLAPIObject(1, object_name, 'User Account')
+    accounts.procedures.extend(procedures)
+    accounts.events.extend(events)
+    accounts.instances.extend(instances)
+
+    return HLAPI([accounts] + list(objects), list(response_codes), [HLAPIVersion(version, '2018-04-13')])
+
+
+def make_body():
+    """Creates the response body schema shared by the 'Get' and 'Set' procedures."""
+
+    return {
+        "properties": {
+            "Name": {"type": "String", "description": "Account name.", "default_value": "-",
+                     "possible_values": "-", "format": "-"},
+            "Hash": {
+                "type": "object",
+                "properties": {
+                    "Type": {"type": "String", "description": "Hash type.", "possible_values": "MD5 or SHA1"}
+                },
+                "required": ["Type"]
+            }
+        },
+        "required": ["Name"]
+    }
+
+
+def make_path(object_name, procedure_name, request_properties=None):
+    """Creates the schema of a procedure path, as written by the 'JSONSchemaWriter'."""
+
+    path = {
+        "operationId": "{}.{}".format(object_name, procedure_name),
+        "summary": "{} procedure.".format(procedure_name),
+        "tags": [object_name],
+        "responses": {
+            "OK": {
+                "description": "Successfully processed.",
+                "raised_by": "",
+                "content": {
+                    "application/json": {
+                        "example": '{"Header": {"Name": "OK"}}',
+                        "schema": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/Response"},
+                                {"properties": {"Body": make_body()}}
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    if request_properties is not None:
+        path["requestBody"] = {
+            "content": {
+                "application/json": {
+                    "schema": {"properties": request_properties, "required": list(request_properties.keys())},
+                    "example": "{}"
+                }
+            }
+        }
+
+    return path
+
+
+def make_workbook(file, version='3.5', event='ADDED'):
+    """Writes a minimal Excel specification with a 'User.Accounts' object."""
+
+    wb = Workbook()
+    change_log = wb.active
+    change_log.title = 'Change-Log'
+    change_log['B2'] = 'Version {} (2018-04-13)'.format(version)
+    change_log['B3'] = 1
+    change_log['C3'] = 'Added new "foo" object.'
+
+    sheets = [
+        ('Objects & Methods', ['Layer', 'Object', 'Method', 'Description', 'Request Body (Sample)',
+                               'Response Body (Sample)', 'Resource'],
+         [[1, 'User.Accounts', 'List', 'Lists the accounts.', '-', '-', 'User Account']]),
+        ('Parameters', ['Layer', 'Object', 'Method', 'Parameter', 'Description', 'Type', 'Rights', 'Required',
+                        'Default Value', 'Possible Values', 'Format', 'Notes'],
+         [[1, 'User.Accounts', 'List', 'Limit', 'Maximum entries.', 'Integer', 'W', 'Optional', '-', '-', '-',
+           '-']]),
+        ('Data Types', ['HL-API', 'uBus'], [['Integer', 'int32']]),
+        ('Response Codes', ['Name', 'Description', 'Sample', 'Raised By'],
+         [['OK', 'Successfully processed.', '{}', '-']]),
+        ('Events', ['Layer', 'Object', 'Code', 'Name', 'Description', 'Parameters'],
+         [[1, 'User.Accounts', 1, event, 'Raised when a new account is added.', '-']]),
+        ('ToC', ['Layer', 'Object', 'Instance', 'Description'],
+         [[1, 'User.Accounts', 'WUI:Admin', 'Web-GUI administrator account.']]),
+    ]
+
+    for title, headers, rows in sheets:
+        sheet = wb.create_sheet(title)
+        sheet.append(headers)
+        for row in rows:
+            sheet.append(row)
+
+    wb.save(file)
@@ -0,0 +1,101 @@
+import unittest2
+
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.com import Version as HLAPIVersion
+
+
+class TestAPI(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.com.API' lookup methods."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.api_accounts = HLAPIObject(1, 'User.Accounts', 'User Account')
+        self.api_accounts.procedures.append(HLAPIProcedure('Add', 'Adds a new account.', '-', '-'))
+        self.api_accounts.events.append(HLAPIEvent(1, 'ADDED', 'Raised when a new account is added.', '-'))
+
+        self.api_account = HLAPIObject(1, 'User.Accounts.{AccountId}', 'User Account')
+        self.api_account.procedures.append(HLAPIProcedure('Set', 'Modifies the account.', '-', '-'))
+
+        self.api_buttons = HLAPIObject(4, 'System.Buttons', 'Button')
+        self.api_buttons.events.append(HLAPIEvent(1, 'CLICKED', 'Raised when a button is clicked.', '-'))
+
+        self.api_response_code = HLAPIResponseCode('OK', 'Successfully processed.', '-', '')
+
+        self.api = HLAPI([self.api_accounts, self.api_account, self.api_buttons],
+                         [self.api_response_code],
+                         [HLAPIVersion('3.5', '2018-04-13')])
+
+    def test__object(self):
+        """Tests looking up objects by name."""
+
+        self.assertIs(self.api.object('User.Accounts.{AccountId}'), self.api_account)
+        self.assertIsNone(self.api.object('User.Profile'))
+
+    def test__procedure(self):
+        """Tests looking up procedures by object and name."""
+
+        self.assertIs(self.api.procedure(self.api_account, 'Set'), self.api_account.procedures[0])
+        self.assertIs(self.api.procedure('User.Accounts', 'Add'), self.api_accounts.procedures[0])
+        self.assertIsNone(self.api.procedure('User.Accounts', 'Set'))
+        self.assertIsNone(self.api.procedure('User.Profile', 'Get'))
+
+    def test__event_by_code(self):
+        """Tests looking up events by code, with and without object scope."""
+
+        self.assertIs(self.api.event_by_code(1), self.api_accounts.events[0])
+        self.assertIs(self.api.event_by_code('1', 'System.Buttons'), self.api_buttons.events[0])
+        self.assertIsNone(self.api.event_by_code(2))
+
+    def test__response_code(self):
+        """Tests looking up response codes by name."""
+
+        self.assertIs(self.api.response_code('OK'), self.api_response_code)
+        self.assertIsNone(self.api.response_code('INVALID_OBJECT'))
+
+    def test__invalidate(self):
+        """Tests if the indexes follow changes to the API."""
+
+        self.assertIsNone(self.api.object('User.Profile'))
+
+        # Appending objects is detected automatically.
+        api_profile = HLAPIObject(1, 'User.Profile', 'User Profile')
+        self.api.objects.append(api_profile)
+        self.assertIs(self.api.object('User.Profile'), api_profile)
+
+        # Replacing the list invalidates the indexes.
+        self.api.response_codes = []
+        self.assertIsNone(self.api.response_code('OK'))
+
+        # Nested changes require an explicit invalidation.
+        api_profile.procedures.append(HLAPIProcedure('Get', 'Retrieves the profile.', '-', '-'))
+        self.api.invalidate()
+        self.assertIs(self.api.procedure(api_profile, 'Get'), api_profile.procedures[0])
+
+    def test__stale(self):
+        """Tests if renamed and replaced objects are only found once the indexes are invalidated."""
+
+        self.assertIs(self.api.object('User.Accounts'), self.api_accounts)
+
+        # Same number of objects, so the indexes are not rebuilt on their own.
+        self.api_accounts.name = 'User.Logins'
+        api_roles = HLAPIObject(1, 'User.Roles', 'User Role')
+        self.api.objects[self.api.objects.index(self.api_account)] = api_roles
+
+        self.assertIs(self.api.object('User.Accounts'), self.api_accounts)
+        self.assertIsNone(self.api.object('User.Logins'))
+        self.assertIsNone(self.api.object('User.Roles'))
+
+        self.api.invalidate()
+        self.assertIsNone(self.api.object('User.Accounts'))
+        self.assertIs(self.api.object('User.Logins'), self.api_accounts)
+        self.assertIs(self.api.object('User.Roles'), api_roles)
+        self.assertIsNone(self.api.object('User.Accounts.{AccountId}'))
+
+
+if __name__ == '__main__':
+    unittest2.main()
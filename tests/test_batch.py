@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest2
+
+from batch import detect_input_format, get_summary, run_batch
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.spec.builder import JSONSchemaWriter as HLAPIJSONSchemaWriter
+from prpl.apis.hl.spec.builder import SnapshotWriter as HLAPISnapshotWriter
+from tests.helpers import make_api, make_workbook
+
+
+class TestBatch(unittest2.TestCase):
+    """Tests the 'batch' entry point."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.cwd = os.getcwd()
+        self.test_folder = tempfile.mkdtemp()
+        os.chdir(self.test_folder)
+
+        for version in ['3.5', '3.6']:
+            api = HLAPI([HLAPIObject(1, 'User.Accounts', 'User Account')],
+                        [HLAPIResponseCode('OK', 'Successfully processed.', '-', '')],
+                        [HLAPIVersion(version, '2018-04-13')])
+            HLAPISnapshotWriter(api, 'v{}.hlapi'.format(version)).build()
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_folder)
+
+    def test__detect_input_format(self):
+        """Tests guessing the input format."""
+
+        self.assertEqual(detect_input_format('v3.5.hlapi'), 'snapshot')
+        self.assertEqual(detect_input_format('specs/input/3.8.2.7RC.xlsx'), 'xls')
+        self.assertEqual(detect_input_format(self.test_folder), 'json')
+
+    def test__run_batch(self):
+        """Tests if every specification is converted by its own job."""
+
+        results = run_batch(['v3.5.hlapi', 'v3.6.hlapi', 'missing.hlapi'], ['sqlite'], jobs=2)
+
+        self.assertEqual([r['name'] for r in results], ['v3.5.hlapi', 'v3.6.hlapi', 'missing.hlapi'])
+        self.assertEqual([r['error'] is None for r in results], [True, True, False])
+        self.assertTrue(os.path.isfile('specs/generated/batch/v3.5.hlapi/sqlite/prpl HL-API (3.5).db'))
+        self.assertTrue(os.path.isfile('specs/generated/batch/v3.6.hlapi/sqlite/prpl HL-API (3.6).db'))
+        self.assertTrue(os.path.isfile('specs/generated/logs/v3.6.hlapi.log'))
+        self.assertIn('sqlite', results[0]['timings'])
+        self.assertGreater(results[0]['peak_rss'], 0)
+
+        summary = get_summary(results).splitlines()
+        self.assertEqual(len([line for line in summary if line.startswith('v3.')]), 2)
+
+    def test__same_version(self):
+        """Tests if jobs converting specifications of the same version do not overwrite each other."""
+
+        make_workbook('spec.xlsx')
+        api = make_api([HLAPIProcedure('List', 'Lists the accounts.', '{}', '{}')],
+                       response_codes=[HLAPIResponseCode('OK', 'Success.', '{}', '')])
+        HLAPIJSONSchemaWriter(api, 'specs/generated/json/v3.5/').build()
+
+        results = run_batch(['spec.xlsx', 'specs/generated/json/v3.5/'], ['json', 'sqlite'], jobs=2)
+
+        self.assertEqual([r['error'] for r in results], [None, None])
+        self.assertTrue(os.path.isfile('specs/generated/json/v3.5/api.json'))
+        for name in ['spec.xlsx', 'v3.5']:
+            self.assertTrue(os.path.isfile('specs/generated/batch/{}/json/v3.5/api.json'.format(name)))
+            self.assertTrue(os.path.isfile('specs/generated/batch/{}/sqlite/prpl HL-API (3.5).db'.format(name)))
+
+    def test__duplicate_names(self):
+        """Tests if specifications which would share an output folder are rejected."""
+
+        with self.assertRaises(Exception):
+            run_batch(['v3.5.hlapi', os.path.join(self.test_folder, 'v3.5.hlapi')], ['sqlite'], jobs=1)
+
+
+if __name__ == '__main__':
+    unittest2.main()
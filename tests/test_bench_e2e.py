@@ -0,0 +1,53 @@
+
+import os
+import shutil
+import tempfile
+import unittest2
+
+from benchmarks.bench_e2e import compare, run
+
+
+def result(median, error=None):
+    return {'median': median, 'min': median, 'cpu': median, 'error': error}
+
+
+class TestBenchE2E(unittest2.TestCase):
+    """Tests the end-to-end benchmark suite."""
+
+    def test__compare(self):
+        """Tests if slowdowns past the threshold and new failures are reported as regressions."""
+
+        baseline = {'a@x1': result(1.0), 'b@x1': result(1.0), 'c@x1': result(1.0), 'd@x1': result(None, 'Error')}
+        results = {'a@x1': result(1.2), 'b@x1': result(1.5), 'c@x1': result(None, 'Error'),
+                   'd@x1': result(None, 'Error'), 'e@x1': result(9.0)}
+
+        regressions = compare(baseline, results, 0.25)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('b@x1 is 50.0% slower'))
+        self.assertTrue(regressions[1].startswith('c@x1 now fails'))
+
+        # Small absolute slowdowns are noise.
+        self.assertEqual(compare(baseline, results, 0.25, min_delta=1.0), ['c@x1 now fails (Error).'])
+
+    def test__run(self):
+        """Tests if the suite generates its fixtures and times the requested paths."""
+
+        cwd = os.getcwd()
+        folder = tempfile.mkdtemp()
+        os.chdir(folder)
+        try:
+            results = run([1], ['json-to-model', 'model-to-json'], 1, 'fixtures')
+            generated = os.path.isfile(os.path.join('fixtures', 'synthetic-x1', 'api.json'))
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(folder)
+
+        self.assertTrue(generated)
+        self.assertEqual(list(results), ['json-to-model@x1', 'model-to-json@x1'])
+        self.assertIsNone(results['model-to-json@x1']['error'])
+        self.assertGreater(results['json-to-model@x1']['median'], 0)
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,73 @@
+
+import os
+import shutil
+import tempfile
+import unittest2
+
+from benchmarks.bench_memory import RSSSampler, get_footprint, run
+from benchmarks.spec_generator import SpecGenerator
+from prpl.apis.hl.com import FieldStore as HLAPIFieldStore
+from prpl.apis.hl.spec.parser import JSONReader as HLAPIJSONParser
+
+
+class TestBenchMemory(unittest2.TestCase):
+    """Tests the memory footprint benchmarks."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.cwd = os.getcwd()
+        self.test_folder = tempfile.mkdtemp()
+        os.chdir(self.test_folder)
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_folder)
+
+    def test__footprint(self):
+        """Tests if the footprint is broken down per model type, with packed fields counted once."""
+
+        generator = SpecGenerator(objects=2, procedures=2, parameters=3, depth=1, events=1, instances=1, versions=2)
+        generator.write_json('spec')
+        counts = generator.get_counts()
+
+        footprint = get_footprint(HLAPIJSONParser('spec').parse())
+
+        self.assertEqual(footprint['Object']['count'], counts['objects'])
+        self.assertEqual(footprint['Procedure']['count'], counts['procedures'])
+        self.assertEqual(footprint['Field']['count'], counts['fields'])
+        self.assertEqual(footprint['Event']['count'], counts['events'])
+        self.assertTrue(all(f['bytes'] > 0 for f in footprint.values()))
+
+        api = HLAPIJSONParser('spec').parse()
+        HLAPIFieldStore.pack(api)
+        self.assertEqual(get_footprint(api)['Field']['count'], counts['fields'])
+
+    def test__rss_sampler(self):
+        """Tests if the sampler catches the RSS growth of a short-lived allocation."""
+
+        with RSSSampler() as sampler:
+            data = bytearray(64 * 1024 * 1024)
+            del data
+
+        if sampler.baseline is None:
+            self.skipTest('RSS is unavailable on this platform.')
+
+        self.assertGreaterEqual(sampler.get_growth(), 32 * 1024 * 1024)
+
+    def test__run(self):
+        """Tests if the model and writer targets are measured in separate processes."""
+
+        results = run([1], ['model', 'json'], fixtures_folder='fixtures')
+
+        self.assertEqual(list(results), ['model@x1', 'json@x1'])
+        self.assertIsNone(results['model@x1']['error'])
+        self.assertGreater(results['model@x1']['traced'], 0)
+        self.assertGreater(results['model@x1']['footprint']['Field']['bytes'], 0)
+        self.assertGreater(results['json@x1']['traced_peak'], 0)
+
+
+if __name__ == '__main__':
+    unittest2.main()
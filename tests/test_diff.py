@@ -0,0 +1,88 @@
+
+import unittest2
+
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import FieldStore as HLAPIFieldStore
+from prpl.apis.hl.com import Instance as HLAPIInstance
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.spec.diff import APIDiff as HLAPIDiff
+from tests.helpers import make_api
+
+
+def make_accounts_api(password_type='String', extra_procedure=False, with_roles=True):
+    """Creates a small API, with a few variations."""
+
+    add = HLAPIProcedure('Add', 'Adds a new account.', '{"Id":"Admin"}', '{"Id":"Admin"}')
+    add.parameters.append(HLAPIField('Id', 'Account Id.', 'String', True, True, None, True, None, None, None))
+    add.parameters.append(HLAPIField('Password', 'Account password.', password_type, True, True, None, False, None,
+                                     None, None))
+    procedures = [add]
+
+    if extra_procedure:
+        procedures.append(HLAPIProcedure('Clear', 'Removes all accounts.', '-', '-'))
+
+    return make_api(procedures,
+                    events=[HLAPIEvent(1, 'USER_ACCOUNTS_ADDED', 'Raised when an account is added.', '{}')],
+                    instances=[HLAPIInstance('WUI:Admin', 'Web-GUI administrator account.')],
+                    response_codes=[HLAPIResponseCode('OK', 'Success.', '{}', [])],
+                    objects=[HLAPIObject(1, 'User.Roles', 'User Role')] if with_roles else [])
+
+
+class TestDiff(unittest2.TestCase):
+    """Tests the 'APIDiff' component."""
+
+    def test__unchanged(self):
+        """Tests if identical APIs have no changes, and unchanged objects are skipped as a whole."""
+
+        diff = HLAPIDiff(make_accounts_api(), make_accounts_api())
+
+        self.assertEqual(diff.compare(), [])
+        self.assertEqual(diff.skipped, 3)
+
+    def test__changes(self):
+        """Tests if added, removed and changed items are reported with stable keys."""
+
+        diff = HLAPIDiff(make_accounts_api(), make_accounts_api(password_type='Integer', extra_procedure=True, with_roles=False))
+        changes = diff.compare()
+
+        self.assertEqual([str(c) for c in changes], [
+            'removed object User.Roles',
+            'changed field User.Accounts/Add/Password',
+            'added procedure User.Accounts/Clear',
+        ])
+        self.assertEqual(changes[1].attributes, [('type', 'String', 'Integer')])
+        self.assertEqual(diff.get_change_list(), [
+            (1, 'Removed "User.Roles" object.'),
+            (2, 'Updated type of "Password" field of the "Add" procedure of the "User.Accounts" object.'),
+            (3, 'Added "Clear" procedure to the "User.Accounts" object.'),
+        ])
+
+    def test__packed(self):
+        """Tests if fields packed into a 'FieldStore' are compared like regular fields, on both sides."""
+
+        def make_packed_api(password_type='String', changed_field=None):
+            api = make_accounts_api(password_type)
+            for procedure_name in ('Get', 'Set', 'Delete'):
+                procedure = HLAPIProcedure(procedure_name, 'Manages the accounts.', '-', '-')
+                for field_name in ('Id', 'Name', 'Enabled', 'Retries', 'Comment'):
+                    description = 'Changed.' if (procedure_name, field_name) == changed_field else 'Account field.'
+                    procedure.parameters.append(HLAPIField(field_name, description, 'String', True, False, None,
+                                                           True, None, None, None))
+                api.objects[0].procedures.append(procedure)
+
+            HLAPIFieldStore.pack(api)
+            return api
+
+        self.assertEqual(HLAPIDiff(make_packed_api(), make_packed_api()).compare(), [])
+
+        changes = HLAPIDiff(make_packed_api(), make_packed_api('Integer', ('Delete', 'Retries'))).compare()
+
+        self.assertEqual([c.get_path() for c in changes], ['User.Accounts/Add/Password',
+                                                           'User.Accounts/Delete/Retries'])
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,54 @@
+
+import importlib.util
+import os
+import unittest2
+
+import pandas as pd
+
+# The diff tool is a script (its name is not a valid module name), so load it from its path.
+spec = importlib.util.spec_from_file_location('excel_diff', os.path.join(os.path.dirname(__file__), 'excel-diff.py'))
+excel_diff = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(excel_diff)
+
+
+class TestExcelDiff(unittest2.TestCase):
+    """Tests the 'excel-diff' sheet diff tool."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.original = pd.DataFrame({
+            'Object': ['A', 'A', 'B', 'C'],
+            'Code': [1, 2, 1, 1],
+            'Name': ['x', 'y', 'z', 'w'],
+        })
+
+        # Row inserted at the top, one row changed, one row dropped and codes read as floats.
+        self.generated = pd.DataFrame({
+            'Object': ['N', 'A', 'A', 'B'],
+            'Code': [1.0, 1.0, 2.0, 1.0],
+            'Name': ['new', 'x', 'Y', 'z'],
+        })
+
+    def test__keyed(self):
+        """Tests if rows are aligned on their keys, so an inserted row does not shift the comparison."""
+
+        diff, new_rows, dropped_rows = excel_diff.generate_sheet_diff(self.original, self.generated,
+                                                                      excel_diff.SHEET_KEYS['Events'])
+
+        self.assertEqual(list(diff['Name']), ['new', 'x', 'y→Y', 'z', 'w'])
+        self.assertEqual(new_rows, {0})
+        self.assertEqual(dropped_rows, {4})
+
+    def test__positional(self):
+        """Tests if sheets without keys are compared row by row."""
+
+        diff, new_rows, dropped_rows = excel_diff.generate_sheet_diff(self.original, self.generated.iloc[:3])
+
+        self.assertEqual(list(diff['Object']), ['A→N', 'A', 'B→A', 'C'])
+        self.assertEqual(new_rows, set())
+        self.assertEqual(dropped_rows, {3})
+
+
+if __name__ == '__main__':
+    unittest2.main()
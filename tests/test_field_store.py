@@ -0,0 +1,98 @@
+import copy
+import unittest2
+
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import FieldStore as HLAPIFieldStore
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.com.field_store import get_inputs, get_outputs
+
+
+class TestFieldStore(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.com.FieldStore' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.api_object = HLAPIObject(1, 'User.Accounts.{AccountId}', 'User Account')
+
+        # Procedure with a list of fields (as built from an Excel specification).
+        self.api_procedure = HLAPIProcedure('Set', 'Modifies the account.', '{"Name":"Admin"}', '-')
+        self.api_procedure.parameters = [
+            HLAPIField('Name', 'Account name.', 'String', True, True, '-', False, '-', '-', '-'),
+            HLAPIField('Enabled', 'Account status.', 'Boolean', True, False, 'true', True, 'true or false', '-', '-'),
+            HLAPIField('Hash.Type', 'Hash type.', 'String', False, None, '-', True, '-', '-', '-')]
+
+        # Procedure with a dictionary of fields (as built from a JSON specification).
+        self.api_get = HLAPIProcedure('Get', 'Retrieves the account.', '-', '-')
+        self.api_get.fields = {'Id': HLAPIField('Id', 'Account id.', 'String', False, False, '-', True, '-', '-', '-')}
+
+        self.api_object.procedures += [self.api_procedure, self.api_get]
+
+        self.api = HLAPI([self.api_object], [], [HLAPIVersion('3.5', '2018-04-13')])
+        self.store = HLAPIFieldStore.pack(self.api)
+
+    def test__pack(self):
+        """Tests if the procedure fields are moved into the store."""
+
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual([f.name for f in self.api_procedure.parameters], ['Name', 'Enabled', 'Hash.Type'])
+        self.assertEqual(list(self.api_get.fields.keys()), ['Id'])
+        self.assertEqual(self.api_get.fields['Id'].type, 'String')
+
+    def test__flags(self):
+        """Tests if the packed flags are read back with the original values."""
+
+        name, enabled, hash_type = self.api_procedure.parameters
+
+        self.assertIs(name.is_input, True)
+        self.assertIs(name.is_output, False)
+        self.assertIs(name.is_required, True)
+        self.assertIs(enabled.is_required, False)
+        self.assertIsNone(hash_type.is_required)
+
+        hash_type.is_required = True
+        hash_type.is_input = True
+        self.assertIs(hash_type.is_required, True)
+        self.assertIs(hash_type.is_input, True)
+        self.assertIs(hash_type.is_output, True)
+
+    def test__filters(self):
+        """Tests the bulk input/output filters against the regular attribute filters."""
+
+        fields = self.api_procedure.parameters
+
+        self.assertEqual([f.name for f in fields.inputs()],
+                         [f.name for f in filter(lambda x: x.is_input is True, fields)])
+        self.assertEqual([f.name for f in fields.outputs()],
+                         [f.name for f in filter(lambda x: x.is_output is True, fields)])
+
+    def test__procedure_filters(self):
+        """Tests if the procedure filters used by the writers cover both field lists and dictionaries."""
+
+        self.assertEqual([f.name for f in get_inputs(self.api_procedure)], ['Name', 'Enabled'])
+        self.assertEqual([f.name for f in get_outputs(self.api_procedure)], ['Enabled', 'Hash.Type'])
+        self.assertEqual([f.name for f in get_inputs(self.api_get)], [])
+        self.assertEqual([f.name for f in get_outputs(self.api_get)], ['Id'])
+
+        # Unpacked procedures are filtered field by field.
+        procedure = HLAPIProcedure('Set', 'Modifies the account.', '-', '-')
+        procedure.parameters = [f.to_field() for f in self.api_procedure.parameters]
+        self.assertEqual([f.name for f in get_outputs(procedure)], ['Enabled', 'Hash.Type'])
+
+    def test__copy(self):
+        """Tests if copying a view returns a detached field."""
+
+        view = self.api_procedure.parameters[2]
+        field = copy.deepcopy(view)
+        field.name = 'Type'
+
+        self.assertIsInstance(field, HLAPIField)
+        self.assertEqual(view.name, 'Hash.Type')
+        self.assertEqual(field.notes, view.notes)
+
+
+if __name__ == '__main__':
+    unittest2.main()
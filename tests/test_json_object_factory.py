@@ -0,0 +1,115 @@
+import json
+import unittest2
+
+from prpl.apis.hl.factory import JSONObjectFactory as HLAPIObjectFactory
+from prpl.apis.hl.factory import StringPool as HLAPIStringPool
+from tests.helpers import make_body, make_path
+
+
+def make_spec():
+    """Creates the api.json and object schemas of a 'User.Accounts' specification."""
+
+    api_json = {"versions": {"3.5": {"date": "2018-04-13", "changes": [[1, "Added new \"foo\" object."]]}}}
+
+    paths = {
+        "User.Accounts.List": make_path("User.Accounts", "List"),
+        "User.Accounts.{AccountId}.Get": make_path("User.Accounts.{AccountId}", "Get"),
+        "User.Accounts.{AccountId}.Set": make_path(
+            "User.Accounts.{AccountId}", "Set",
+            {"Password": {"type": "String", "description": "Account password."}}),
+    }
+
+    object_schemas = {
+        "User.Accounts": {
+            "paths": paths,
+            "components": {
+                "schemas": {
+                    "User.Accounts": {
+                        "layer": 1,
+                        "events": {
+                            "USER_ACCOUNTS_ADDED": {
+                                "code": "1",
+                                "description": "Raised when a new account is added.",
+                                "content": {"application/json": {"example": "-"}}
+                            }
+                        }
+                    }
+                }
+            },
+            "instances": {"WUI:Admin": {"description": "Web-GUI administrator account."}}
+        }
+    }
+
+    return api_json, object_schemas
+
+
+class TestJSONObjectFactory(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.factory.JSONObjectFactory' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.api_json, self.object_schemas = make_spec()
+        self.factory = HLAPIObjectFactory(self.api_json, self.object_schemas, string_pool=HLAPIStringPool())
+        self.api = self.factory.get_api()
+
+    def test__objects(self):
+        """Tests if the paths are grouped into their owning objects."""
+
+        self.assertEqual([o.name for o in self.api.objects], ['User.Accounts', 'User.Accounts.{AccountId}'])
+        self.assertEqual([p.name for p in self.api.objects[0].procedures], ['List'])
+        self.assertEqual([p.name for p in self.api.objects[1].procedures], ['Get', 'Set'])
+
+        self.assertEqual([e.name for e in self.api.objects[0].events], ['ADDED'])
+        self.assertEqual(self.api.objects[0].instances, [])
+        self.assertEqual([i.name for i in self.api.objects[1].instances], ['WUI:Admin'])
+
+    def test__interleaved_paths(self):
+        """Tests if interleaved paths are grouped by object, preserving the order of first appearance."""
+
+        paths = self.object_schemas["User.Accounts"]["paths"]
+        paths["User.Accounts.Add"] = make_path("User.Accounts", "Add")
+
+        api = HLAPIObjectFactory(self.api_json, self.object_schemas, string_pool=HLAPIStringPool()).get_api()
+
+        self.assertEqual([o.name for o in api.objects], ['User.Accounts', 'User.Accounts.{AccountId}'])
+        self.assertEqual([p.name for p in api.objects[0].procedures], ['List', 'Add'])
+        self.assertEqual([o.resource for o in api.objects], ['User.Accounts', 'User.Accounts'])
+
+    def test__fields(self):
+        """Tests if nested properties are flattened into dotted field names."""
+
+        api_get = self.api.procedure('User.Accounts.{AccountId}', 'Get')
+        api_set = self.api.procedure('User.Accounts.{AccountId}', 'Set')
+
+        self.assertEqual(list(api_get.fields.keys()), ['Name', 'Hash.Type'])
+        self.assertEqual(list(api_set.fields.keys()), ['Password', 'Name', 'Hash.Type'])
+
+        self.assertIs(api_get.fields['Name'].is_required, True)
+        self.assertIs(api_get.fields['Name'].is_output, True)
+        self.assertIs(api_set.fields['Password'].is_input, True)
+        self.assertEqual(api_get.fields['Hash.Type'].notes, 'Possible value are "MD5 or SHA1". ')
+        self.assertEqual(api_get.fields['Name'].notes, '-')
+
+    def test__field_cache(self):
+        """Tests if identical subtrees are flattened once, while every procedure gets its own fields."""
+
+        # 'Body' is shared by the three procedures, 'Password' is only used by 'Set'.
+        self.assertEqual(len(self.factory.field_cache), 2)
+
+        api_get = self.api.procedure('User.Accounts.{AccountId}', 'Get')
+        api_set = self.api.procedure('User.Accounts.{AccountId}', 'Set')
+
+        self.assertIsNot(api_get.fields['Name'], api_set.fields['Name'])
+        api_get.fields['Name'].is_input = True
+        self.assertIs(api_set.fields['Name'].is_input, False)
+
+    def test__input_unchanged(self):
+        """Tests if the object schemas are left untouched."""
+
+        self.assertEqual(json.dumps(self.object_schemas, sort_keys=True),
+                         json.dumps(make_spec()[1], sort_keys=True))
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,64 @@
+import unittest2
+
+from prpl.apis.hl.factory.json_schema_accessor import JSONPointer
+from prpl.apis.hl.factory.json_schema_accessor import ProcedureSchema
+
+from tests.helpers import make_path
+
+
+class TestJSONSchemaAccessor(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.factory.json_schema_accessor' component."""
+
+    def test__pointer(self):
+        """Tests resolving pointers with escaped, numeric and missing tokens."""
+
+        document = {"a/b": {"~c": [10, 20]}, "99": {"Code": 99}}
+
+        self.assertEqual(JSONPointer('/a~1b/~0c/1').resolve(document), 20)
+        self.assertEqual(JSONPointer('/99/Code').resolve(document), 99)
+        self.assertIs(JSONPointer('').resolve(document), document)
+        self.assertEqual(JSONPointer('/a~1b/~0c/5').resolve(document, None), None)
+
+        with self.assertRaises(KeyError):
+            JSONPointer('/missing').resolve(document)
+
+        with self.assertRaises(Exception):
+            JSONPointer('missing')
+
+    def test__procedure_schema(self):
+        """Tests if request and response schemas are resolved once."""
+
+        path = make_path('User.Accounts.{AccountId}', 'Set', {"Password": {"type": "String"}})
+        schema = ProcedureSchema(path)
+
+        self.assertEqual(list(schema.request_properties.keys()), ['Password'])
+        self.assertEqual(schema.request_required, ['Password'])
+        self.assertEqual(schema.request_example, '{}')
+        self.assertEqual(list(schema.response_properties.keys()), ['Body'])
+        self.assertEqual(schema.response_body_required, ['Name'])
+        self.assertEqual(schema.response_required, [])
+        self.assertEqual(schema.response_example, '{"Header": {"Name": "OK"}}')
+
+    def test__procedure_schema_without_body(self):
+        """Tests if responses without body and required lists have no required properties."""
+
+        path = make_path('User.Accounts.{AccountId}', 'Set', {"Password": {"type": "String"}})
+        del path["responses"]["OK"]["content"]["application/json"]["schema"]["allOf"][1]["properties"]["Body"]
+
+        schema = ProcedureSchema(path)
+
+        self.assertEqual(schema.response_body_required, [])
+        self.assertEqual(schema.response_required, [])
+
+    def test__procedure_schema_without_request(self):
+        """Tests if procedures without request body get the default values."""
+
+        schema = ProcedureSchema(make_path('User.Accounts', 'List'))
+
+        self.assertIsNone(schema.request_properties)
+        self.assertEqual(schema.request_required, [])
+        self.assertEqual(schema.request_example, '-')
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,115 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest2
+
+from launcher import Launcher
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.factory import StringPool as HLAPIStringPool
+from prpl.apis.hl.spec.builder import JSONSchemaWriter as HLAPIJSONSchemaWriter
+from prpl.apis.hl.spec.builder import SnapshotWriter as HLAPISnapshotWriter
+
+
+class TestLauncher(unittest2.TestCase):
+    """Tests the 'Launcher' orchestrator."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        api_object = HLAPIObject(1, 'User.Accounts', 'User Account')
+        api_object.procedures.append(HLAPIProcedure('List', 'Lists the accounts.', '-', '-'))
+        api = HLAPI([api_object], [HLAPIResponseCode('OK', 'Successfully processed.', '{}', '')],
+                    [HLAPIVersion('3.5', '2018-04-13')])
+
+        self.cwd = os.getcwd()
+        self.test_folder = tempfile.mkdtemp()
+        os.chdir(self.test_folder)
+
+        HLAPISnapshotWriter(api, 'api.hlapi').build()
+        HLAPIJSONSchemaWriter(api, 'json/').build()
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_folder)
+
+    def _run(self, outputs, **kwargs):
+        launcher = Launcher('api.hlapi', input_format='snapshot', output_format=outputs, **kwargs)
+        try:
+            launcher.run()
+        finally:
+            launcher.log.stop()
+
+        return launcher
+
+    def test__multiple_outputs(self):
+        """Tests if every requested output is built from a single parse."""
+
+        launcher = self._run(['sqlite', 'snapshot'])
+
+        self.assertTrue(os.path.isfile('specs/generated/sqlite/prpl HL-API (3.5).db'))
+        self.assertTrue(os.path.isfile('specs/generated/snapshot/prpl HL-API (3.5).hlapi'))
+        self.assertEqual(list(launcher.timings.keys()), ['parse', 'sqlite', 'snapshot', 'total'])
+        self.assertIn('sqlite', launcher.get_timings_report())
+
+    def test__single_output(self):
+        """Tests if a single output format is still accepted as a string."""
+
+        launcher = self._run('sqlite')
+
+        self.assertEqual(launcher.output_formats, ['sqlite'])
+        self.assertEqual(list(launcher.timings.keys()), ['parse', 'sqlite', 'total'])
+
+    def test__check_samples(self):
+        """Tests if samples are checked in their own stage, before the outputs are built."""
+
+        launcher = self._run('sqlite', check_samples=True)
+
+        self.assertEqual(list(launcher.timings.keys()), ['parse', 'samples', 'sqlite', 'total'])
+        self.assertEqual(launcher.sample_issues, [])
+
+    def test__string_pool(self):
+        """Tests if the parses of launchers sharing a string pool share their strings."""
+
+        pool = HLAPIStringPool()
+        launchers = [Launcher('json', input_format='json', output_format='sqlite', string_pool=pool)
+                     for _ in range(2)]
+        for launcher in launchers:
+            launcher.run()
+
+        self.assertIs(launchers[0].api.objects[0].name, launchers[1].api.objects[0].name)
+        self.assertIsNot(Launcher('json', input_format='json').string_pool, pool)
+
+    def test__log(self):
+        """Tests if launchers only attach the log file handler while running."""
+
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+
+        launchers = [Launcher('api.hlapi', input_format='snapshot', output_format='sqlite') for _ in range(3)]
+        self.assertEqual(root.handlers, handlers)
+
+        for launcher in launchers:
+            launcher.run()
+
+        self.assertEqual(root.handlers, handlers)
+
+        # Every launcher starts a new log file.
+        with open('parser.log') as f:
+            self.assertEqual(f.read().count('Finished building API'), 1)
+
+    def test__unknown_output(self):
+        """Tests if unknown output formats are rejected before parsing."""
+
+        with self.assertRaises(Exception):
+            Launcher('api.hlapi', input_format='snapshot', output_format=['sqlite', 'pdf'])
+
+
+if __name__ == '__main__':
+    unittest2.main()
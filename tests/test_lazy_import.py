@@ -0,0 +1,55 @@
+
+import os
+import subprocess
+import sys
+import unittest2
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def get_loaded(statement, modules=('openpyxl', 'docx')):
+    """Runs an import statement in a fresh interpreter and returns the listed modules it loaded."""
+
+    probe = '{}\nimport sys\nprint(",".join(m for m in {!r} if m in sys.modules))'.format(statement, modules)
+    output = subprocess.check_output([sys.executable, '-c', probe], cwd=ROOT)
+
+    return [m for m in output.decode().strip().split(',') if m != '']
+
+
+class TestLazyImport(unittest2.TestCase):
+    """Tests the lazy loading of the reader and writer backends."""
+
+    def test__launcher(self):
+        """Tests if importing the launcher does not load any backend dependency."""
+
+        self.assertEqual(get_loaded('import launcher'), [])
+
+    def test__launcher_modes(self):
+        """Tests if importing the launcher does not load the mock server and sample checker dependencies."""
+
+        self.assertEqual(get_loaded('import launcher', modules=('asyncio', 'multiprocessing')), [])
+
+    def test__json_backends(self):
+        """Tests if the JSON reader and writer are imported without the Excel and Word dependencies."""
+
+        self.assertEqual(get_loaded('from prpl.apis.hl.spec.parser import JSONReader\n'
+                                    'from prpl.apis.hl.spec.builder import JSONSchemaWriter'), [])
+
+    def test__excel_backend(self):
+        """Tests if the Excel reader only loads its own dependency."""
+
+        self.assertEqual(get_loaded('from prpl.apis.hl.spec.parser import ExcelReader'), ['openpyxl'])
+
+    def test__unknown_name(self):
+        """Tests if unknown backend names raise an 'AttributeError', while known ones are listed."""
+
+        import prpl.apis.hl.spec.builder as builder
+
+        with self.assertRaises(AttributeError):
+            builder.PDFWriter
+
+        self.assertIn('WordWriter', dir(builder))
+
+
+if __name__ == '__main__':
+    unittest2.main()
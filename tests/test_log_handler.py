@@ -0,0 +1,88 @@
+import logging
+import os
+import shutil
+import tempfile
+import unittest2
+
+from prpl.apis.hl.spec.log_handler import AsyncFileLogging
+
+
+class TestAsyncFileLogging(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.spec.log_handler.AsyncFileLogging' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.test_folder = tempfile.mkdtemp()
+        self.file = os.path.join(self.test_folder, 'parser.log')
+        self.root_level = logging.getLogger().level
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        logging.getLogger().setLevel(self.root_level)
+        shutil.rmtree(self.test_folder)
+
+    def _read(self):
+        with open(self.file) as f:
+            return f.read()
+
+    def test__records(self):
+        """Tests if records are written once the logging is stopped."""
+
+        with AsyncFileLogging(self.file, logging.DEBUG, '%(name)s:%(message)s'):
+            logging.getLogger('Test').debug('Fields - Added field "%s" (%s).', 'Name', 'String')
+
+        self.assertEqual(self._read(), 'Test:Fields - Added field "Name" (String).\n')
+
+    def test__level(self):
+        """Tests if records below the configured level are dropped."""
+
+        with AsyncFileLogging(self.file, logging.INFO, '%(message)s'):
+            logger = logging.getLogger('Test')
+            self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+            logger.debug('hidden')
+            logger.info('shown')
+
+        self.assertEqual(self._read(), 'shown\n')
+
+    def test__stop(self):
+        """Tests if the handler is detached from the root logger."""
+
+        log = AsyncFileLogging(self.file)
+        log.start()
+        handlers = len(logging.getLogger().handlers)
+        log.stop()
+        log.stop()
+
+        self.assertEqual(len(logging.getLogger().handlers), handlers - 1)
+
+    def test__shared(self):
+        """Tests if instances logging to the same file share a handler, until the last one is stopped."""
+
+        root = logging.getLogger()
+        handlers = len(root.handlers)
+
+        first = AsyncFileLogging(self.file, logging.INFO, '%(message)s')
+        second = AsyncFileLogging(self.file, logging.INFO, '%(message)s')
+        first.start()
+        second.start()
+        logging.getLogger('Test').info('first')
+        self.assertEqual(len(root.handlers), handlers + 1)
+
+        first.stop()
+        logging.getLogger('Test').info('second')
+        self.assertEqual(len(root.handlers), handlers + 1)
+
+        second.stop()
+        self.assertEqual(len(root.handlers), handlers)
+
+        # Restarting appends to the file.
+        with first:
+            logging.getLogger('Test').info('third')
+
+        self.assertEqual(self._read(), 'first\nsecond\nthird\n')
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,146 @@
+
+import asyncio
+import json
+import os
+import shutil
+import socket
+import tempfile
+import unittest2
+
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.spec.builder.validator_writer import RESPONSE, get_field_tree
+from prpl.apis.hl.spec.mock_server import MockServer as HLAPIMockServer
+from prpl.apis.hl.spec.mock_server import get_example
+from tests.helpers import make_api, make_field
+
+
+def make_mock_api():
+    """Creates a small API, with a valid and an invalid sample response."""
+
+    get = HLAPIProcedure('Get', 'Gets the account.', '-', '{"Header": {"Name": "OK"}, "Body": {"Name": "Admin"}}')
+    get.parameters.append(make_field('Name', 'String', False, None, True))
+
+    modify = HLAPIProcedure('Set', 'Modifies the account.', '{"Name": "Admin"}', '{"Id": }')
+    modify.parameters.append(make_field('Name', 'String', True, True, False))
+    modify.parameters.append(HLAPIField('Retries', 'Login retries.', 'Integer', False, None, '3', True, None, None,
+                                        None))
+    modify.parameters.append(make_field('Hash.Type', 'String', False, None, True, '"MD5" or "SHA-256"'))
+
+    response_codes = [HLAPIResponseCode('OK', 'Success.', '{"Header": {"Code": 0, "Name": "OK"}}', [])]
+
+    return make_api([get, modify], object_name='User.Accounts.{AccountId}', response_codes=response_codes)
+
+
+def call(server, object_name, procedure_name, args=None, request_id=1):
+    params = ['session', object_name, procedure_name] + ([args] if args is not None else [])
+    request = {'jsonrpc': '2.0', 'id': request_id, 'method': 'call', 'params': params}
+
+    return json.loads(server.respond(json.dumps(request).encode()))
+
+
+class TestMockServer(unittest2.TestCase):
+    """Tests the 'MockServer' component."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.server = HLAPIMockServer(make_mock_api(), os.path.join(self.folder, 'hlapi.sock'))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test__example(self):
+        """Tests if made up responses use possible values, defaults and types, within the response header."""
+
+        self.assertEqual(get_example(get_field_tree(make_mock_api().objects[0].procedures[1], RESPONSE)),
+                         {'Retries': 3, 'Hash': {'Type': 'MD5'}})
+
+        self.assertEqual(self.server.generated, 1)
+        self.assertEqual(call(self.server, 'User.Accounts.1', 'Set', {'Name': 'Guest'})['result'], [0, {
+            'Header': {'Code': 0, 'Name': 'OK'},
+            'Body': {'Retries': 3, 'Hash': {'Type': 'MD5'}},
+        }])
+
+    def test__respond(self):
+        """Tests if calls are answered with ubus status codes, and invalid requests with JSON-RPC errors."""
+
+        self.assertEqual(call(self.server, 'User.Accounts.{AccountId}', 'Get', request_id='a'), {
+            'jsonrpc': '2.0', 'id': 'a', 'result': [0, {'Header': {'Name': 'OK'}, 'Body': {'Name': 'Admin'}}]})
+
+        self.assertEqual(call(self.server, 'User.Accounts.1', 'Set', {'Name': 1})['result'], [2])
+        self.assertEqual(call(self.server, 'User.Accounts.1', 'Set')['result'], [2])
+        self.assertEqual(call(self.server, 'User.Accounts.1', 'Clear')['result'], [3])
+        self.assertEqual(call(self.server, 'User.Roles', 'Get')['result'], [4])
+
+        self.assertEqual(json.loads(self.server.respond(b'{"id": 1, "method": "call"'))['error']['code'], -32700)
+        self.assertEqual(json.loads(self.server.respond(b'[' * 100000 + b']' * 100000))['error']['code'], -32700)
+        self.assertEqual(json.loads(self.server.respond(b'{"id": 1, "method": "call"}'))['error']['code'], -32602)
+        self.assertEqual(json.loads(self.server.respond(b'{"id": 1, "method": "exec"}'))['error']['code'], -32601)
+        self.assertEqual(self.server.respond(b'{"method": "call", "params": []}'), b'')
+
+        self.assertEqual(json.loads(self.server.respond(b'{"id": 1, "method": "list", "params": ["User.*"]}')), {
+            'jsonrpc': '2.0', 'id': 1, 'result': {'User.Accounts.{AccountId}': {'Get': {}, 'Set': {'Name': 'String'}}}})
+
+    def test__serve(self):
+        """Tests if many concurrent connections are served over the socket, and their latencies recorded."""
+
+        async def client(index):
+            reader, writer = await asyncio.open_unix_connection(self.server.path)
+            responses = []
+            for i in range(5):
+                request = {'jsonrpc': '2.0', 'id': i, 'method': 'call',
+                           'params': ['session', 'User.Accounts.{}'.format(index), 'Get', {}]}
+                writer.write(json.dumps(request).encode() + b'\n')
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+
+            return responses
+
+        async def run():
+            await self.server.start()
+            try:
+                return await asyncio.gather(*[client(i) for i in range(200)])
+            finally:
+                await self.server.stop()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(set(r['result'][0] for responses in results for r in responses), {0})
+        self.assertEqual([r['id'] for r in results[-1]], [0, 1, 2, 3, 4])
+        self.assertEqual(self.server.requests, 1000)
+        self.assertEqual(list(self.server.get_latency_percentiles()), [50, 90, 99, 99.9])
+        self.assertFalse(os.path.exists(self.server.path))
+
+    def test__socket_file(self):
+        """Tests if only stale sockets are replaced, and if only the socket of the server is removed."""
+
+        with open(self.server.path, 'w') as f:
+            f.write('Not a socket.')
+
+        with self.assertRaises(Exception):
+            asyncio.run(self.server.start())
+        self.assertTrue(os.path.isfile(self.server.path))
+
+        os.remove(self.server.path)
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(self.server.path)
+        stale.close()
+
+        async def run():
+            await self.server.start()
+
+            # Another server took over the path.
+            os.remove(self.server.path)
+            other = socket.socket(socket.AF_UNIX)
+            other.bind(self.server.path)
+            other.close()
+
+            await self.server.stop()
+
+        asyncio.run(run())
+        self.assertTrue(os.path.exists(self.server.path))
+
+
+if __name__ == '__main__':
+    unittest2.main()
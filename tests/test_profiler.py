@@ -0,0 +1,91 @@
+
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest2
+
+from launcher import Launcher
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.spec import profiler as HLAPIProfilerModule
+from prpl.apis.hl.spec.builder import SnapshotWriter as HLAPISnapshotWriter
+from prpl.apis.hl.spec.profiler import Profiler as HLAPIProfiler
+
+
+class TestProfiler(unittest2.TestCase):
+    """Tests the 'Profiler' component."""
+
+    def test__spans(self):
+        """Tests if nested spans are named after their parents and aggregated."""
+
+        profiler = HLAPIProfiler()
+        with profiler:
+            with profiler.stage('parse'):
+                for _ in range(3):
+                    with HLAPIProfilerModule.span('object'):
+                        with HLAPIProfilerModule.span('write'):
+                            data = bytearray(1024 * 1024)
+                            del data
+
+        report = profiler.get_report()
+
+        self.assertEqual(list(report['spans']), ['parse/object/write', 'parse/object', 'parse'])
+        self.assertEqual(report['spans']['parse/object']['calls'], 3)
+        self.assertEqual(report['slowest_stage'], 'parse')
+
+        # Peaks of nested spans are included in their parents.
+        write_peak = report['spans']['parse/object/write']['peak_memory']
+        self.assertGreaterEqual(write_peak, 1024 * 1024)
+        self.assertGreaterEqual(report['spans']['parse/object']['peak_memory'], write_peak)
+        self.assertGreaterEqual(report['spans']['parse']['peak_memory'], write_peak)
+
+    def test__disabled(self):
+        """Tests if spans are ignored while no profiler is active."""
+
+        profiler = HLAPIProfiler()
+        with profiler:
+            pass
+
+        with HLAPIProfilerModule.span('ignored'):
+            pass
+
+        self.assertEqual(len(profiler.spans), 0)
+        self.assertIsNone(profiler.dump_slowest_stage('unused.prof'))
+
+    def test__launcher(self):
+        """Tests if a profiled launcher run writes a report and a dump of its slowest stage."""
+
+        cwd = os.getcwd()
+        folder = tempfile.mkdtemp()
+        os.chdir(folder)
+        try:
+            HLAPISnapshotWriter(HLAPI([], [], [HLAPIVersion('3.5', '2018-04-13')]), 'api.hlapi').build()
+
+            profiler = HLAPIProfiler(dump_stages=True)
+            launcher = Launcher('api.hlapi', input_format='snapshot', output_format=['sqlite', 'snapshot'],
+                                profiler=profiler)
+            try:
+                launcher.run()
+            finally:
+                launcher.log.stop()
+
+            profiler.write_report('profile.json')
+            stage = profiler.dump_slowest_stage('profile.prof')
+
+            with open('profile.json') as f:
+                report = json.load(f)
+            stats = pstats.Stats('profile.prof')
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(folder)
+
+        self.assertEqual(list(report['stages']), ['parse', 'sqlite', 'snapshot'])
+        self.assertIn(stage, report['stages'])
+        self.assertEqual(report['spans']['sqlite']['calls'], 1)
+        self.assertGreater(stats.total_calls, 0)
+
+
+if __name__ == '__main__':
+    unittest2.main()
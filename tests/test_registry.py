@@ -0,0 +1,126 @@
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest2
+
+from launcher import Launcher
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.spec.builder import SnapshotWriter as HLAPISnapshotWriter
+from prpl.apis.hl.spec.registry import BUILTIN_BACKENDS, Backend, FormatRegistry, INCREMENTAL, READER, STREAMING, \
+    WRITER
+
+# Outputs written by the 'RecordingWriter'.
+BUILT = []
+
+
+class RecordingWriter:
+    """Writer which only records its output."""
+
+    def __init__(self, api, output):
+        self.output = output
+
+    def build(self):
+        BUILT.append(self.output)
+
+
+class EntryPoint:
+    """Entry point stub, loading a given declaration."""
+
+    def __init__(self, name, declared):
+        self.name = name
+        self.value = 'tests.test_registry:{}'.format(name)
+        self.declared = declared
+        self.loaded = False
+
+    def load(self):
+        self.loaded = True
+        return self.declared
+
+
+class StubRegistry(FormatRegistry):
+    """Registry discovering the given entry points instead of the installed ones."""
+
+    def __init__(self, backends, entry_points):
+        FormatRegistry.__init__(self, backends)
+        self.stubs = entry_points
+
+    def _get_entry_points(self, kind):
+        return [e for e in self.stubs if e.declared.kind == kind]
+
+
+class TestRegistry(unittest2.TestCase):
+    """Tests the 'FormatRegistry' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.regular = Backend(WRITER, 'xls', 'Regular', 'tests.test_registry:RecordingWriter',
+                               startup_cost=10, unit_cost=1.0)
+        self.streaming = Backend(WRITER, 'xls', 'Streaming', 'tests.test_registry:RecordingWriter',
+                                 capabilities=[STREAMING], startup_cost=100, unit_cost=0.1,
+                                 output='out/{version}.xlsx')
+
+    def test__select_by_cost(self):
+        """Tests if the cheapest backend for the amount of work is selected."""
+
+        registry = FormatRegistry([self.regular, self.streaming], discover=False)
+
+        self.assertIs(registry.select(WRITER, 'xls', size=10), self.regular)
+        self.assertIs(registry.select(WRITER, 'xls', size=10000), self.streaming)
+        self.assertIs(registry.select(WRITER, 'xls', [STREAMING], size=10), self.streaming)
+
+        with self.assertRaises(Exception):
+            registry.select(WRITER, 'xls', [INCREMENTAL])
+        with self.assertRaises(Exception):
+            registry.select(WRITER, 'pdf')
+
+    def test__lazy_discovery(self):
+        """Tests if only the entry points of the looked up format are loaded."""
+
+        xls = EntryPoint('xls', self.streaming)
+        pdf = EntryPoint('pdf', Backend(WRITER, 'pdf', 'PDF', 'missing.module:PDFWriter'))
+        registry = StubRegistry([self.regular], [xls, pdf])
+
+        self.assertEqual(registry.get_formats(WRITER), ['xls', 'pdf'])
+        self.assertFalse(xls.loaded or pdf.loaded)
+
+        self.assertEqual(registry.get_backends(WRITER, 'xls'), [self.regular, self.streaming])
+        self.assertTrue(xls.loaded)
+        self.assertFalse(pdf.loaded)
+        self.assertNotIn('missing.module', sys.modules)
+
+    def test__builtin_backends(self):
+        """Tests if every built-in backend references an existing class."""
+
+        for backend in BUILTIN_BACKENDS:
+            self.assertTrue(callable(backend.load()), backend.target)
+            self.assertEqual(backend.output is not None, backend.kind == WRITER)
+
+    def test__launcher(self):
+        """Tests if the launcher builds outputs with the backends of its registry."""
+
+        cwd = os.getcwd()
+        folder = tempfile.mkdtemp()
+        os.chdir(folder)
+        try:
+            HLAPISnapshotWriter(HLAPI([], [], [HLAPIVersion('3.5', '2018-04-13')]), 'api.hlapi').build()
+
+            registry = FormatRegistry([b for b in BUILTIN_BACKENDS if b.kind == READER] + [self.streaming],
+                                      discover=False)
+            launcher = Launcher('api.hlapi', input_format='snapshot', output_format='xls', registry=registry)
+            try:
+                launcher.run()
+            finally:
+                launcher.log.stop()
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(folder)
+
+        self.assertEqual(BUILT, ['out/3.5.xlsx'])
+
+
+if __name__ == '__main__':
+    unittest2.main()
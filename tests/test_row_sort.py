@@ -0,0 +1,108 @@
+
+from operator import itemgetter
+import os
+import shutil
+import tempfile
+import unittest2
+
+from openpyxl import load_workbook
+
+from prpl.apis.hl.factory import ExcelObjectFactory as HLAPIObjectFactory
+from prpl.apis.hl.factory.row_sort import RowCursor, check_sorted, external_sort, get_sort_key
+from prpl.apis.hl.spec.parser import ExcelReader as HLAPIExcelParser
+from tests.helpers import make_workbook
+
+
+class TestRowSort(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.factory.row_sort' helpers."""
+
+    def test__cursor(self):
+        """Tests if rows are consumed lazily and out of order rows are reported."""
+
+        cursor = RowCursor(iter([{'Name': 'A'}, {'Name': 'B'}]), itemgetter('Name'))
+        self.assertEqual(cursor.pop(), {'Name': 'A'})
+        self.assertEqual(cursor.pop(), {'Name': 'B'})
+        self.assertIsNone(cursor.head)
+
+        cursor = RowCursor([{'Name': 'B'}, {'Name': 'A'}], itemgetter('Name'), 'Response codes')
+        with self.assertRaisesRegex(Exception, 'Response codes are not sorted'):
+            cursor.pop()
+
+    def test__external_sort(self):
+        """Tests if rows spread over several runs are merged in a stable order."""
+
+        rows = [{'Key': k, 'Index': i} for i, k in enumerate([3, 1, 2, 1, 3, 2, 1])]
+
+        self.assertEqual(check_sorted(rows, itemgetter('Key')), (False, 7))
+
+        result = list(external_sort(rows, itemgetter('Key'), run_size=2))
+        self.assertEqual([(r['Key'], r['Index']) for r in result],
+                         [(1, 1), (1, 3), (1, 6), (2, 2), (2, 5), (3, 0), (3, 4)])
+        self.assertEqual(check_sorted(result, itemgetter('Key')), (True, 7))
+
+    def test__sort_key(self):
+        """Tests if empty cells and values of different types can be sorted."""
+
+        rows = [{'Code': c} for c in ['B', None, 2, 'A', 1.5]]
+        result = list(external_sort(rows, get_sort_key(('Code',)), run_size=2))
+
+        self.assertEqual([r['Code'] for r in result], [1.5, 2, 'A', 'B', None])
+
+    def test__factory_budget(self):
+        """Tests if the factory links rows sorted on disk when they exceed its memory budget."""
+
+        procedures = [{'Layer': 1, 'Object': o, 'Method': 'Get', 'Description': '-', 'Request Body (Sample)': '-',
+                       'Response Body (Sample)': '-', 'Resource': None} for o in ['C', 'A', None, 'B']]
+        parameters = [{'Layer': 1, 'Object': o, 'Method': 'Get', 'Parameter': p, 'Description': '-', 'Type': 'String',
+                       'Rights': 'R', 'Required': None, 'Default Value': '-', 'Possible Values': '-', 'Format': '-',
+                       'Notes': '-'} for o in ['B', 'A', 'C'] for p in ['Y', 'X']]
+
+        factory = HLAPIObjectFactory(procedures, parameters, [], [], [], [], [], sort_budget=2)
+        api = factory.get_api()
+
+        self.assertEqual([o.name for o in api.objects], ['A', 'B', 'C', None])
+        self.assertEqual([f.name for f in api.objects[0].procedures[0].parameters], ['X', 'Y'])
+
+
+class TestExcelStreaming(unittest2.TestCase):
+    """Tests the streaming mode of the 'ExcelReader' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.cwd = os.getcwd()
+        self.test_folder = tempfile.mkdtemp()
+        os.chdir(self.test_folder)
+
+        make_workbook('spec.xlsx')
+
+        # Add fields out of order.
+        wb = load_workbook('spec.xlsx')
+        for parameter in ['Offset', 'Filter']:
+            wb['Parameters'].append([1, 'User.Accounts', 'List', parameter, 'Paging.', 'Integer', 'W', 'Optional',
+                                     '-', '-', '-', '-'])
+        wb.save('spec.xlsx')
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_folder)
+
+    def test__streaming(self):
+        """Tests if streamed rows are linked like whole sheets, even when they are not sorted."""
+
+        parser = HLAPIExcelParser('spec.xlsx', streaming=True)
+        api = parser.parse()
+        expected = HLAPIExcelParser('spec.xlsx').parse()
+
+        self.assertIsNone(parser.raw_parameters)
+        self.assertEqual([f.name for f in api.objects[0].procedures[0].parameters], ['Filter', 'Limit', 'Offset'])
+        self.assertEqual([f.name for f in api.objects[0].procedures[0].parameters],
+                         [f.name for f in expected.objects[0].procedures[0].parameters])
+        self.assertEqual(api.objects[0].events[0].name, 'ADDED')
+        self.assertEqual(api.get_version(), '3.5')
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,81 @@
+
+import unittest2
+
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.spec import samples as hlapi_samples
+from prpl.apis.hl.spec.samples import SampleChecker as HLAPISampleChecker
+from tests.helpers import make_api, make_field
+
+
+def make_samples_api(sample_request='{"Id": "Admin", "Enabled": true}'):
+    """Creates a small API, with valid and invalid samples."""
+
+    add = HLAPIProcedure('Add', 'Adds an account.', sample_request,
+                         '{"Header": {"Name": "OK"}, "Body": {"Hash": {"Type": "MD4"}}}')
+    add.parameters.append(make_field('Id', 'String', True, True, False))
+    add.parameters.append(make_field('Enabled', 'Boolean', True, False, False))
+    add.parameters.append(make_field('Hash.Type', 'String', False, None, True, '"MD5" or "SHA-256"'))
+
+    clear = HLAPIProcedure('Clear', 'Removes all accounts.', '-', '{"Header": {"Name": "OK"}}')
+
+    response_codes = [
+        HLAPIResponseCode('OK', 'Success.', '{"Header": {"Name": "OK"}}', []),
+        HLAPIResponseCode('ERROR', 'Failure.', '{"Header": {"Name": "OK"}}', []),
+    ]
+
+    return make_api([add, clear],
+                    events=[HLAPIEvent(1, 'USER_ACCOUNTS_ADDED', 'Raised when an account is added.', '{"Id": }')],
+                    response_codes=response_codes)
+
+
+class TestSamples(unittest2.TestCase):
+    """Tests the 'SampleChecker' component."""
+
+    def test__check(self):
+        """Tests if invalid JSON and samples not matching their declaration are reported."""
+
+        issues = HLAPISampleChecker(make_samples_api('{"Enabled": 1, "Name": "Admin"}'), jobs=1).check()
+
+        self.assertEqual([str(i) for i in issues], [
+            'ERROR (response code sample): Header.Name: expected "ERROR"',
+            'User.Accounts/Add (request sample): Id: missing required field',
+            'User.Accounts/Add (request sample): Enabled: expected Boolean',
+            'User.Accounts/Add (request sample): Name: undeclared field',
+            'User.Accounts/Add (response sample): Body.Hash.Type: expected one of "MD5", "SHA-256"',
+            'User.Accounts/1 (event sample): invalid JSON (Expecting value: line 1 column 8 (char 7))',
+        ])
+
+    def test__cache(self):
+        """Tests if identical and already checked samples are only checked once."""
+
+        checker = HLAPISampleChecker(make_samples_api(), jobs=1)
+        issues = checker.check()
+
+        # Both response codes share a sample, but not the expected name.
+        self.assertEqual((checker.checked, checker.cached), (6, 0))
+
+        self.assertEqual([str(i) for i in checker.check()], [str(i) for i in issues])
+        self.assertEqual((checker.checked, checker.cached), (0, 6))
+
+        # Only the samples of the replaced procedure are checked again.
+        checker.api.objects[0].procedures[0] = make_samples_api('{"Id": "Guest"}').objects[0].procedures[0]
+        self.assertEqual([str(i) for i in checker.check()], [str(i) for i in issues])
+        self.assertEqual((checker.checked, checker.cached), (2, 4))
+
+    def test__parallel(self):
+        """Tests if samples checked by worker processes give the same issues."""
+
+        threshold = hlapi_samples.PARALLEL_THRESHOLD
+        hlapi_samples.PARALLEL_THRESHOLD = 1
+        try:
+            issues = HLAPISampleChecker(make_samples_api(), jobs=2).check()
+        finally:
+            hlapi_samples.PARALLEL_THRESHOLD = threshold
+
+        self.assertEqual([str(i) for i in issues], [str(i) for i in HLAPISampleChecker(make_samples_api(), jobs=1).check()])
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import unittest2
+
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import Instance as HLAPIInstance
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.spec.builder.snapshot_writer import SnapshotWriter as HLAPISnapshotWriter
+from prpl.apis.hl.spec.parser.snapshot_reader import SnapshotReader as HLAPISnapshotParser
+
+
+class TestSnapshot(unittest2.TestCase):
+    """Tests the 'SnapshotWriter' and 'SnapshotReader' components."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        api_version = HLAPIVersion('3.5', '2018-04-13')
+        api_version.change_list.append((1, 'Added new "foo" object.'))
+
+        api_object = HLAPIObject(1, 'User.Accounts.{AccountId}', 'User Account')
+
+        api_procedure = HLAPIProcedure('Set', 'Modifies the account.', '{"Name":"Admin"}', '-')
+        api_procedure.parameters.append(
+            HLAPIField('Name', 'Account name.', 'String', True, True, '-', False, '-', None, '-'))
+        api_procedure.parameters.append(
+            HLAPIField('Hash.Type', 'Hash type (MD5, SHA-1 … SHA-256).', 'String', False, None, '-', True, '-', None,
+                       '-'))
+        api_object.procedures.append(api_procedure)
+
+        api_get = HLAPIProcedure('Get', 'Retrieves the account.', '-', '-')
+        api_get.fields = {'Id': HLAPIField('Id', 'Account id.', 'String', False, False, '-', True, '-', '-', '-')}
+        api_object.procedures.append(api_get)
+
+        api_object.events.append(HLAPIEvent(1, 'ADDED', 'Raised when a new account is added.', '-'))
+        api_object.instances.append(HLAPIInstance('WUI:Admin', 'Web-GUI administrator account.'))
+
+        api_response_code = HLAPIResponseCode('OK', 'Successfully processed.', '{"Header":{"Code":0}}', '')
+
+        self.api = HLAPI([api_object], [api_response_code], [api_version])
+
+        self.test_folder = tempfile.mkdtemp()
+        self.file = os.path.join(self.test_folder, 'snapshot', 'api.hlapi')
+
+        HLAPISnapshotWriter(self.api, self.file).build()
+        self.loaded = HLAPISnapshotParser(self.file).parse()
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        shutil.rmtree(self.test_folder)
+
+    def test__versions(self):
+        """Tests if versions and change lists are restored."""
+
+        self.assertEqual(self.loaded.get_version(), '3.5')
+        self.assertEqual(self.loaded.versions[0].date, '2018-04-13')
+        self.assertEqual(self.loaded.versions[0].change_list, [(1, 'Added new "foo" object.')])
+
+    def test__response_codes(self):
+        """Tests if response codes are restored."""
+
+        self.assertEqual([vars(r) for r in self.loaded.response_codes],
+                         [vars(r) for r in self.api.response_codes])
+
+    def test__objects(self):
+        """Tests if objects, procedures, fields, events and instances are restored."""
+
+        original = self.api.objects[0]
+        loaded = self.loaded.objects[0]
+
+        self.assertEqual((loaded.layer, loaded.name, loaded.resource),
+                         (original.layer, original.name, original.resource))
+        self.assertEqual([vars(e) for e in loaded.events], [vars(e) for e in original.events])
+        self.assertEqual([vars(i) for i in loaded.instances], [vars(i) for i in original.instances])
+
+        api_set, api_get = loaded.procedures
+        self.assertEqual(api_set.sample_request, '{"Name":"Admin"}')
+        self.assertEqual([vars(f) for f in api_set.parameters],
+                         [vars(f) for f in original.procedures[0].parameters])
+        self.assertFalse(hasattr(api_set, 'fields'))
+
+        self.assertEqual(list(api_get.fields.keys()), ['Id'])
+        self.assertEqual(vars(api_get.fields['Id']), vars(original.procedures[1].fields['Id']))
+
+    def test__shared_strings(self):
+        """Tests if repeated values are decoded into a single string."""
+
+        fields = self.loaded.objects[0].procedures[0].parameters
+        self.assertIs(fields[0].type, fields[1].type)
+
+    def test__invalid_file(self):
+        """Tests if files which are not snapshots are rejected."""
+
+        with open(self.file, 'wb') as f:
+            f.write(b'\0' * 64)
+
+        with self.assertRaises(Exception):
+            HLAPISnapshotParser(self.file).parse()
+
+
+if __name__ == '__main__':
+    unittest2.main()
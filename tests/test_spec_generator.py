@@ -0,0 +1,74 @@
+
+import filecmp
+import os
+import shutil
+import tempfile
+import unittest2
+
+from benchmarks.spec_generator import SpecGenerator
+from prpl.apis.hl.spec.parser import ExcelReader as HLAPIExcelParser
+from prpl.apis.hl.spec.parser import JSONReader as HLAPIJSONParser
+
+
+def get_counts(api):
+    """Counts the objects, procedures, fields, events, instances and versions of an API."""
+
+    procedures = [p for o in api.objects for p in o.procedures]
+
+    return {
+        'objects': len(api.objects),
+        'procedures': len(procedures),
+        'fields': sum(len(p.parameters) + len(getattr(p, 'fields', {})) for p in procedures),
+        'events': sum(len(o.events) for o in api.objects),
+        'instances': sum(len(o.instances) for o in api.objects),
+        'versions': len(api.versions),
+    }
+
+
+class TestSpecGenerator(unittest2.TestCase):
+    """Tests the 'SpecGenerator' benchmark fixture generator."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.cwd = os.getcwd()
+        self.test_folder = tempfile.mkdtemp()
+        os.chdir(self.test_folder)
+
+        self.generator = SpecGenerator(objects=3, procedures=2, parameters=5, depth=3, events=2, instances=1,
+                                       versions=2)
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_folder)
+
+    def test__excel(self):
+        """Tests if the generated Excel specification is parsed by the 'ExcelReader'."""
+
+        self.generator.write_excel('spec.xlsx')
+        api = HLAPIExcelParser('spec.xlsx').parse()
+
+        self.assertEqual(get_counts(api), dict(self.generator.get_counts()))
+        self.assertEqual(api.get_version(), '1.1')
+        self.assertEqual(api.objects[1].name, 'Synthetic.Object0000.{Object0000Id}')
+        self.assertIn('Level0.Level1.Param002', [f.name for f in api.objects[0].procedures[0].parameters])
+
+    def test__json(self):
+        """Tests if the generated JSON specification is parsed by the 'JSONReader', and is deterministic."""
+
+        self.generator.write_json('spec')
+        api = HLAPIJSONParser('spec').parse()
+
+        self.assertEqual(get_counts(api), dict(self.generator.get_counts()))
+        self.assertEqual(api.get_version(), '1.1')
+        self.assertEqual([c.name for c in api.response_codes][0], 'OK')
+
+        self.generator.write_json('again')
+        files = sorted(os.listdir('spec'))
+        self.assertEqual(filecmp.cmpfiles('spec', 'again', files, shallow=False)[0], files)
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,96 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest2
+
+from prpl.apis.hl.com import API as HLAPI
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Field as HLAPIField
+from prpl.apis.hl.com import Instance as HLAPIInstance
+from prpl.apis.hl.com import Object as HLAPIObject
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.com import Version as HLAPIVersion
+from prpl.apis.hl.spec.builder.sqlite_writer import SQLiteWriter as HLAPISQLiteWriter
+
+
+class TestSQLiteWriter(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.spec.builder.SQLiteWriter' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        api_version = HLAPIVersion('3.5', '2018-04-13')
+        api_version.change_list.append((1, 'Added new "foo" object.'))
+
+        api_accounts = HLAPIObject(1, 'User.Accounts', 'User Account')
+        api_accounts.events.append(HLAPIEvent(1, 'ADDED', 'Raised when a new account is added.', '-'))
+
+        api_account = HLAPIObject(1, 'User.Accounts.{AccountId}', 'User Account')
+        api_set = HLAPIProcedure('Set', 'Modifies the account.', '{"Password":"prpl"}', '-')
+        api_set.parameters.append(
+            HLAPIField('AccountId', 'Account id.', 'String', True, True, '-', False, '-', '-', '-'))
+        api_set.parameters.append(
+            HLAPIField('Password', 'Account password.', 'String', True, False, '-', False, '-', '-', '-'))
+        api_account.procedures.append(api_set)
+
+        # Procedure fields as built from a JSON specification.
+        api_get = HLAPIProcedure('Get', 'Retrieves the account.', '-', '-')
+        api_get.fields = {'Name': HLAPIField('Name', 'Account name.', 'String', False, False, '-', True, '-', '-', '-')}
+        api_account.procedures.append(api_get)
+
+        api_account.instances.append(HLAPIInstance('WUI:Admin', 'Web-GUI administrator account.'))
+
+        self.api = HLAPI([api_accounts, api_account],
+                         [HLAPIResponseCode('OK', 'Successfully processed.', '-', '')],
+                         [api_version])
+
+        self.test_folder = tempfile.mkdtemp()
+        self.file = os.path.join(self.test_folder, 'api.db')
+        HLAPISQLiteWriter(self.api, self.file).build()
+
+        self.db = sqlite3.connect(self.file)
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        self.db.close()
+        shutil.rmtree(self.test_folder)
+
+    def test__tables(self):
+        """Tests if every table has been filled."""
+
+        counts = {table: self.db.execute('SELECT COUNT(*) FROM {}'.format(table)).fetchone()[0]
+                  for table in ['versions', 'changes', 'response_codes', 'objects', 'procedures', 'fields',
+                                'events', 'instances']}
+
+        self.assertEqual(counts, {'versions': 1, 'changes': 1, 'response_codes': 1, 'objects': 2,
+                                  'procedures': 2, 'fields': 3, 'events': 1, 'instances': 1})
+
+    def test__procedure_fields(self):
+        """Tests looking up the procedures taking a field."""
+
+        rows = self.db.execute('SELECT object, procedure FROM procedure_fields WHERE name = ? AND is_input',
+                               ('AccountId',)).fetchall()
+
+        self.assertEqual(rows, [('User.Accounts.{AccountId}', 'Set')])
+
+    def test__object_events(self):
+        """Tests looking up the objects raising an event."""
+
+        rows = self.db.execute('SELECT object FROM object_events WHERE full_name = ?',
+                               ('USER_ACCOUNTS_ADDED',)).fetchall()
+
+        self.assertEqual(rows, [('User.Accounts',)])
+
+    def test__descriptions(self):
+        """Tests the full-text search over descriptions."""
+
+        rows = self.db.execute("SELECT kind, name FROM descriptions WHERE descriptions MATCH 'password'").fetchall()
+
+        self.assertEqual(rows, [('field', 'Password')])
+
+
+if __name__ == '__main__':
+    unittest2.main()
@@ -0,0 +1,92 @@
+import unittest2
+
+from prpl.apis.hl.factory import StringPool as HLAPIStringPool
+from prpl.apis.hl.factory import ExcelObjectFactory as HLAPIObjectFactory
+
+
+def make_parameter(object_name, method, parameter, field_type):
+    """Creates a raw 'Parameters' sheet row."""
+
+    return {'Layer': 1, 'Object': object_name, 'Method': method, 'Parameter': parameter,
+            'Description': 'User Account {}.'.format(parameter.lower()), 'Type': ''.join(field_type),
+            'Rights': 'RW', 'Required': 'Optional', 'Default Value': '-', 'Possible Values': '-',
+            'Format': '-', 'Notes': '-'}
+
+
+class TestStringPool(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.factory.StringPool' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.pool = HLAPIStringPool()
+
+    def test__intern(self):
+        """Tests if equal strings are collapsed into a single copy."""
+
+        a = ''.join(['Str', 'ing'])
+        b = ''.join(['Str', 'ing'])
+        self.assertIsNot(a, b)
+
+        self.assertIs(self.pool.intern(a), a)
+        self.assertIs(self.pool.intern(b), a)
+        self.assertEqual(len(self.pool), 1)
+
+    def test__intern_non_strings(self):
+        """Tests if non-string values are returned untouched and not pooled."""
+
+        self.assertIsNone(self.pool.intern(None))
+        self.assertEqual(self.pool.intern(4), 4)
+        self.assertEqual(len(self.pool), 0)
+
+    def test__get_report(self):
+        """Tests if the report accounts for the dropped duplicates."""
+
+        for _ in range(3):
+            self.pool.intern(''.join(['Boo', 'lean']))
+
+        report = self.pool.get_report()
+        self.assertEqual(report['unique'], 1)
+        self.assertEqual(report['lookups'], 3)
+        self.assertEqual(report['duplicates'], 2)
+        self.assertGreater(report['saved_bytes'], 0)
+
+        self.pool.clear()
+        self.assertEqual(self.pool.get_report()['lookups'], 0)
+
+    def _make_factory(self, string_pool=None):
+        procedures = [{'Layer': 1, 'Object': 'User.Accounts', 'Method': 'Get', 'Description': 'Gets.',
+                       'Request Body (Sample)': '-', 'Response Body (Sample)': '-', 'Resource': 'User Account'}]
+        parameters = [make_parameter('User.Accounts', 'Get', 'Id', ['Str', 'ing']),
+                      make_parameter('User.Accounts', 'Get', 'Name', ['Str', 'ing'])]
+        change_log = [{'Number': '3.5', 'Date': '2018-04-13', 'Changes': [(1, 'Added "foo".')]}]
+
+        return HLAPIObjectFactory(procedures, parameters, [], [], [], [], change_log, string_pool=string_pool)
+
+    def test__shared_between_factories(self):
+        """Tests if APIs built by different factories share their strings through the pool."""
+
+        apis = [self._make_factory(self.pool).get_api() for _ in range(2)]
+
+        first = apis[0].objects[0].procedures[0].parameters
+        second = apis[1].objects[0].procedures[0].parameters
+
+        self.assertIs(first[0].type, first[1].type)
+        self.assertIs(first[0].type, second[0].type)
+        self.assertIs(apis[0].objects[0].name, apis[1].objects[0].name)
+        self.assertGreater(self.pool.get_report()['duplicates'], 0)
+
+    def test__pool_per_factory(self):
+        """Tests if factories use their own pool by default, so that reports and strings are not kept across parses."""
+
+        first = self._make_factory()
+        second = self._make_factory()
+        first.get_api()
+        second.get_api()
+
+        self.assertIsNot(first.string_pool, second.string_pool)
+        self.assertEqual(first.string_pool.get_report(), second.string_pool.get_report())
+
+
+if __name__ == '__main__':
+    unittest2.main()
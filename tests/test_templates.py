@@ -0,0 +1,32 @@
+import os
+import unittest2
+
+from prpl.apis.hl.spec.builder import templates
+
+
+class TestTemplates(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.spec.builder.templates' cache."""
+
+    def test__read(self):
+        """Tests if templates are read once, whatever the path spelling."""
+
+        templates.clear()
+        path = os.path.join(templates.TEMPLATE_FOLDER, 'object.json')
+
+        content = templates.read_bytes(path)
+        relative = os.path.relpath(path)
+
+        self.assertIs(templates.read_bytes(relative), content)
+        self.assertEqual(templates.read_text(path), content.decode('utf-8'))
+
+    def test__preload(self):
+        """Tests if the default templates are preloaded."""
+
+        templates.clear()
+        templates.preload()
+
+        self.assertEqual(templates._read.cache_info().currsize, len(templates.TEMPLATES))
+
+
+if __name__ == '__main__':
+    unittest2.main()
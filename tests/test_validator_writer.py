@@ -0,0 +1,99 @@
+
+import os
+import shutil
+import tempfile
+import unittest2
+
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.spec.builder import ValidatorWriter as HLAPIValidatorWriter
+from prpl.apis.hl.spec.builder.validator_writer import get_enum, load_validators
+from tests.helpers import make_api, make_field
+
+
+def make_nested_api():
+    """Creates a small API, with nested, list and enum fields."""
+
+    get = HLAPIProcedure('Get', 'Gets an account.', '-', '-')
+    get.parameters.append(make_field('Id', 'String', True, True, True))
+    get.parameters.append(make_field('Enabled', 'Boolean', True, False, True))
+    get.parameters.append(make_field('Hash.Type', 'String', False, None, True, '"MD5", "SHA-256" or "SHA-512"'))
+    get.parameters.append(make_field('Hash.Size', 'Integer', False, True, True))
+    get.parameters.append(make_field('Roles', 'List', False, None, True))
+    get.parameters.append(make_field('Roles.Name', 'String', False, True, True))
+
+    return make_api([get], object_name='User.Accounts.{AccountId}')
+
+
+class TestValidatorWriter(unittest2.TestCase):
+    """Tests the 'ValidatorWriter' component."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.file = os.path.join(self.folder, 'validators', 'hlapi_validators.py')
+
+        HLAPIValidatorWriter(make_nested_api(), self.file).build()
+        self.validators = load_validators(self.file)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test__enum(self):
+        """Tests if only explicit lists of quoted values are turned into enums."""
+
+        self.assertEqual(get_enum(make_field('A', 'String', True, True, True, '"MD5", "SHA-256" or "SHA-512"')),
+                         ['MD5', 'SHA-256', 'SHA-512'])
+        self.assertIsNone(get_enum(make_field('A', 'String', True, True, True, 'Any string, e.g.: "MD5" or "x"')))
+        self.assertIsNone(get_enum(make_field('A', 'Integer', True, True, True, '"1" or "2"')))
+        self.assertIsNone(get_enum(make_field('A', 'String', True, True, True, '"MD5"')))
+
+    def test__validate(self):
+        """Tests if required fields, types, enums, nested objects and lists of objects are checked."""
+
+        validate = self.validators.validate
+
+        self.assertEqual(validate('User.Accounts.{AccountId}', 'Get', 'request', {'Id': 'Admin'}), [])
+        self.assertEqual(validate('User.Accounts.{AccountId}', 'Get', 'request', {'Enabled': 1}),
+                         ['Id: missing required field', 'Enabled: expected Boolean'])
+        self.assertEqual(validate('User.Accounts.{AccountId}', 'Get', 'request', []), ['expected an object'])
+
+        response = {'Id': 'Admin', 'Hash': {'Type': 'MD4', 'Size': True}, 'Roles': [{'Name': 'admin'}, {}, 3]}
+        self.assertEqual(validate('User.Accounts.{AccountId}', 'Get', 'response', response), [
+            'Hash.Type: expected one of "MD5", "SHA-256", "SHA-512"',
+            'Hash.Size: expected Integer',
+            'Roles[1].Name: missing required field',
+            'Roles[2]: expected Object',
+        ])
+
+    def test__validate_batch(self):
+        """Tests if messages of object instances are validated in bulk, and only invalid ones are reported."""
+
+        messages = [
+            ('User.Accounts.1', 'Get', 'request', {'Id': 'Admin'}),
+            ('User.Roles', 'Get', 'request', {}),
+            ('User.Accounts.2', 'Get', 'request', {}),
+            ('User.Accounts.1.Roles', 'Get', 'request', {}),
+        ]
+
+        self.assertEqual(self.validators.validate_batch(messages), [
+            (1, ['unknown procedure "User.Roles.Get"']),
+            (2, ['Id: missing required field']),
+            (3, ['unknown procedure "User.Accounts.1.Roles.Get"']),
+        ])
+
+    def test__escape(self):
+        """Tests if names and versions with line breaks or quotes cannot inject code into the generated module."""
+
+        api = make_api([HLAPIProcedure('Get\r\nimport sys', 'Gets an account.', '-', '-')],
+                       object_name='User.Accounts\nimport os', version='3.5\n"""\nimport shutil')
+
+        file = os.path.join(self.folder, 'escaped', 'hlapi_validators.py')
+        HLAPIValidatorWriter(api, file).build()
+        validators = load_validators(file)
+
+        for module in ('os', 'sys', 'shutil'):
+            self.assertFalse(hasattr(validators, module))
+        self.assertEqual(validators.validate('User.Accounts\nimport os', 'Get\r\nimport sys', 'request', {}), [])
+
+
+if __name__ == '__main__':
+    unittest2.main()
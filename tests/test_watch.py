@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest2
+
+from launcher import Launcher
+from prpl.apis.hl.spec.watch import ExcelSource as HLAPIExcelSource
+from prpl.apis.hl.spec.watch import JSONSource as HLAPIJSONSource
+from tests.helpers import make_workbook
+
+TEST_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test-json')
+
+
+class TestWatch(unittest2.TestCase):
+    """Tests the 'prpl.apis.hl.spec.watch' incremental sources."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.cwd = os.getcwd()
+        self.test_folder = tempfile.mkdtemp()
+        os.chdir(self.test_folder)
+
+        shutil.copytree(TEST_JSON, 'test-json')
+        self.object_file = os.path.join('test-json', 'User.Accounts.json')
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_folder)
+
+    def _edit_object_file(self, edit):
+        with open(self.object_file) as f:
+            schema = json.load(f)
+        edit(schema)
+
+        # Make sure the modification stamp changes, whatever the file system resolution.
+        stat = os.stat(self.object_file)
+        with open(self.object_file, 'w') as f:
+            json.dump(schema, f)
+        os.utime(self.object_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    def test__json_update(self):
+        """Tests if changed object files are parsed again."""
+
+        source = HLAPIJSONSource('test-json')
+        api = source.load()
+        self.assertEqual(source.update(api), set())
+
+        def edit(schema):
+            schema["paths"]["User.Accounts.{AccountId}.Set"]["summary"] = 'Updates the account.'
+
+        self._edit_object_file(edit)
+
+        self.assertEqual(source.update(api), {'objects', 'response_codes'})
+        self.assertEqual(api.procedure('User.Accounts.{AccountId}', 'Set').description, 'Updates the account.')
+
+    def test__json_unchanged(self):
+        """Tests if files saved without changes are ignored."""
+
+        source = HLAPIJSONSource('test-json')
+        api = source.load()
+        objects = api.objects
+
+        self._edit_object_file(lambda schema: None)
+
+        self.assertEqual(source.update(api), set())
+        self.assertIs(api.objects, objects)
+
+    def test__excel_update(self):
+        """Tests if only the API parts of the changed sheets are linked again."""
+
+        make_workbook('api.xlsx')
+        source = HLAPIExcelSource('api.xlsx')
+        api = source.load()
+
+        self.assertEqual(api.get_version(), '3.5')
+        self.assertEqual([p.name for p in api.objects[0].procedures], ['List'])
+        objects = api.objects
+
+        make_workbook('api.xlsx', version='3.6')
+        stat = os.stat('api.xlsx')
+        os.utime('api.xlsx', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        self.assertEqual(source.update(api), {'versions'})
+        self.assertEqual(api.get_version(), '3.6')
+        self.assertIs(api.objects, objects)
+
+    def test__launcher_watch(self):
+        """Tests if the watch mode builds the outputs before polling."""
+
+        launcher = Launcher('test-json', input_format='json', output_format=['sqlite'])
+        try:
+            launcher.watch(interval=0, cycles=1)
+        finally:
+            launcher.log.stop()
+
+        self.assertTrue(os.path.isfile('specs/generated/sqlite/prpl HL-API (3.5).db'))
+
+
+if __name__ == '__main__':
+    unittest2.main()
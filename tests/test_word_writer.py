@@ -0,0 +1,48 @@
+import os
+import shutil
+import tempfile
+import unittest2
+
+from docx import Document
+
+from prpl.apis.hl.com import Event as HLAPIEvent
+from prpl.apis.hl.com import Procedure as HLAPIProcedure
+from prpl.apis.hl.com import ResponseCode as HLAPIResponseCode
+from prpl.apis.hl.spec.builder import WordWriter as HLAPIWordWriter
+from tests.helpers import make_api, make_field
+
+TEMPLATE = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'specs', 'templates', 'prpl.docx'))
+
+
+class TestWordWriter(unittest2.TestCase):
+    """Tests the 'WordWriter' component."""
+
+    def setUp(self):
+        """Test environment setup."""
+
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Test environment teardown."""
+
+        shutil.rmtree(self.folder)
+
+    def test__build(self):
+        """Tests if the response codes, procedures and events of an API are written."""
+
+        add = HLAPIProcedure('Add', 'Adds an account.', '{"Id": "Admin"}', '{"Header": {"Name": "OK"}}')
+        add.parameters.append(make_field('Id', 'String', True, True, False))
+        api = make_api([add], events=[HLAPIEvent(1, 'ADDED', 'Raised when an account is added.', '{}')],
+                       response_codes=[HLAPIResponseCode('OK', 'Success.', '{"Header": {"Name": "OK"}}', '-')])
+
+        file = os.path.join(self.folder, 'spec.docx')
+        HLAPIWordWriter(api, file, template=TEMPLATE).build()
+
+        rows = [[cell.text for cell in row.cells] for table in Document(file).tables for row in table.rows]
+        self.assertIn(['Name', 'Sample', 'Description'], rows)
+        self.assertIn(['OK', '{"Header": {"Name": "OK"}}', 'Success.'], rows)
+        self.assertIn(['1', 'ADDED', 'Raised when an account is added.', '{}'], rows)
+
+
+if __name__ == '__main__':
+    unittest2.main()